@@ -137,6 +137,8 @@ class ApiFormat(str, Enum):
 
 class CompressionFormat(str, Enum):
     gzip = "gzip"
+    zstd = "zstd"
+    lz4 = "lz4"
     none = "none"
 
 
@@ -203,9 +205,17 @@ class DownloadApp(typer.Typer):
             typer.Option(
                 "--compression",
                 "-z",
-                help="Compression format to use when downloading the raw tables. Supported formats: gzip, none.",
+                help="Compression format to use when downloading the raw tables. Supported formats: gzip, zstd, lz4, none.",
             ),
         ] = CompressionFormat.gzip,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -261,6 +271,7 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -301,6 +312,23 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the assets.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
+        row_group_size: Annotated[
+            int | None,
+            typer.Option(
+                "--row-group-size",
+                help="The number of rows in each row group when downloading in the parquet format. Larger row groups "
+                "compress and read faster, but use more memory. If not provided, each downloaded page is a row group.",
+                min=1,
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -355,6 +383,8 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -444,6 +474,23 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the time series.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
+        row_group_size: Annotated[
+            int | None,
+            typer.Option(
+                "--row-group-size",
+                help="The number of rows in each row group when downloading in the parquet format. Larger row groups "
+                "compress and read faster, but use more memory. If not provided, each downloaded page is a row group.",
+                min=1,
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -496,6 +543,8 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -536,6 +585,23 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the events.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
+        row_group_size: Annotated[
+            int | None,
+            typer.Option(
+                "--row-group-size",
+                help="The number of rows in each row group when downloading in the parquet format. Larger row groups "
+                "compress and read faster, but use more memory. If not provided, each downloaded page is a row group.",
+                min=1,
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -587,6 +653,8 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -637,6 +705,23 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the file metadata.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
+        row_group_size: Annotated[
+            int | None,
+            typer.Option(
+                "--row-group-size",
+                help="The number of rows in each row group when downloading in the parquet format. Larger row groups "
+                "compress and read faster, but use more memory. If not provided, each downloaded page is a row group.",
+                min=1,
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -761,6 +846,8 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -799,6 +886,14 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the assets.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -849,6 +944,7 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -926,6 +1022,23 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the instances.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
+        row_group_size: Annotated[
+            int | None,
+            typer.Option(
+                "--row-group-size",
+                help="The number of rows in each row group when downloading in the parquet format. Larger row groups "
+                "compress and read faster, but use more memory. If not provided, each downloaded page is a row group.",
+                min=1,
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -1071,6 +1184,8 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -1170,6 +1285,15 @@ class DownloadApp(typer.Typer):
                 hidden=not Flags.EXTEND_DOWNLOAD.is_enabled(),
             ),
         ] = ApiFormat.request,
+        row_group_size: Annotated[
+            int | None,
+            typer.Option(
+                "--row-group-size",
+                help="The number of rows in each row group when downloading in the parquet format. Larger row groups "
+                "compress and read faster, but use more memory. If not provided, each downloaded page is a row group.",
+                min=1,
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -1258,6 +1382,7 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression="none",
+                row_group_size=row_group_size,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -1304,6 +1429,14 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the instances.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -1347,6 +1480,7 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -1385,6 +1519,14 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the canvas.",
             ),
         ] = CompressionFormat.none,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -1428,6 +1570,7 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -1496,6 +1639,14 @@ class DownloadApp(typer.Typer):
                 help="Compression format to use when downloading the records.",
             ),
         ] = CompressionFormat.gzip,
+        compression_level: Annotated[
+            int | None,
+            typer.Option(
+                "--compression-level",
+                help="The compression level to use. Higher levels give smaller files, but are slower. If not provided, "
+                "the default level of the compression format is used. Supported levels: gzip 0-9, zstd 1-22, lz4 0-16.",
+            ),
+        ] = None,
         output_dir: Annotated[
             Path,
             typer.Option(
@@ -1600,6 +1751,7 @@ class DownloadApp(typer.Typer):
                 output_dir=output_dir,
                 file_format=f".{file_format.value}",
                 compression=compression.value,
+                compression_level=compression_level,
                 limit=limit if limit != -1 else None,
                 verbose=verbose,
             )
@@ -6,6 +6,7 @@ from rich.console import Console
 from cognite_toolkit._cdf_tk.client.api.charts import ChartsAPI
 from cognite_toolkit._cdf_tk.client.api.location_filters import LocationFiltersAPI
 from cognite_toolkit._cdf_tk.client.http_client import HTTPClient
+from cognite_toolkit._cdf_tk.feature_flags import Flags
 
 from .api.agents import AgentsAPI
 from .api.alerts import AlertsAPI
@@ -28,9 +29,9 @@ from .api.graphql_data_models import GraphQLDataModelsAPI
 from .api.groups import GroupsAPI
 from .api.hosted_extractors import HostedExtractorsAPI
 from .api.infield import InfieldAPI
-from .api.instances import InstancesAPI
+from .api.instances import InstancesAPI, QueryChunkSizes
 from .api.labels import LabelsAPI
-from .api.lookup import LookUpGroup
+from .api.lookup import LookUpCache, LookUpGroup
 from .api.migration import MigrationAPI
 from .api.principals import PrincipalsAPI
 from .api.project import ProjectAPI
@@ -79,7 +80,13 @@ class ToolAPI:
         self.functions = FunctionsAPI(http_client)
         self.groups = GroupsAPI(http_client)
         self.hosted_extractors = HostedExtractorsAPI(http_client)
-        self.instances = InstancesAPI(http_client)
+        chunk_sizes: QueryChunkSizes | None = None
+        if Flags.QUERY_CHUNK_SIZE_CACHE.is_enabled():
+            chunk_sizes = QueryChunkSizes(
+                LookUpCache.default_filepath().with_name("query-chunk-sizes.json"),
+                project_key=f"{http_client.config.base_url}/{http_client.config.project}",
+            )
+        self.instances = InstancesAPI(http_client, chunk_sizes=chunk_sizes)
         self.spaces = SpacesAPI(http_client)
         self.views = ViewsAPI(http_client)
         self.containers = ContainersAPI(http_client)
@@ -142,3 +149,10 @@ class ToolkitClient(CogniteClient):
         """
 
         return cast(ToolkitClientConfig, super().config)
+
+    def close(self) -> None:
+        """Releases the resources held by the client, such as the connection to the on-disk lookup cache.
+
+        The resources are also released when the client is garbage collected.
+        """
+        self.lookup.close()
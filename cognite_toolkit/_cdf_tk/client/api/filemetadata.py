@@ -1,6 +1,6 @@
 import builtins
 import time
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import IO, Any, Literal
 
@@ -272,12 +272,21 @@ class FileMetadataAPI(CDFResourceAPI[FileMetadataResponse]):
         """
         return self._request_item_response(items, method="retrieve", endpoint="/files/unlink-instance-ids")
 
-    def await_file_uploaded(self, items: Sequence[InternalId], timeout_seconds: float) -> tuple[set[InternalId], float]:
+    def await_file_uploaded(
+        self,
+        items: Sequence[InternalId],
+        timeout_seconds: float,
+        on_uploaded: Callable[[set[InternalId]], None] | None = None,
+    ) -> tuple[set[InternalId], float]:
         """Wait for files to be uploaded, polling their status until they are marked as uploaded or a timeout is reached.
 
+        All files are polled together, with one retrieve call per poll.
+
         Args:
             items: Sequence of InternalId identifying the files to upload.
             timeout_seconds: Timeout in seconds.
+            on_uploaded: Called after each poll with the files that were marked as uploaded since the previous poll.
+                This lets the caller start using the files while waiting for the rest.
 
         Returns:
             The identifiers of the files that were not marked as uploaded within the timeout, and the elapsed time in seconds.
@@ -288,7 +297,13 @@ class FileMetadataAPI(CDFResourceAPI[FileMetadataResponse]):
         sleep_time = 1.0  # seconds
         while (elapsed_time := (time.perf_counter() - t0)) < timeout_seconds:
             files = self.retrieve(list(to_check))
-            to_check = {InternalId(id=file.id) for file in files if not file.uploaded}
+            not_uploaded = {InternalId(id=file.id) for file in files if not file.uploaded}
+            if on_uploaded is not None and (uploaded := to_check - not_uploaded):
+                callback_start = time.perf_counter()
+                on_uploaded(uploaded)
+                # The time spent in the callback does not count towards the timeout.
+                t0 += time.perf_counter() - callback_start
+            to_check = not_uploaded
             if not to_check:
                 return set(), elapsed_time
             elapsed_time = time.perf_counter() - t0
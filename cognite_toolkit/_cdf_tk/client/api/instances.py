@@ -1,7 +1,11 @@
 import json
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
 from pathlib import Path
 from typing import Generic, Literal, TypeAlias, TypeVar, overload
@@ -70,6 +74,148 @@ class ReduceLoadException(Exception):
         self.source_exception = source_exception
 
 
+class QueryChunkSizes:
+    """The page sizes learned by adapting to the load on the query and sync endpoints, shared between calls.
+
+    The page size is tracked per endpoint and query shape, that is, the query without cursors, parameters,
+    limits, and the literal values in filters. Thus, a new page stream for a query with the same shape starts at
+    the page size the previous stream settled on, instead of hitting the same timeouts again. Only query shapes
+    that have had their page size reduced are tracked. The page sizes are optionally persisted to a JSON file,
+    keyed by the CDF cluster and project, such that they are reused between Toolkit runs. The file is written by
+    flush(), which is called when a page stream ends, and not on every page. Page sizes expire after ttl_seconds,
+    and only the max_entries most recently updated are kept.
+
+    Args:
+        filepath: The path to the JSON file to persist the page sizes to. If None, they are only kept in memory.
+        project_key: Identifies the CDF cluster and project the page sizes belong to.
+        ttl_seconds: How long a learned page size is used after it was last updated.
+        max_entries: The maximum number of query shapes to keep page sizes for.
+    """
+
+    def __init__(
+        self,
+        filepath: Path | None = None,
+        project_key: str = "",
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+        max_entries: int = 100,
+    ) -> None:
+        self.filepath = filepath
+        self.project_key = project_key
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # The current chunk size, the smallest chunk size that has failed, and when they were updated, by query key.
+        self._chunk_sizes: dict[str, tuple[int, int, float]] = {}
+        self._has_changes = False
+        if filepath is not None and filepath.exists():
+            try:
+                loaded = json.loads(filepath.read_text(encoding="utf-8"))
+                chunk_sizes = {
+                    key: (int(value[0]), int(value[1]), float(value[2])) for key, value in loaded.items()
+                }
+            except (OSError, ValueError, TypeError, IndexError, AttributeError) as e:
+                # A corrupt cache only means we start from the maximum page size.
+                log.debug(f"Ignoring unreadable query chunk size cache {filepath}: {e}")
+            else:
+                self._chunk_sizes = {key: value for key, value in chunk_sizes.items() if not self._is_expired(value)}
+
+    def create_key(self, endpoint: QueryEndpoint, query: QueryRequest) -> str:
+        """Creates the key of the query shape, ignoring cursors, parameters, limits, and literal filter values."""
+        dumped = query.dump(endpoint=endpoint)
+        for field_name in ("cursors", "parameters", "debug"):
+            dumped.pop(field_name, None)
+        for expression in dumped.get("with", {}).values():
+            expression.pop("limit", None)
+            for table_expression in (expression.get("nodes"), expression.get("edges")):
+                if not isinstance(table_expression, dict):
+                    continue
+                for filter_name in ("filter", "nodeFilter", "terminationFilter"):
+                    if filter_name in table_expression:
+                        table_expression[filter_name] = self._filter_shape(table_expression[filter_name])
+        for select in dumped.get("select", {}).values():
+            select.pop("limit", None)
+        return f"{self.project_key}|{endpoint}|{json.dumps(dumped, sort_keys=True)}"
+
+    @classmethod
+    def _filter_shape(cls, filter_: JsonValue) -> JsonValue:
+        """Replaces the literal values in a filter, such that filters on the same properties have the same shape."""
+        if not isinstance(filter_, dict):
+            return "?"
+        shape: dict[str, JsonValue] = {}
+        for operator, body in filter_.items():
+            if operator in ("and", "or") and isinstance(body, list):
+                shape[operator] = [cls._filter_shape(item) for item in body]
+            elif operator == "not":
+                shape[operator] = cls._filter_shape(body)
+            elif isinstance(body, dict):
+                parameters: dict[str, JsonValue] = {}
+                for name, value in body.items():
+                    if name == "filter":
+                        parameters[name] = cls._filter_shape(value)
+                    elif name == "scope" or name.lower().endswith("property"):
+                        # The properties filtered on are part of the shape.
+                        parameters[name] = value
+                    else:
+                        parameters[name] = "?"
+                shape[operator] = parameters
+            else:
+                # For example, hasData with the views to filter on.
+                shape[operator] = "?"
+        return shape
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._chunk_sizes and not self._is_expired(self._chunk_sizes[key])
+
+    def get(self, key: str, max_chunk_size: int) -> tuple[int, int]:
+        """Returns the current chunk size, capped at max_chunk_size, and the smallest failed chunk size."""
+        with self._lock:
+            entry = self._chunk_sizes.get(key)
+            if entry is None or self._is_expired(entry):
+                return max_chunk_size, max_chunk_size + 1
+            current_chunk_size, min_failed_chunk_size, _ = entry
+        return max(min(current_chunk_size, max_chunk_size), 1), min_failed_chunk_size
+
+    def set(self, key: str, current_chunk_size: int, min_failed_chunk_size: int) -> None:
+        """Stores the chunk sizes of the query shape. They are persisted by the next call to flush()."""
+        with self._lock:
+            entry = self._chunk_sizes.get(key)
+            if entry is not None and entry[:2] == (current_chunk_size, min_failed_chunk_size):
+                return
+            self._chunk_sizes[key] = (current_chunk_size, min_failed_chunk_size, time.time())
+            self._has_changes = True
+
+    def flush(self) -> None:
+        """Persists the chunk sizes, if any changed since the last flush."""
+        with self._lock:
+            if self.filepath is None or not self._has_changes:
+                return
+            self._write()
+            self._has_changes = False
+
+    def _is_expired(self, entry: tuple[int, int, float]) -> bool:
+        return not 0 <= time.time() - entry[2] <= self.ttl_seconds
+
+    def _write(self) -> None:
+        if self.filepath is None:
+            return
+        # Drop the expired and least recently updated entries, such that the file does not grow without bound.
+        by_updated = sorted(
+            ((key, value) for key, value in self._chunk_sizes.items() if not self._is_expired(value)),
+            key=lambda item: item[1][2],
+            reverse=True,
+        )
+        self._chunk_sizes = dict(by_updated[: self.max_entries])
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and replace, such that concurrent runs never read a partial file.
+            tmp_path = self.filepath.with_name(f"{self.filepath.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({key: list(value) for key, value in self._chunk_sizes.items()}))
+            tmp_path.replace(self.filepath)
+        except OSError as e:
+            log.debug(f"Failed to write query chunk size cache {self.filepath}: {e}")
+
+
 class InstancesAPI(CDFResourceAPI[InstanceResponse]):
     """Instances API
 
@@ -78,12 +224,23 @@ class InstancesAPI(CDFResourceAPI[InstanceResponse]):
         consecutive_success_count_increase (int): Number of consecutive successful requests before
             trying to increase the chunk size again. This is used to find a good chunk size when using the
             /instances/query and /instances/sync endpoints.
+        chunk_sizes (QueryChunkSizes | None): The chunk sizes learned for the /instances/query and
+            /instances/sync endpoints, shared between calls. If None, they are kept in memory for the
+            lifetime of this API.
 
     """
 
-    def __init__(self, http_client: HTTPClient, consecutive_success_count_increase: int = 100) -> None:
+    _MAX_SUB_SELECTION_WORKERS = 4
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        consecutive_success_count_increase: int = 100,
+        chunk_sizes: QueryChunkSizes | None = None,
+    ) -> None:
         super().__init__(http_client=http_client, method_endpoint_map=METHOD_MAP)
         self._consecutive_success_count_increase = consecutive_success_count_increase
+        self._chunk_sizes = chunk_sizes or QueryChunkSizes()
 
     def _validate_page_response(
         self, response: SuccessResponse | ItemsSuccessResponse
@@ -374,60 +531,77 @@ class InstancesAPI(CDFResourceAPI[InstanceResponse]):
         response_cls = QueryResponseTyped if type_results else QueryResponseUntyped
 
         max_chunk_size = query.with_[query.root].limit or endpoint_prop.item_limit
-        current_chunk_size = max_chunk_size
-        min_failed_chunk_size = max_chunk_size + 1
+        # Start from the chunk size previous calls with the same query shape settled on.
+        chunk_size_key = self._chunk_sizes.create_key(endpoint, query)
+        current_chunk_size, min_failed_chunk_size = self._chunk_sizes.get(chunk_size_key, max_chunk_size)
+        # Only query shapes that have had their page size reduced are stored, such that queries that never
+        # time out do not fill up the chunk sizes.
+        is_tracked = chunk_size_key in self._chunk_sizes
+        if current_chunk_size != max_chunk_size:
+            query.with_[query.root].limit = current_chunk_size if limit is None else min(current_chunk_size, limit)
         success_request_count = 0
         total = 0
-        while True:
-            try:
-                batch = self._query(query, response_cls, endpoint_prop, exhaust_sub_selections, endpoint_name=endpoint)
-            except ReduceLoadException as e:
-                if current_chunk_size <= 1:
-                    debug_file: Path | None = None
-                    if endpoint == "sync":
-                        debug_file = self._run_and_log_debug_query(query, endpoint_prop, endpoint, debug_writer)
-                    source = e.source_exception
-                    if isinstance(source, ToolkitAPIError) and debug_file is not None:
-                        source = ToolkitAPIError(
-                            f"{source.message} | Debug info (query plan and notices) was written to {debug_file}.",
-                            missing=source.missing,
-                            duplicated=source.duplicated,
-                            code=source.code,
-                            request=source.request,
-                            debug_file=debug_file,
-                            x_request_id=source.x_request_id,
-                        )
-                    raise source
-                min_failed_chunk_size = min(current_chunk_size, min_failed_chunk_size)
-                success_request_count = 0
-                current_chunk_size = current_chunk_size // 2
+        try:
+            while True:
+                try:
+                    batch = self._query(
+                        query, response_cls, endpoint_prop, exhaust_sub_selections, endpoint_name=endpoint
+                    )
+                except ReduceLoadException as e:
+                    if current_chunk_size <= 1:
+                        debug_file: Path | None = None
+                        if endpoint == "sync":
+                            debug_file = self._run_and_log_debug_query(query, endpoint_prop, endpoint, debug_writer)
+                        source = e.source_exception
+                        if isinstance(source, ToolkitAPIError) and debug_file is not None:
+                            source = ToolkitAPIError(
+                                f"{source.message} | Debug info (query plan and notices) was written to {debug_file}.",
+                                missing=source.missing,
+                                duplicated=source.duplicated,
+                                code=source.code,
+                                request=source.request,
+                                debug_file=debug_file,
+                                x_request_id=source.x_request_id,
+                            )
+                        raise source
+                    min_failed_chunk_size = min(current_chunk_size, min_failed_chunk_size)
+                    success_request_count = 0
+                    current_chunk_size = current_chunk_size // 2
+                    is_tracked = True
+                    self._chunk_sizes.set(chunk_size_key, current_chunk_size, min_failed_chunk_size)
+                    page_limit = current_chunk_size if limit is None else min(current_chunk_size, max(limit - total, 0))
+                    query.with_[query.root].limit = page_limit
+                    continue
+
+                success_request_count += 1
+                if query.root in batch.items:
+                    total += len(batch.items[query.root])
+                else:
+                    total += sum(len(batch.items[key]) for key in query.select if key in batch.items)
+                next_cursor = batch.root_cursor
+                yield batch
+                if next_cursor is None or not batch or (limit is not None and total >= limit):
+                    break
+
+                if current_chunk_size < min_failed_chunk_size:
+                    # Binary search towards optimal chunk size.
+                    current_chunk_size = current_chunk_size + (min_failed_chunk_size - current_chunk_size) // 2
+                elif success_request_count > self._consecutive_success_count_increase:
+                    # If we had a lot of successful attempts, try increasing the chunk size again to avoid getting
+                    # stuck at a low limit.
+                    success_request_count = 0
+                    current_chunk_size = min(current_chunk_size * 2, max_chunk_size)
+                    min_failed_chunk_size = max(current_chunk_size * 2, max_chunk_size)
+                if is_tracked:
+                    self._chunk_sizes.set(chunk_size_key, current_chunk_size, min_failed_chunk_size)
+
                 page_limit = current_chunk_size if limit is None else min(current_chunk_size, max(limit - total, 0))
                 query.with_[query.root].limit = page_limit
-                continue
-
-            success_request_count += 1
-            if query.root in batch.items:
-                total += len(batch.items[query.root])
-            else:
-                total += sum(len(batch.items[key]) for key in query.select if key in batch.items)
-            next_cursor = batch.root_cursor
-            yield batch
-            if next_cursor is None or not batch or (limit is not None and total >= limit):
-                break
-
-            if current_chunk_size < min_failed_chunk_size:
-                # Binary search towards optimal chunk size.
-                current_chunk_size = current_chunk_size + (min_failed_chunk_size - current_chunk_size) // 2
-            elif success_request_count > self._consecutive_success_count_increase:
-                # If we had a lot of successful attempts, try increasing the chunk size again to avoid getting
-                # stuck at a low limit.
-                success_request_count = 0
-                current_chunk_size = min(current_chunk_size * 2, max_chunk_size)
-                min_failed_chunk_size = max(current_chunk_size * 2, max_chunk_size)
-
-            page_limit = current_chunk_size if limit is None else min(current_chunk_size, max(limit - total, 0))
-            query.with_[query.root].limit = page_limit
-            query.cursors = {query.root: next_cursor}
+                query.cursors = {query.root: next_cursor}
+        finally:
+            # The chunk sizes change on most pages while searching for the best one, so they are only
+            # persisted when the stream ends.
+            self._chunk_sizes.flush()
 
     def _query(
         self,
@@ -463,10 +637,51 @@ class InstancesAPI(CDFResourceAPI[InstanceResponse]):
 
             if not next_cursors or not response:
                 return first
+            root_cursor = (query.cursors or {}).get(query.root)
+            if len(next_cursors) > 1:
+                # The sub-selections page independently of each other, so they are exhausted concurrently.
+                self._exhaust_sub_selections_concurrently(
+                    query, root_cursor, next_cursors, first, response_cls, endpoint, endpoint_name
+                )
+                return first
             # Keep the root cursor to iterate over all subitems.
-            next_cursors[query.root] = (query.cursors or {}).get(query.root)
+            next_cursors[query.root] = root_cursor
             query = query.model_copy(update={"cursors": next_cursors})
 
+    def _exhaust_sub_selections_concurrently(
+        self,
+        query: QueryRequest,
+        root_cursor: str | None,
+        cursor_by_select_id: dict[str, str | None],
+        first: _T_QueryResponse,
+        response_cls: type[_T_QueryResponse],
+        endpoint: Endpoint,
+        endpoint_name: QueryEndpoint,
+    ) -> None:
+        def exhaust(select_id: str, cursor: str | None) -> list:
+            items: list = []
+            sub_selection_limit = query.with_[select_id].limit
+            while cursor is not None:
+                sub_query = query.model_copy(update={"cursors": {query.root: root_cursor, select_id: cursor}})
+                response = self._make_query(endpoint, sub_query, response_cls, endpoint_name)
+                page = response.items.get(select_id, [])
+                items.extend(page)
+                if not page or (sub_selection_limit is not None and len(page) < sub_selection_limit):
+                    break
+                cursor = response.next_cursor.get(select_id)
+            return items
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._MAX_SUB_SELECTION_WORKERS, len(cursor_by_select_id))
+        ) as executor:
+            items_by_select_id = dict(
+                zip(cursor_by_select_id.keys(), executor.map(exhaust, *zip(*cursor_by_select_id.items())))
+            )
+        for select_id, items in items_by_select_id.items():
+            if select_id in first.items:
+                # MyPy does not like the mix of type and untyped query responses.
+                first.items[select_id].extend(items)  # type: ignore[arg-type]
+
     def _make_query(
         self,
         endpoint: Endpoint,
@@ -1,6 +1,13 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, overload
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
 
 from cognite.client.data_classes.capabilities import (
     AssetsAcl,
@@ -19,7 +26,10 @@ from cognite.client.utils.useful_types import SequenceNotStr
 from rich.console import Console
 
 from cognite_toolkit._cdf_tk.client.api_client import ToolkitAPI
+from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, InternalId, InternalOrExternalId
 from cognite_toolkit._cdf_tk.constants import DRY_RUN_ID
+from cognite_toolkit._cdf_tk.exceptions import ToolkitValueError
+from cognite_toolkit._cdf_tk.feature_flags import Flags
 from cognite_toolkit._cdf_tk.tk_warnings import MediumSeverityWarning
 from cognite_toolkit._cdf_tk.utils import humanize_collection
 
@@ -28,14 +38,136 @@ if TYPE_CHECKING:
     from cognite_toolkit._cdf_tk.client.config import ToolkitClientConfig
 
 
+class LookUpCache:
+    """An on-disk cache of external ID to internal ID mappings that is reused between Toolkit runs.
+
+    The mappings are stored in a SQLite database, keyed by the CDF cluster and project, and the resource type.
+    SQLite handles concurrent access from multiple processes, and a lock protects the connection
+    when it is shared between threads. Only existing resources are cached, and entries expire after the
+    time to live, such that resources that are deleted and recreated outside Toolkit are picked up.
+    The connection is closed by close(), or at the latest when the cache is garbage collected.
+
+    Args:
+        filepath: The path to the SQLite database file.
+        project_key: Identifies the CDF cluster and project the mappings belong to.
+        ttl_seconds: How long a mapping is valid, in seconds.
+    """
+
+    default_ttl_seconds: float = 24 * 60 * 60
+
+    def __init__(self, filepath: Path, project_key: str, ttl_seconds: float = default_ttl_seconds) -> None:
+        self.filepath = filepath
+        self.project_key = project_key
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(filepath, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS lookup ("
+                "project TEXT NOT NULL, resource_type TEXT NOT NULL, external_id TEXT NOT NULL, "
+                "id INTEGER NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (project, resource_type, external_id))"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS lookup_by_id ON lookup (project, resource_type, id)")
+        # Closes the connection when the cache, for example, with the client that owns it, is garbage collected.
+        self._close_connection = weakref.finalize(self, self._connection.close)
+
+    @classmethod
+    def default_filepath(cls) -> Path:
+        """The location of the cache in the user's cache directory."""
+        if sys.platform == "win32":
+            cache_dir = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        elif sys.platform == "darwin":
+            cache_dir = Path.home() / "Library" / "Caches"
+        else:
+            cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        return cache_dir / "cognite-toolkit" / "lookup-cache.sqlite"
+
+    def get_ids(self, resource_type: str, external_ids: Sequence[str]) -> dict[str, int]:
+        """Get the cached internal IDs of the given external IDs. External IDs that are not cached are left out."""
+        rows = self._select(resource_type, "external_id", external_ids)
+        return {external_id: id_ for external_id, id_ in rows}
+
+    def get_external_ids(self, resource_type: str, ids: Sequence[int]) -> dict[int, str]:
+        """Get the cached external IDs of the given internal IDs. Internal IDs that are not cached are left out."""
+        rows = self._select(resource_type, "id", ids)
+        return {id_: external_id for external_id, id_ in rows}
+
+    def set(self, resource_type: str, ids_by_external_id: Mapping[str, int]) -> None:
+        """Store the given mappings, replacing any existing ones."""
+        if not ids_by_external_id:
+            return
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO lookup (project, resource_type, external_id, id, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self.project_key, resource_type, external_id, id_, now)
+                    for external_id, id_ in ids_by_external_id.items()
+                ],
+            )
+
+    def invalidate(self, resource_type: str, external_ids: Sequence[str] = (), ids: Sequence[int] = ()) -> None:
+        """Remove the mappings of the given external IDs and internal IDs, for example, after they are deleted."""
+        with self._lock, self._connection:
+            for column, values in [("external_id", external_ids), ("id", ids)]:
+                self._connection.executemany(
+                    f"DELETE FROM lookup WHERE project = ? AND resource_type = ? AND {column} = ?",
+                    [(self.project_key, resource_type, value) for value in values],
+                )
+
+    def clear(self) -> None:
+        """Remove all cached mappings of the project."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM lookup WHERE project = ?", (self.project_key,))
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database. The cache cannot be used after this."""
+        with self._lock:
+            self._close_connection()
+
+    @property
+    def is_closed(self) -> bool:
+        return not self._close_connection.alive
+
+    def _select(self, resource_type: str, column: str, values: Sequence[Any]) -> list[tuple[str, int]]:
+        if not values:
+            return []
+        min_updated_at = time.time() - self.ttl_seconds
+        rows: list[tuple[str, int]] = []
+        with self._lock:
+            # Stay below SQLite's limit on the number of variables in a query.
+            for start in range(0, len(values), 500):
+                chunk = values[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self._connection.execute(
+                        f"SELECT external_id, id FROM lookup WHERE project = ? AND resource_type = ? "
+                        f"AND updated_at >= ? AND {column} IN ({placeholders})",
+                        (self.project_key, resource_type, min_updated_at, *chunk),
+                    ).fetchall()
+                )
+        return rows
+
+
 class LookUpAPI(ToolkitAPI, ABC):
     dry_run_id: int = DRY_RUN_ID
 
-    def __init__(self, config: "ToolkitClientConfig", toolkit_client: "ToolkitClient", console: Console) -> None:
+    def __init__(
+        self,
+        config: "ToolkitClientConfig",
+        toolkit_client: "ToolkitClient",
+        console: Console,
+        persistent_cache: LookUpCache | None = None,
+    ) -> None:
         super().__init__(config, toolkit_client)
         self._console = console
         self._cache: dict[str, int | None] = {}
         self._reverse_cache: dict[int, str | None] = {}
+        self._persistent_cache = persistent_cache
+        # Lookups can be done from concurrent workers.
+        self._lock = threading.RLock()
 
     @property
     def resource_name(self) -> str:
@@ -64,23 +196,31 @@ class LookUpAPI(ToolkitAPI, ABC):
             or a list of internal IDs if a sequence of external IDs is provided.
         """
         ids = [external_id] if isinstance(external_id, str) else external_id
-        need_lookup = [id for id in ids if id not in self._cache]
-        if allow_empty and "" in need_lookup:
-            # Note we do not want to put empty string in the cache. It is a special case that
-            # as of 01/02/2025 only applies to LocationFilters
-            need_lookup.remove("")
-        if need_lookup:
-            self._do_lookup_external_ids(need_lookup, is_dry_run)
-
-        if isinstance(external_id, str):
-            return self._get_id_from_cache(external_id, is_dry_run, allow_empty)
-        else:
-            internal_ids = (
-                self._get_id_from_cache(external_id, is_dry_run, allow_empty) for external_id in external_id
-            )
-            return [id_ for id_ in internal_ids if id_ is not None]
+        with self._lock:
+            need_lookup = [id for id in ids if id not in self._cache]
+            if allow_empty and "" in need_lookup:
+                # Note we do not want to put empty string in the cache. It is a special case that
+                # as of 01/02/2025 only applies to LocationFilters
+                need_lookup.remove("")
+            if need_lookup:
+                self._do_lookup_external_ids(need_lookup, is_dry_run)
+
+            if isinstance(external_id, str):
+                return self._get_id_from_cache(external_id, is_dry_run, allow_empty)
+            else:
+                internal_ids = (
+                    self._get_id_from_cache(external_id, is_dry_run, allow_empty) for external_id in external_id
+                )
+                return [id_ for id_ in internal_ids if id_ is not None]
 
     def _do_lookup_external_ids(self, external_ids: list[str], is_dry_run: bool) -> None:
+        if self._persistent_cache is not None:
+            cached = self._persistent_cache.get_ids(self.resource_name, external_ids)
+            self._cache.update(cached)
+            self._reverse_cache.update({v: k for k, v in cached.items()})
+            external_ids = [ext_id for ext_id in external_ids if ext_id not in cached]
+            if not external_ids:
+                return
         try:
             ids_by_external_id = self._id(external_ids)
         except CogniteAPIError as e:
@@ -95,6 +235,8 @@ class LookUpAPI(ToolkitAPI, ABC):
             raise
         self._cache.update(ids_by_external_id)
         self._reverse_cache.update({v: k for k, v in ids_by_external_id.items()})
+        if self._persistent_cache is not None:
+            self._persistent_cache.set(self.resource_name, ids_by_external_id)
         missing_external_ids = [ext_id for ext_id in external_ids if ext_id not in ids_by_external_id]
         if missing_external_ids and not is_dry_run:
             plural = "s" if len(missing_external_ids) > 1 else ""
@@ -133,17 +275,25 @@ class LookUpAPI(ToolkitAPI, ABC):
 
         """
         ids = [id] if isinstance(id, int) else id
-        need_lookup = [id_ for id_ in ids if id_ not in self._reverse_cache if id_ != 0]
-        if need_lookup:
-            self._do_lookup_internal_ids(need_lookup)
+        with self._lock:
+            need_lookup = [id_ for id_ in ids if id_ not in self._reverse_cache if id_ != 0]
+            if need_lookup:
+                self._do_lookup_internal_ids(need_lookup)
 
-        if isinstance(id, int):
-            return self._get_external_id_from_cache(id)
-        else:
-            external_ids = (self._get_external_id_from_cache(id_) for id_ in ids)
-            return [id_ for id_ in external_ids if id_ is not None]
+            if isinstance(id, int):
+                return self._get_external_id_from_cache(id)
+            else:
+                external_ids = (self._get_external_id_from_cache(id_) for id_ in ids)
+                return [id_ for id_ in external_ids if id_ is not None]
 
     def _do_lookup_internal_ids(self, ids: list[int]) -> None:
+        if self._persistent_cache is not None:
+            cached = self._persistent_cache.get_external_ids(self.resource_name, ids)
+            self._reverse_cache.update(cached)
+            self._cache.update({v: k for k, v in cached.items()})
+            ids = [id_ for id_ in ids if id_ not in cached]
+            if not ids:
+                return None
         try:
             found_by_id = self._external_id(ids)
         except CogniteAPIError as e:
@@ -158,6 +308,8 @@ class LookUpAPI(ToolkitAPI, ABC):
             raise
         self._reverse_cache.update(found_by_id)
         self._cache.update({v: k for k, v in found_by_id.items()})
+        if self._persistent_cache is not None:
+            self._persistent_cache.set(self.resource_name, {v: k for k, v in found_by_id.items()})
         missing_ids = [id for id in ids if id not in found_by_id]
         if not missing_ids:
             return None
@@ -177,6 +329,45 @@ class LookUpAPI(ToolkitAPI, ABC):
             return ""
         return self._reverse_cache.get(id)
 
+    def invalidate(self, external_id: SequenceNotStr[str] = (), id: Sequence[int] = ()) -> None:
+        """Remove the given external IDs and internal IDs from the cache, for example, after they are deleted.
+
+        Args:
+            external_id: The external IDs to remove.
+            id: The internal IDs to remove.
+        """
+        with self._lock:
+            for ext_id in external_id:
+                if (cached_id := self._cache.pop(ext_id, None)) is not None:
+                    self._reverse_cache.pop(cached_id, None)
+            for id_ in id:
+                if (cached_external_id := self._reverse_cache.pop(id_, None)) is not None:
+                    self._cache.pop(cached_external_id, None)
+            if self._persistent_cache is not None:
+                self._persistent_cache.invalidate(self.resource_name, list(external_id), list(id))
+
+    def invalidate_identifiers(self, identifiers: Sequence[InternalOrExternalId]) -> None:
+        """Remove the given identifiers from the cache, for example, after the resources have been deleted."""
+        self.invalidate(
+            external_id=[identifier.external_id for identifier in identifiers if isinstance(identifier, ExternalId)],
+            id=[identifier.id for identifier in identifiers if isinstance(identifier, InternalId)],
+        )
+
+    def prefetch(self) -> None:
+        """Look up all resources of this type in one paginated sweep.
+
+        This is only supported for resource types that typically have few resources, such as data sets.
+        """
+        ids_by_external_id = self._list_all()
+        with self._lock:
+            self._cache.update(ids_by_external_id)
+            self._reverse_cache.update({v: k for k, v in ids_by_external_id.items()})
+            if self._persistent_cache is not None:
+                self._persistent_cache.set(self.resource_name, ids_by_external_id)
+
+    def _list_all(self) -> dict[str, int]:
+        raise ToolkitValueError(f"Prefetching is not supported for {self.resource_name}.")
+
     @abstractmethod
     def _id(self, external_id: SequenceNotStr[str]) -> dict[str, int]:
         raise NotImplementedError
@@ -207,6 +398,13 @@ class DataSetLookUpAPI(LookUpAPI):
             if data_set.external_id and data_set.id
         }
 
+    def _list_all(self) -> dict[str, int]:
+        return {
+            data_set.external_id: data_set.id
+            for data_set in self._toolkit_client.data_sets.list(limit=-1)
+            if data_set.external_id and data_set.id
+        }
+
     def _read_acl(self) -> Capability:
         return DataSetsAcl(
             [DataSetsAcl.Action.Read],
@@ -325,6 +523,13 @@ class ExtractionPipelineLookUpAPI(LookUpAPI):
             if pipeline.external_id and pipeline.id
         }
 
+    def _list_all(self) -> dict[str, int]:
+        return {
+            pipeline.external_id: pipeline.id
+            for pipeline in self._toolkit_client.extraction_pipelines.list(limit=-1)
+            if pipeline.external_id and pipeline.id
+        }
+
     def _read_acl(self) -> Capability:
         return ExtractionPipelinesAcl(
             [ExtractionPipelinesAcl.Action.Read],
@@ -349,6 +554,13 @@ class FunctionLookUpAPI(LookUpAPI):
             if function.external_id and function.id
         }
 
+    def _list_all(self) -> dict[str, int]:
+        return {
+            function.external_id: function.id
+            for function in self._toolkit_client.functions.list(limit=-1)
+            if function.external_id and function.id
+        }
+
     def _read_acl(self) -> Capability:
         return FunctionsAcl(
             [FunctionsAcl.Action.Read],
@@ -357,14 +569,26 @@ class FunctionLookUpAPI(LookUpAPI):
 
 
 class AllLookUpAPI(LookUpAPI, ABC):
-    def __init__(self, config: "ToolkitClientConfig", toolkit_client: "ToolkitClient", console: Console) -> None:
-        super().__init__(config, toolkit_client, console)
+    def __init__(
+        self,
+        config: "ToolkitClientConfig",
+        toolkit_client: "ToolkitClient",
+        console: Console,
+        persistent_cache: LookUpCache | None = None,
+    ) -> None:
+        super().__init__(config, toolkit_client, console, persistent_cache)
         self._has_looked_up = False
 
     @abstractmethod
     def _lookup(self) -> None:
         raise NotImplementedError
 
+    def _list_all(self) -> dict[str, int]:
+        with self._lock:
+            self._lookup()
+            self._has_looked_up = True
+            return {k: v for k, v in self._cache.items() if v is not None}
+
     def _id(self, external_id: SequenceNotStr[str]) -> dict[str, int]:
         if not self._has_looked_up:
             self._lookup()
@@ -378,6 +602,12 @@ class AllLookUpAPI(LookUpAPI, ABC):
         found_pairs = ((id_, self._reverse_cache[id_]) for id_ in id if id_ in self._reverse_cache)
         return {k: v for k, v in found_pairs if v is not None}
 
+    def invalidate(self, external_id: SequenceNotStr[str] = (), id: Sequence[int] = ()) -> None:
+        super().invalidate(external_id, id)
+        with self._lock:
+            # The next lookup lists all resources again, such that a recreated resource is found.
+            self._has_looked_up = False
+
 
 class SecurityCategoriesLookUpAPI(AllLookUpAPI):
     def _lookup(self) -> None:
@@ -418,12 +648,32 @@ class LocationFiltersLookUpAPI(AllLookUpAPI):
 class LookUpGroup(ToolkitAPI):
     def __init__(self, config: "ToolkitClientConfig", toolkit_client: "ToolkitClient", console: Console) -> None:
         super().__init__(config, toolkit_client)
-        self.data_sets = DataSetLookUpAPI(config, toolkit_client, console)
-        self.assets = AssetLookUpAPI(config, toolkit_client, console)
-        self.time_series = TimeSeriesLookUpAPI(config, toolkit_client, console)
-        self.files = FileMetadataLookUpAPI(config, toolkit_client, console)
-        self.events = EventLookUpAPI(config, toolkit_client, console)
-        self.security_categories = SecurityCategoriesLookUpAPI(config, toolkit_client, console)
-        self.location_filters = LocationFiltersLookUpAPI(config, toolkit_client, console)
-        self.extraction_pipelines = ExtractionPipelineLookUpAPI(config, toolkit_client, console)
-        self.functions = FunctionLookUpAPI(config, toolkit_client, console)
+        cache: LookUpCache | None = None
+        if Flags.LOOKUP_CACHE.is_enabled():
+            cache = LookUpCache(LookUpCache.default_filepath(), project_key=f"{config.base_url}/{config.project}")
+        self._persistent_cache = cache
+        self.data_sets = DataSetLookUpAPI(config, toolkit_client, console, cache)
+        self.assets = AssetLookUpAPI(config, toolkit_client, console, cache)
+        self.time_series = TimeSeriesLookUpAPI(config, toolkit_client, console, cache)
+        self.files = FileMetadataLookUpAPI(config, toolkit_client, console, cache)
+        self.events = EventLookUpAPI(config, toolkit_client, console, cache)
+        self.security_categories = SecurityCategoriesLookUpAPI(config, toolkit_client, console, cache)
+        self.location_filters = LocationFiltersLookUpAPI(config, toolkit_client, console, cache)
+        self.extraction_pipelines = ExtractionPipelineLookUpAPI(config, toolkit_client, console, cache)
+        self.functions = FunctionLookUpAPI(config, toolkit_client, console, cache)
+
+    def prefetch(self, resource_type: str) -> None:
+        """Look up all resources of the given type in one paginated sweep, instead of one lookup at a time.
+
+        Args:
+            resource_type: The lookup to prefetch, for example, 'data_sets' or 'security_categories'.
+        """
+        lookup = getattr(self, resource_type, None)
+        if not isinstance(lookup, LookUpAPI):
+            raise ToolkitValueError(f"Unknown lookup resource type: {resource_type!r}")
+        lookup.prefetch()
+
+    def close(self) -> None:
+        """Close the on-disk cache, if it is used."""
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
@@ -9,6 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field, JsonValue, TypeAdapter, model
 from pydantic.alias_generators import to_camel
 
 from cognite_toolkit._cdf_tk.client.http_client._exception import ToolkitAPIError
+from cognite_toolkit._cdf_tk.utils import fast_json
 from cognite_toolkit._cdf_tk.utils.useful_types import PrimitiveType
 
 if TYPE_CHECKING:
@@ -82,6 +83,11 @@ class SuccessResponse(HTTPResult):
     @property
     def body_json(self) -> dict[str, Any]:
         """Parse the response body as JSON."""
+        if fast_json.HAS_ORJSON:
+            body = fast_json.loads(self.body)
+            if isinstance(body, dict):
+                return body
+        # Raises a validation error if the body is not a JSON object.
         return TypeAdapter(dict[str, JsonValue]).validate_json(self.body)
 
 
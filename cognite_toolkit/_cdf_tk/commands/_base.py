@@ -1,20 +1,26 @@
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from cognite.client.exceptions import CogniteAPIError
 from rich import print
 from rich.console import Console
 
 from cognite_toolkit._cdf_tk.cdf_toml import CDFToml
 from cognite_toolkit._cdf_tk.client import ToolkitClient
+from cognite_toolkit._cdf_tk.client.http_client import ToolkitAPIError
 from cognite_toolkit._cdf_tk.data_classes import CommandTracking
+from cognite_toolkit._cdf_tk.feature_flags import Flags
 from cognite_toolkit._cdf_tk.tk_warnings import (
     ToolkitWarning,
     WarningList,
 )
 from cognite_toolkit._cdf_tk.tracker import Tracker
 
+if TYPE_CHECKING:
+    from cognite_toolkit._cdf_tk.resource_ios import ResourceIO
+
 CDF_TOML = CDFToml.load(Path.cwd())
 
 
@@ -70,6 +76,23 @@ class ToolkitCommand:
         if not self.silent:
             print(f"{prefix}{message}")
 
+    @staticmethod
+    def _prefetch_lookups(client: ToolkitClient, io_classes: Iterable[type["ResourceIO"]]) -> None:
+        """Prefetch the lookups the given resource IOs use, such as data sets, when the lookup cache is enabled.
+
+        The prefetched IDs are stored in the on-disk lookup cache, such that both this and the following runs
+        avoid one lookup request per external ID. If the prefetch fails, for example, due to missing access,
+        the IDs are looked up one at a time as before.
+        """
+        if not Flags.LOOKUP_CACHE.is_enabled():
+            return
+        resource_types = {lookup for io_cls in io_classes for lookup in io_cls.prefetch_lookups}
+        for resource_type in sorted(resource_types):
+            try:
+                client.lookup.prefetch(resource_type)
+            except (CogniteAPIError, ToolkitAPIError):
+                continue
+
 
 def _parse_sys_args(known_commands: frozenset[str]) -> list[str]:
     return [arg for arg in sys.argv[1:] if arg in known_commands]
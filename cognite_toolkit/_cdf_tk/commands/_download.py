@@ -11,6 +11,7 @@ from cognite_toolkit._cdf_tk.client import ToolkitClient
 from cognite_toolkit._cdf_tk.constants import DATA_MANIFEST_STEM, DATA_RESOURCE_DIR
 from cognite_toolkit._cdf_tk.data_classes._tracking_info import DataTracking
 from cognite_toolkit._cdf_tk.dataio import (
+    ColumnarTableDataIO,
     ConfigurableDataIO,
     DataIO,
     DataItem,
@@ -25,6 +26,7 @@ from cognite_toolkit._cdf_tk.protocols import T_ResourceResponse
 from cognite_toolkit._cdf_tk.utils.file import create_logfile_stem, safe_write, sanitize_filename, yaml_safe_dump
 from cognite_toolkit._cdf_tk.utils.fileio import (
     TABLE_WRITE_CLS_BY_FORMAT,
+    ColumnBatch,
     Compression,
     FileWriter,
     MultiFileReader,
@@ -95,6 +97,8 @@ class DownloadCommand(ToolkitCommand):
         file_format: str,
         compression: str,
         limit: int | None = 100_000,
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
     ) -> None:
         """Downloads data from CDF to the specified output directory.
 
@@ -106,8 +110,12 @@ class DownloadCommand(ToolkitCommand):
             file_format: The format of the files to be written (e.g., ".ndjson").
             compression: The compression method to use for the downloaded files (e.g., "none", "gzip").
             limit: The maximum number of items to download for each selected set. If None, all items will be downloaded.
+            compression_level: The compression level. If None, the default level of the compression method is used.
+            row_group_size: The number of rows in each row group of Parquet files. If None, each page is a row group.
         """
         console = io.client.console
+        # Fail before counting the items to download if the compression level is invalid.
+        Compression.from_name(compression).validate_level(compression_level)
         plan = self._create_plan(io, selectors, output_dir, file_format, limit)
         self._display_plan(plan, console)
 
@@ -123,7 +131,9 @@ class DownloadCommand(ToolkitCommand):
             step.selector.dump_to_file(step.target_dir)
 
             with (
-                self._create_data_file_writer(step, file_format, compression) as writer,
+                self._create_data_file_writer(
+                    step, file_format, compression, compression_level, row_group_size
+                ) as writer,
                 self._create_log_file_writer(step.target_dir) as log_file,
                 FileWithAggregationLogger(log_file) as logger,
             ):
@@ -132,7 +142,9 @@ class DownloadCommand(ToolkitCommand):
                     self._dump_configuration(io, step)
 
             if step.format_type == "delayed-table" and isinstance(io, TableDataIO):
-                self._convert_json_to_table(io, step, file_format, compression, console)
+                self._convert_json_to_table(
+                    io, step, file_format, compression, console, compression_level, row_group_size
+                )
 
             console.print(f"Downloaded {step.selector!s} to {file_count} file(s) in {step.target_dir.as_posix()!r}.")
 
@@ -201,7 +213,13 @@ class DownloadCommand(ToolkitCommand):
 
     @classmethod
     def _create_data_file_writer(
-        cls, step: DownloadStep[T_Selector], file_format: str, compression: str, is_conversion: bool = False
+        cls,
+        step: DownloadStep[T_Selector],
+        file_format: str,
+        compression: str,
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
+        is_conversion: bool = False,
     ) -> FileWriter:
         use_file_format = file_format if step.format_type != "delayed-table" or is_conversion else ".ndjson"
         return FileWriter.create_from_format(
@@ -210,6 +228,8 @@ class DownloadCommand(ToolkitCommand):
             step.selector.kind,
             Compression.from_name(compression),
             columns=step.schema,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
         )
 
     @classmethod
@@ -227,7 +247,7 @@ class DownloadCommand(ToolkitCommand):
     ) -> int:
         io.logger = logger
         logger.reset()
-        executor = ProducerWorkerExecutor[Page[T_ResourceResponse], Page[dict[str, JsonVal]]](
+        executor = ProducerWorkerExecutor[Page[T_ResourceResponse], Page[dict[str, JsonVal]] | Page[ColumnBatch]](
             download_iterable=io.stream_data(step.selector, step.limit),
             process=self.create_data_process(io=io, selector=step.selector, is_table=step.is_table),
             write=self.create_writer(writer, step.filestem),
@@ -255,18 +275,27 @@ class DownloadCommand(ToolkitCommand):
         io: DataIO[T_Selector, T_ResourceResponse],
         selector: T_Selector,
         is_table: bool,
-    ) -> Callable[[Page[T_ResourceResponse]], Page[dict[str, JsonVal]]]:
+    ) -> Callable[[Page[T_ResourceResponse]], Page[dict[str, JsonVal]] | Page[ColumnBatch]]:
         """Creates a data processing function based on the IO type and whether the output is a table."""
-        if is_table and isinstance(io, TableDataIO):
+        if is_table and isinstance(io, ColumnarTableDataIO):
+            return partial(io.data_to_columns, selector=selector)
+        elif is_table and isinstance(io, TableDataIO):
             return partial(io.data_to_row, selector=selector)
         return partial(io.data_to_json_chunk, selector=selector)
 
     @classmethod
-    def create_writer(cls, writer: FileWriter, filestem: str) -> Callable[[Page[dict[str, JsonVal]]], None]:
+    def create_writer(
+        cls, writer: FileWriter, filestem: str
+    ) -> Callable[[Page[dict[str, JsonVal]] | Page[ColumnBatch]], None]:
         """Creates a writer function that writes processed data to files using the provided FileWriter."""
 
-        def write(page: Page[dict[str, JsonVal]]) -> None:
-            writer.write_chunks(page.as_raw_items(), filestem=filestem)  # type: ignore[arg-type]
+        def write(page: Page[dict[str, JsonVal]] | Page[ColumnBatch]) -> None:
+            items = page.as_raw_items()
+            if items and isinstance(items[0], ColumnBatch):
+                for batch in items:
+                    writer.write_columns(batch, filestem=filestem)  # type: ignore[arg-type]
+            else:
+                writer.write_chunks(items, filestem=filestem)  # type: ignore[arg-type]
 
         return write
 
@@ -288,6 +317,8 @@ class DownloadCommand(ToolkitCommand):
         file_format: str,
         compression: str,
         console: Console,
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
     ) -> None:
         manifest_path = step.target_dir / step.selector.as_filename()
         json_files = step.selector.find_data_files(step.target_dir, manifest_path)
@@ -296,7 +327,9 @@ class DownloadCommand(ToolkitCommand):
             raise RuntimeError("Bug in Toolkit. Schema should not be None after data is downloaded.")
         step.schema = schema
         reader = MultiFileReader(json_files, schema=schema)
-        with cls._create_data_file_writer(step, file_format, compression, is_conversion=True) as writer:
+        with cls._create_data_file_writer(
+            step, file_format, compression, compression_level, row_group_size, is_conversion=True
+        ) as writer:
             executor = ProducerWorkerExecutor[Page[dict[str, JsonVal]], Page[dict[str, JsonVal]]](
                 download_iterable=UploadableDataIO.read_chunks(reader, step.selector),
                 process=cls._create_json_to_row(io),
@@ -1,11 +1,15 @@
+import sys
+import threading
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date
 from functools import partial
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, ClassVar, Literal, cast
 
 import questionary
 from cognite.client.data_classes import DataSetUpdate
@@ -15,9 +19,11 @@ from pydantic import JsonValue
 from rich import print
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress
 
 from cognite_toolkit._cdf_tk.client import ToolkitClient
 from cognite_toolkit._cdf_tk.client._resource_base import RequestItem
+from cognite_toolkit._cdf_tk.client.api.instances import INSTANCE_DELETE_ENDPOINT
 from cognite_toolkit._cdf_tk.client.http_client import (
     HTTPClient,
     ItemsFailedRequest,
@@ -33,8 +39,17 @@ from cognite_toolkit._cdf_tk.client.identifiers import (
     InternalId,
     ViewId,
 )
-from cognite_toolkit._cdf_tk.client.request_classes.filters import ContainerFilter
-from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling import NodeId, SpaceId
+from cognite_toolkit._cdf_tk.client.request_classes.filters import ContainerFilter, InstanceFilter
+from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling import (
+    NodeId,
+    QueryEdgeExpression,
+    QueryEdgeTableExpression,
+    QueryNodeExpression,
+    QueryNodeTableExpression,
+    QueryRequest,
+    QuerySelect,
+    SpaceId,
+)
 from cognite_toolkit._cdf_tk.constants import HINT_LEAD_TEXT
 from cognite_toolkit._cdf_tk.data_classes import DeployResults, ResourceDeployResult
 from cognite_toolkit._cdf_tk.data_classes._tracking_info import DataTracking
@@ -47,6 +62,7 @@ from cognite_toolkit._cdf_tk.dataio.logger import (
     Severity,
     display_item_results,
 )
+from cognite_toolkit._cdf_tk.dataio.progress import CursorBookmark, NoBookmark, ProgressYAML
 from cognite_toolkit._cdf_tk.dataio.selectors import (
     InstanceSelector,
     InstanceSpaceSelector,
@@ -93,8 +109,9 @@ from cognite_toolkit._cdf_tk.utils.aggregators import (
     SequenceAggregator,
     TimeSeriesAggregator,
 )
+from cognite_toolkit._cdf_tk.utils.collection import chunker_sequence
 from cognite_toolkit._cdf_tk.utils.fileio import NDJsonWriter, Uncompressed
-from cognite_toolkit._cdf_tk.utils.producer_worker import ProducerWorkerExecutor
+from cognite_toolkit._cdf_tk.utils.producer_worker import ProducerWorkerExecutor, ProgressWithFooter, getch
 from cognite_toolkit._cdf_tk.utils.useful_types import JsonVal
 from cognite_toolkit._cdf_tk.utils.validate_access import ValidateAccess
 
@@ -179,6 +196,8 @@ class DataModelingToDelete(ToDelete):
 
 @dataclass
 class EdgeToDelete(ToDelete):
+    instance_type: ClassVar[Literal["edge"]] = "edge"
+
     def get_process_function(
         self, client: ToolkitClient, logger: FileWithAggregationLogger
     ) -> Callable[[Page[ResourceResponseProtocol]], Page[JsonVal]]:
@@ -201,6 +220,7 @@ class EdgeToDelete(ToDelete):
 
 @dataclass
 class NodesToDelete(ToDelete):
+    instance_type: ClassVar[Literal["node"]] = "node"
     delete_datapoints: bool
     delete_file_content: bool
 
@@ -209,14 +229,25 @@ class NodesToDelete(ToDelete):
     ) -> Callable[[Page[ResourceResponseProtocol]], Page[JsonVal]]:
         def check_for_data(page: Page[ResourceResponseProtocol]) -> Page[JsonVal]:
             tracking_by_node_id = {InstanceId(instance_id=item.item.as_id()): item.tracking_id for item in page.items}  # type: ignore[attr-defined]
+            node_ids = list(tracking_by_node_id)
             timeseries_ids: set[NodeId] = set()
             files_ids: set[NodeId] = set()
-            if not self.delete_datapoints:
-                timeseries = client.tool.timeseries.retrieve(list(tracking_by_node_id), ignore_unknown_ids=True)
-                timeseries_ids = {ts.instance_id for ts in timeseries if ts.instance_id is not None}
-            if not self.delete_file_content:
-                files = client.tool.filemetadata.retrieve(list(tracking_by_node_id), ignore_unknown_ids=True)
-                files_ids = {f.instance_id for f in files if f.instance_id is not None}
+            # The time series and file checks are independent, so they are made concurrently.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                timeseries_future = (
+                    executor.submit(client.tool.timeseries.retrieve, node_ids, ignore_unknown_ids=True)
+                    if not self.delete_datapoints
+                    else None
+                )
+                files_future = (
+                    executor.submit(client.tool.filemetadata.retrieve, node_ids, ignore_unknown_ids=True)
+                    if not self.delete_file_content
+                    else None
+                )
+                if timeseries_future is not None:
+                    timeseries_ids = {ts.instance_id for ts in timeseries_future.result() if ts.instance_id is not None}
+                if files_future is not None:
+                    files_ids = {f.instance_id for f in files_future.result() if f.instance_id is not None}
             for node_id in timeseries_ids:
                 tracking_id = tracking_by_node_id.get(InstanceId(instance_id=node_id))
                 if tracking_id:
@@ -297,8 +328,87 @@ class AssetToDelete(IdResourceToDelete):
         return {"recursive": self.recursive}
 
 
+class SyncCheckpoint:
+    """Progress of a purge that lists instances through the sync endpoint, stored in the log directory.
+
+    An interrupted purge resumes from the stored sync cursor, such that the instances that are already
+    deleted are not listed again. The pages can be deleted out of order, so the cursor only moves past a page
+    once that page and all pages before it have been deleted without failures.
+
+    Args:
+        log_dir: The directory the progress file is stored in.
+        filestem: The filestem of the progress file.
+        total: The total number of instances to delete.
+    """
+
+    def __init__(self, log_dir: Path, filestem: str, total: int) -> None:
+        self.log_dir = log_dir
+        self.filestem = filestem
+        self.total = total
+        self.init_cursor: str | None = None
+        self.completed_count = 0
+        progress = ProgressYAML.try_load(log_dir, filestem)
+        if progress is not None and progress.status != "completed":
+            first = progress.get_first_bookmark()
+            if isinstance(first, CursorBookmark) and first.source == "sync":
+                self.init_cursor = first.cursor
+                self.completed_count = progress.completed_count
+        self._cursor = self.init_cursor
+        self._lock = threading.Lock()
+        self._pending: deque[str] = deque()
+        self._deleted: dict[str, tuple[int, bool]] = {}
+        self._has_failed = False
+
+    def register(self, cursor: str) -> None:
+        """Registers the cursor of a listed page, in the order the pages are listed."""
+        with self._lock:
+            self._pending.append(cursor)
+
+    def mark_deleted(self, cursor: str, count: int, succeeded: bool) -> None:
+        """Marks the page with the given cursor as deleted, and stores the progress if the cursor moved."""
+        with self._lock:
+            self._deleted[cursor] = (count, succeeded)
+            moved = False
+            while not self._has_failed and self._pending and self._pending[0] in self._deleted:
+                page_count, page_succeeded = self._deleted.pop(self._pending[0])
+                if not page_succeeded:
+                    # The instances in the failed page must be listed again when resuming.
+                    self._has_failed = True
+                    break
+                self._cursor = self._pending.popleft()
+                self.completed_count += page_count
+                moved = True
+            if moved:
+                self._dump("in-progress")
+
+    def finish(self, status: Literal["completed", "failed", "stopped"]) -> None:
+        with self._lock:
+            self._dump("failed" if self._has_failed and status == "completed" else status)
+
+    def _dump(self, status: Literal["in-progress", "completed", "failed", "stopped"]) -> None:
+        bookmark = CursorBookmark(cursor=self._cursor, source="sync") if self._cursor else NoBookmark()
+        ProgressYAML(
+            status=status, bookmarks={"main": bookmark}, total=self.total, completed_count=self.completed_count
+        ).dump_to_file(self.log_dir, self.filestem)
+
+
 class PurgeCommand(ToolkitCommand):
     BATCH_SIZE_DM = 1000
+    # The number of pages that are checked for data and unlinked concurrently.
+    UNLINK_WORKERS = 4
+    # The number of purge steps that run concurrently. They share the HTTP client used for deleting.
+    MAX_CONCURRENT_STEPS = 4
+    # The resource types that must be purged before the given resource type. For example, edges before nodes,
+    # and assets after the resources linked to them. Other steps have no ordering constraint and run concurrently.
+    PURGE_AFTER: ClassVar[dict[type[ResourceIO], frozenset[type[ResourceIO]]]] = {
+        NodeCRUD: frozenset({EdgeCRUD}),
+        ViewIO: frozenset({DataModelIO}),
+        ContainerCRUD: frozenset({EdgeCRUD, NodeCRUD, ViewIO}),
+        AssetIO: frozenset(
+            {EventIO, FileMetadataCRUD, TimeSeriesCRUD, SequenceIO, ThreeDModelCRUD, RelationshipIO}
+        ),
+        LabelIO: frozenset({AssetIO, FileMetadataCRUD, RelationshipIO}),
+    }
     DENIED_VIEW_IDS: frozenset[ViewId] = frozenset({INSTANCE_SOURCE_VIEW_ID, INSTANCE_SPACE_RELOCATION_SOURCE_VIEW_ID})
 
     def space(
@@ -453,16 +563,35 @@ class PurgeCommand(ToolkitCommand):
                 log_dir, kind="PurgeLogs", default_filestem=self._log_filestem(), compression=Uncompressed
             ) as log_writer,
         ):
-            logger = FileWithAggregationLogger(log_writer)
-            for step in delete_plan:
-                if step.total == 0:
-                    results[step.display_name] = ResourceDeployResult(step.display_name, deleted=0)
-                    continue
-                logger.reset()
-                executor = ProducerWorkerExecutor[Page[ResourceResponseProtocol], Page[JsonVal]](
-                    download_iterable=self._iterate_batch(
+            steps = [step for step in delete_plan if step.total > 0]
+            executor_by_step: dict[int, ProducerWorkerExecutor] = {}
+            logger_by_step: dict[int, FileWithAggregationLogger] = {}
+            checkpoint_by_step: dict[int, SyncCheckpoint] = {}
+            for index, step in enumerate(steps):
+                # Each step has its own logger, such that the results are reported per step.
+                # They share the writer, which is thread safe.
+                logger = FileWithAggregationLogger(log_writer)
+                logger_by_step[index] = logger
+                checkpoint: SyncCheckpoint | None = None
+                download_iterable: Iterable[Page[ResourceResponseProtocol]]
+                if space is not None and isinstance(step, EdgeToDelete | NodesToDelete):
+                    # Instances are listed through the sync endpoint, which is faster than the list endpoint
+                    # for large spaces and lets an interrupted purge resume.
+                    checkpoint = SyncCheckpoint(log_dir, f"purge-{space}-{step.instance_type}s", step.total)
+                    checkpoint_by_step[index] = checkpoint
+                    if checkpoint.init_cursor is not None:
+                        console.print(
+                            f"Resuming purge of {step.display_name} in {space!r} from the progress file in {log_dir}."
+                        )
+                    download_iterable = self._sync_instances(
+                        client, step, space, self.BATCH_SIZE_DM, logger, checkpoint
+                    )
+                else:
+                    download_iterable = self._iterate_batch(
                         step, space, data_set_external_id, batch_size=self.BATCH_SIZE_DM, logger=logger
-                    ),
+                    )
+                executor_by_step[index] = ProducerWorkerExecutor[Page[ResourceResponseProtocol], Page[JsonVal]](
+                    download_iterable=download_iterable,
                     process=step.get_process_function(client, logger),
                     write=partial(
                         self._purge_batch,
@@ -470,6 +599,7 @@ class PurgeCommand(ToolkitCommand):
                         delete_url=step.delete_url,
                         delete_client=delete_client,
                         logger=logger,
+                        checkpoint=checkpoint,
                     ),
                     max_queue_size=10,
                     total_item_count=step.total,
@@ -477,10 +607,33 @@ class PurgeCommand(ToolkitCommand):
                     process_description=f"Preparing {step.display_name} for deletion",
                     write_description=f"Deleting {step.display_name}",
                     console=console,
+                    process_workers=self.UNLINK_WORKERS if isinstance(step, NodesToDelete) else 1,
+                    show_throughput=True,
                 )
-                executor.run()
-                item_result = logger.finalize(is_dry_run=False)
 
+            console.print()
+            with ProgressWithFooter(
+                *ProducerWorkerExecutor.get_progress_columns(has_total=True, show_throughput=True),
+                console=console,
+                expand=True,
+                footer="Press 'q' to stop.",
+            ) as progress:
+                finished = self._run_purge_steps(steps, executor_by_step, progress)
+                progress.footer = ""
+                progress.refresh()
+
+            for step in delete_plan:
+                if step.total == 0:
+                    results[step.display_name] = ResourceDeployResult(step.display_name, deleted=0)
+                    continue
+                index = steps.index(step)
+                if index not in finished:
+                    # Not started, as an earlier step failed or was stopped.
+                    continue
+                if index in checkpoint_by_step:
+                    checkpoint_by_step[index].finish(executor_by_step[index].result)
+                logger = logger_by_step[index]
+                item_result = logger.finalize(is_dry_run=False)
                 display_item_results(item_result, title=f"{step.display_name} purge results", console=console)
                 self.tracker.track(
                     DataTracking.from_item_results("PurgeResult", step.crud.display_name, item_result), client
@@ -493,9 +646,91 @@ class PurgeCommand(ToolkitCommand):
                 results[step.display_name] = ResourceDeployResult(
                     step.display_name, deleted=delete_results.deleted, unchanged=delete_results.failed
                 )
-                executor.raise_on_error()
+            for index in sorted(finished):
+                executor_by_step[index].raise_on_error()
         return results
 
+    def _run_purge_steps(
+        self, steps: list[ToDelete], executor_by_step: dict[int, ProducerWorkerExecutor], progress: Progress
+    ) -> set[int]:
+        """Runs the purge steps as soon as the steps they must run after have finished.
+
+        Steps without an ordering constraint between them run concurrently, up to MAX_CONCURRENT_STEPS,
+        and share the progress display. The executors do not listen for user input when they share the
+        display, so a single listener stops all of them when the user presses 'q'. No new steps are started
+        after a step fails or is stopped.
+
+        Returns:
+            The indices of the steps that ran.
+        """
+        waiting = list(range(len(steps)))
+        done: set[int] = set()
+        stop_requested = threading.Event()
+        steps_finished = threading.Event()
+
+        def listen_for_stop() -> None:
+            while not steps_finished.is_set():
+                try:
+                    key = getch(timeout=0.1)
+                except EOFError:
+                    break
+                if key is not None and key.casefold() == "q":
+                    stop_requested.set()
+                    progress.console.print(
+                        "[yellow]Purge stopped by user. Finishing the deletes in progress...[/yellow]"
+                    )
+                    # Steps that have not started are never run, so stopping all of them is safe.
+                    for executor in executor_by_step.values():
+                        executor.stop()
+                    break
+
+        input_thread: threading.Thread | None = None
+        if sys.stdin.isatty():
+            input_thread = threading.Thread(target=listen_for_stop, daemon=True)
+            input_thread.start()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.MAX_CONCURRENT_STEPS, len(steps)))) as pool:
+            running: dict[Future[None], int] = {}
+            try:
+                while waiting or running:
+                    if not stop_requested.is_set() and all(
+                        executor_by_step[index].result == "completed" for index in done
+                    ):
+                        done_names = {steps[index].display_name for index in done}
+                        for index in list(waiting):
+                            if self._purge_after(steps[index], steps) <= done_names:
+                                waiting.remove(index)
+                                running[pool.submit(executor_by_step[index].run, progress=progress)] = index
+                    if not running:
+                        break
+                    completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        done.add(running.pop(future))
+                        future.result()
+            except KeyboardInterrupt:
+                for index in running.values():
+                    executor_by_step[index].stop()
+                raise
+            finally:
+                steps_finished.set()
+                if input_thread is not None:
+                    input_thread.join()
+        return done
+
+    @classmethod
+    def _purge_after(cls, step: ToDelete, steps: list[ToDelete]) -> set[str]:
+        """The display names of the steps in the plan that must finish before the given step starts."""
+        purge_after = {
+            before
+            for crud_cls, befores in cls.PURGE_AFTER.items()
+            if isinstance(step.crud, crud_cls)
+            for before in befores
+        }
+        return {
+            other.display_name
+            for other in steps
+            if any(isinstance(other.crud, before_cls) for before_cls in purge_after)
+        }
+
     @staticmethod
     def _iterate_batch(
         step: ToDelete,
@@ -516,6 +751,46 @@ class PurgeCommand(ToolkitCommand):
             logger.register([item.tracking_id for item in batch])
             yield Page(worker_id="main", items=batch)
 
+    @staticmethod
+    def _sync_instances(
+        client: ToolkitClient,
+        step: EdgeToDelete | NodesToDelete,
+        selected_space: str,
+        batch_size: int,
+        logger: FileWithAggregationLogger,
+        checkpoint: SyncCheckpoint,
+    ) -> Iterable[Page[ResourceResponseProtocol]]:
+        instance_filter = InstanceFilter(instance_type=step.instance_type, space=[selected_space]).dump_filter()
+        expression: QueryNodeExpression | QueryEdgeExpression
+        if step.instance_type == "edge":
+            expression = QueryEdgeExpression(
+                limit=batch_size, edges=QueryEdgeTableExpression(filter=instance_filter), mode="twoPhase"
+            )
+        else:
+            expression = QueryNodeExpression(
+                limit=batch_size, nodes=QueryNodeTableExpression(filter=instance_filter), mode="twoPhase"
+            )
+        query = QueryRequest(with_={"root": expression}, select={"root": QuerySelect()}, root="root")
+        if checkpoint.init_cursor is not None:
+            query.cursors = {"root": checkpoint.init_cursor}
+        # The page size adapts to the load on the sync endpoint.
+        for response in client.tool.instances.query_iterate(query, endpoint="sync"):
+            batch: list[DataItem[ResourceResponseProtocol]] = [
+                DataItem(tracking_id=step.get_tracking_id(instance), item=instance)
+                for instance in response.items.get("root", [])
+                # Instances deleted after the sync started are returned as tombstones.
+                if instance.deleted_time is None
+            ]
+            if not batch:
+                continue
+            bookmark = (
+                CursorBookmark(cursor=response.root_cursor, source="sync") if response.root_cursor else NoBookmark()
+            )
+            if isinstance(bookmark, CursorBookmark):
+                checkpoint.register(bookmark.cursor)
+            logger.register([item.tracking_id for item in batch])
+            yield Page(worker_id="main", items=batch, bookmark=bookmark)
+
     @staticmethod
     def _purge_batch(
         page: Page[JsonVal],
@@ -523,8 +798,11 @@ class PurgeCommand(ToolkitCommand):
         delete_url: str,
         delete_client: HTTPClient,
         logger: FileWithAggregationLogger,
+        checkpoint: SyncCheckpoint | None = None,
     ) -> None:
         if not page.items:
+            if checkpoint is not None and isinstance(page.bookmark, CursorBookmark):
+                checkpoint.mark_deleted(page.bookmark.cursor, 0, succeeded=True)
             return
 
         responses = delete_client.request_items_retries(
@@ -535,6 +813,9 @@ class PurgeCommand(ToolkitCommand):
                 extra_body_fields=delete_item.get_extra_fields(),
             )
         )
+        if checkpoint is not None and isinstance(page.bookmark, CursorBookmark):
+            succeeded = all(isinstance(response, ItemsSuccessResponse) for response in responses)
+            checkpoint.mark_deleted(page.bookmark.cursor, len(page.items), succeeded)
         for response in responses:
             if isinstance(response, ItemsSuccessResponse):
                 pass
@@ -816,6 +1097,8 @@ class PurgeCommand(ToolkitCommand):
                 process_description=f"{process_str} instances from files/timeseries" if unlink else "",
                 write_description=f"{write_str} instances",
                 console=console,
+                process_workers=self.UNLINK_WORKERS if unlink else 1,
+                show_throughput=True,
             )
             executor.run()
             items_results = logger.finalize(is_dry_run=dry_run)
@@ -909,8 +1192,14 @@ class PurgeCommand(ToolkitCommand):
         dry_run: bool,
         logger: FileWithAggregationLogger,
     ) -> Page[InstanceDefinitionId]:
-        self._unlink_timeseries(instance_ids, client, dry_run, logger)
-        self._unlink_files(instance_ids, client, dry_run, logger)
+        # The time series and files are unlinked independently, so they are done concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._unlink_timeseries, instance_ids, client, dry_run, logger),
+                executor.submit(self._unlink_files, instance_ids, client, dry_run, logger),
+            ]
+            for future in futures:
+                future.result()
         return instance_ids
 
     @staticmethod
@@ -924,13 +1213,18 @@ class PurgeCommand(ToolkitCommand):
             logger.apply_to_all_unprocessed("Ready to delete", Severity.info)
             return
 
-        responses = delete_client.request_items_retries(
-            ItemsRequest(
-                endpoint_url=delete_client.config.create_api_url("/models/instances/delete"),
-                method="POST",
-                items=page.items,
+        # The delete requests are limited by the endpoint, independent of the page size.
+        responses = [
+            response
+            for chunk in chunker_sequence(page.items, INSTANCE_DELETE_ENDPOINT.item_limit)
+            for response in delete_client.request_items_retries(
+                ItemsRequest(
+                    endpoint_url=delete_client.config.create_api_url(INSTANCE_DELETE_ENDPOINT.path),
+                    method="POST",
+                    items=chunk,
+                )
             )
-        )
+        ]
         for response in responses:
             if isinstance(response, ItemsFailedRequest):
                 for id in response.ids:
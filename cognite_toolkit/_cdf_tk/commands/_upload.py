@@ -60,9 +60,12 @@ class UploadCommand(ToolkitCommand):
     Attributes:
         _MAX_QUEUE_SIZE (int): The maximum size of the queue for processing items.
             Set to 80 to balance memory usage and processing speed.
+        _READ_AHEAD_BATCHES (int): The number of batches of items that are read from the data files
+            in the background while earlier items are uploaded.
     """
 
     _MAX_QUEUE_SIZE = 80
+    _READ_AHEAD_BATCHES = 10
     _MAX_VERBOSE_PRINTED_FAILED_IDS = 10
 
     def upload(
@@ -263,7 +266,7 @@ class UploadCommand(ToolkitCommand):
                 io.logger = logger
                 logger.reset()
                 # Create reader first to determine if input is table format
-                reader = MultiFileReader(datafiles)
+                reader = MultiFileReader(datafiles, read_ahead=cls._READ_AHEAD_BATCHES)
                 # FileContentIO supports uploading any file format.
                 if reader.is_table and not isinstance(io, TableUploadableDataIO | FileContentIO):
                     raise ToolkitValueError(
@@ -272,7 +275,7 @@ class UploadCommand(ToolkitCommand):
                 # Only fetch schema for table formats (e.g., CSV, Parquet), not for JSON formats
                 if reader.is_table and isinstance(io, TableDataIO):
                     schema = io.get_schema(selector)
-                    reader = MultiFileReader(datafiles, schema=schema)
+                    reader = MultiFileReader(datafiles, schema=schema, read_ahead=cls._READ_AHEAD_BATCHES)
 
                 item_count = io.count_items(reader, selector)
 
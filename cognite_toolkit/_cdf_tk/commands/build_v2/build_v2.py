@@ -2,8 +2,10 @@ import os
 import re
 import shutil
 import sys
+import time
 from collections import Counter
 from collections.abc import Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from itertools import zip_longest
@@ -63,8 +65,9 @@ from cognite_toolkit._cdf_tk.resource_ios._base_ios import FailedReadExtra, Read
 from cognite_toolkit._cdf_tk.rules import LocalRulesOrchestrator, ToolkitGlobalRuleSet, get_global_rules_registry
 from cognite_toolkit._cdf_tk.rules._base import RuleSetStatus
 from cognite_toolkit._cdf_tk.ui import AuraColor, ToolkitPanel, ToolkitPanelSection, ToolkitTable, hanging_indent
-from cognite_toolkit._cdf_tk.utils import calculate_hash, humanize_collection, safe_write
+from cognite_toolkit._cdf_tk.utils import humanize_collection, safe_write
 from cognite_toolkit._cdf_tk.utils.file import (
+    FileContent,
     read_yaml_content,
     relative_to_if_possible,
     safe_rmtree,
@@ -84,6 +87,8 @@ SelectionSource = Literal["modules", "config", "interactive"]
 
 
 class BuildV2Command(ToolkitCommand):
+    _MAX_VALIDATION_WORKERS = 8
+
     def build(self, parameters: BuildParameters, client: ToolkitClient | None = None) -> BuildFolder:
         console = client.console if client else Console(markup=True)
 
@@ -110,7 +115,7 @@ class BuildV2Command(ToolkitCommand):
 
         plan = self._create_validation_plan(built_modules, client)
         self._display_validation_plan(plan, console)
-        validation_results = self._run_validation(plan, console)
+        validation_results = self._run_validation(plan, console, parameters.verbose)
 
         build_folder = BuildFolder(
             organization_dir=parameters.organization_dir.resolve(),
@@ -561,8 +566,9 @@ class BuildV2Command(ToolkitCommand):
             # The file hash has to be calculated here as the .safe_read
             # modifies the content for certain kinds of resources such at for example data modeling resources that have
             # version.
-            file_hash = calculate_hash(resource_file, shorten=True)
-            content = crud_class.safe_read(resource_file)
+            file_content = FileContent.read(resource_file)
+            file_hash = file_content.hash(shorten=True)
+            content = crud_class.safe_read(file_content.text(BUILD_FOLDER_ENCODING))
         except Exception as read_error:
             return FailedReadYAMLFile(
                 source_path=resource_file, error=f"Failed to read resource file: {read_error!s}", code="READ-ERROR"
@@ -817,23 +823,83 @@ class BuildV2Command(ToolkitCommand):
         )
         return None
 
-    def _run_validation(self, plan: list[ValidationStep], console: Console) -> list[ValidationResult]:
+    def _run_validation(
+        self, plan: list[ValidationStep], console: Console, verbose: bool = False
+    ) -> list[ValidationResult]:
+        """Runs the ready rule sets, concurrently where possible.
+
+        Rule sets run in a thread pool as soon as the rule sets they depend on have finished. Rule sets
+        that are not thread safe run one at a time afterward. The results are returned in plan order,
+        independent of the order the rule sets finished in.
+        """
+        ready_steps = [step for step in plan if step.status.code == "ready"]
+        insights_by_step: dict[int, list[Insight]] = {}
+        seconds_by_step: dict[int, float] = {}
+
+        def run_step(index: int) -> None:
+            start = time.perf_counter()
+            insights_by_step[index] = list(ready_steps[index].rule.validate())
+            seconds_by_step[index] = time.perf_counter() - start
+
         with Progress(console=console) as progress:
-            ready_step_count = sum(1 for step in plan if step.status.code == "ready")
-            validating_task = progress.add_task("Checking modules", total=ready_step_count)
-            validation_results: list[ValidationResult] = []
-            for step in plan:
-                if step.status.code != "ready":
-                    continue
-                display_name = step.rule.DISPLAY_NAME
-                progress.update(validating_task, description=f"Checking {display_name}...")
+            validating_task = progress.add_task("Checking modules", total=len(ready_steps))
 
-                insights: list[Insight] = list(step.rule.validate())
+            def finished(index: int) -> None:
+                progress.update(
+                    validating_task,
+                    advance=1,
+                    description=f"Finished validating {ready_steps[index].rule.DISPLAY_NAME}.",
+                )
 
-                validation_results.append(ValidationResult(name=display_name, insights=insights))
-                progress.update(validating_task, advance=1, description=f"Finished validating {display_name}.")
-            progress.update(validating_task, description=f"Finished validating. Ran {ready_step_count} validations.")
-        return validation_results
+            planned_prefixes = {step.rule.CODE_PREFIX for step in ready_steps}
+            done_prefixes: set[str] = set()
+            waiting = [index for index, step in enumerate(ready_steps) if step.rule.IS_THREAD_SAFE]
+            with ThreadPoolExecutor(max_workers=max(1, min(self._MAX_VALIDATION_WORKERS, len(waiting)))) as executor:
+                running: dict[Future[None], int] = {}
+                while waiting or running:
+                    for index in list(waiting):
+                        if ready_steps[index].rule.DEPENDS_ON & planned_prefixes <= done_prefixes:
+                            waiting.remove(index)
+                            running[executor.submit(run_step, index)] = index
+                    if not running:
+                        # The dependencies can never be met, for example, due to a cycle. Run the next one anyway.
+                        index = waiting.pop(0)
+                        running[executor.submit(run_step, index)] = index
+                    progress.update(
+                        validating_task,
+                        description=f"Checking {humanize_collection([ready_steps[i].rule.DISPLAY_NAME for i in running.values()])}...",
+                    )
+                    completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        index = running.pop(future)
+                        future.result()
+                        done_prefixes.add(ready_steps[index].rule.CODE_PREFIX)
+                        finished(index)
+
+            for index, step in enumerate(ready_steps):
+                if not step.rule.IS_THREAD_SAFE:
+                    progress.update(validating_task, description=f"Checking {step.rule.DISPLAY_NAME}...")
+                    run_step(index)
+                    finished(index)
+            progress.update(validating_task, description=f"Finished validating. Ran {len(ready_steps)} validations.")
+
+        if verbose and ready_steps:
+            console.print(
+                ToolkitPanel(
+                    Group(
+                        *[
+                            f"[green]✓[/] {step.rule.DISPLAY_NAME}: {seconds_by_step[index]:.2f} seconds"
+                            for index, step in enumerate(ready_steps)
+                        ]
+                    ),
+                    title="Validation timings",
+                    border_style=AuraColor.GREEN.rich,
+                )
+            )
+        return [
+            ValidationResult(name=step.rule.DISPLAY_NAME, insights=insights_by_step[index])
+            for index, step in enumerate(ready_steps)
+        ]
 
     def _display_insights(self, insights: InsightList, insight_path: Path, console: Console, verbose: bool) -> None:
         if not insights:
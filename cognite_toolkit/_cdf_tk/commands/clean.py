@@ -1,11 +1,14 @@
+import io
 import traceback
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from graphlib import TopologicalSorter
 from pathlib import Path
 
 import questionary
 from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
 from rich import print
+from rich.console import Console
 from rich.panel import Panel
 
 from cognite_toolkit._cdf_tk.client._resource_base import T_Identifier, T_RequestResource, T_ResponseResource
@@ -53,6 +56,7 @@ from cognite_toolkit._cdf_tk.utils import (
     read_yaml_file,
 )
 from cognite_toolkit._cdf_tk.utils.auth import EnvironmentVariables
+from cognite_toolkit._cdf_tk.utils.collection import chunker_sequence
 
 from ._utils import _print_ids_or_length
 
@@ -60,6 +64,11 @@ AVAILABLE_DATA_TYPES: tuple[str, ...] = tuple(CRUDS_BY_FOLDER_NAME)
 
 
 class CleanCommand(ToolkitCommand):
+    # The number of resource types that are cleaned concurrently.
+    _MAX_CLEAN_WORKERS = 4
+    # The number of chunks of a resource type that data is dropped from concurrently.
+    _MAX_DROP_DATA_WORKERS = 4
+
     def clean_resources(
         self,
         loader: ResourceIO[T_Identifier, T_RequestResource, T_ResponseResource],
@@ -69,15 +78,17 @@ class CleanCommand(ToolkitCommand):
         drop: bool = True,
         drop_data: bool = False,
         verbose: bool = False,
+        console: Console | None = None,
     ) -> ResourceDeployResult | None:
+        console = console or Console()
         if not isinstance(loader, ResourceContainerIO) and not drop:
             # Skipping silently as this, we will not drop data or delete this resource
             return ResourceDeployResult(name=loader.display_name)
         if not loader.support_drop:
-            print(f"  [bold green]INFO:[/] {loader.display_name!r} cleaning is not supported, skipping...")
+            console.print(f"  [bold green]INFO:[/] {loader.display_name!r} cleaning is not supported, skipping...")
             return ResourceDeployResult(name=loader.display_name)
         elif isinstance(loader, ResourceContainerIO) and not drop_data:
-            print(
+            console.print(
                 f"  [bold]INFO:[/] Skipping cleaning of {loader.display_name!r}. This is a data resource (it contains "
                 f"data and is not only configuration/metadata) and therefore "
                 "requires the --drop-data flag to be set to perform cleaning..."
@@ -103,20 +114,20 @@ class CleanCommand(ToolkitCommand):
         else:
             prefix = "Would drop data from" if dry_run else "Dropping data from"
             with_data = ""
-        print(f"[bold]{prefix} {nr_of_existing} {loader.display_name} {with_data}from CDF...[/]")
+        console.print(f"[bold]{prefix} {nr_of_existing} {loader.display_name} {with_data}from CDF...[/]")
         if not isinstance(loader, RawDatabaseCRUD):
             for duplicate in worker.duplicates:
-                self.warn(LowSeverityWarning(f"Duplicate {loader.display_name} {duplicate}."))
+                self.warn(LowSeverityWarning(f"Duplicate {loader.display_name} {duplicate}."), console=console)
 
         # Deleting resources.
         if isinstance(loader, ResourceContainerIO) and drop_data:
-            nr_of_dropped_datapoints = self._drop_data(existing_resources, loader, dry_run, verbose)
+            nr_of_dropped_datapoints = self._drop_data(existing_resources, loader, dry_run, verbose, console)
             if drop:
-                nr_of_deleted = self._delete_resources(existing_resources, loader, dry_run, verbose)
+                nr_of_deleted = self._delete_resources(existing_resources, loader, dry_run, verbose, console)
             else:
                 nr_of_deleted = 0
             if verbose:
-                print("")
+                console.print("")
             return ResourceContainerDeployResult(
                 name=loader.display_name,
                 deleted=nr_of_deleted,
@@ -125,22 +136,28 @@ class CleanCommand(ToolkitCommand):
                 item_name=loader.item_name,
             )
         elif not isinstance(self, ResourceContainerIO) and drop:
-            nr_of_deleted = self._delete_resources(existing_resources, loader, dry_run, verbose)
+            nr_of_deleted = self._delete_resources(existing_resources, loader, dry_run, verbose, console)
             if verbose:
-                print("")
+                console.print("")
             return ResourceDeployResult(name=loader.display_name, deleted=nr_of_deleted, total=nr_of_existing)
         else:
             return ResourceDeployResult(name=loader.display_name)
 
     def _delete_resources(
-        self, loaded_resources: Sequence[T_ResponseResource], loader: ResourceIO, dry_run: bool, verbose: bool
+        self,
+        loaded_resources: Sequence[T_ResponseResource],
+        loader: ResourceIO,
+        dry_run: bool,
+        verbose: bool,
+        console: Console | None = None,
     ) -> int:
+        console = console or Console()
         nr_of_deleted = 0
         resource_ids = loader.get_ids(loaded_resources)
         if dry_run:
             nr_of_deleted += len(resource_ids)
             if verbose:
-                print(f"  Would have deleted {_print_ids_or_length(resource_ids)}.")
+                console.print(f"  Would have deleted {_print_ids_or_length(resource_ids)}.")
             return nr_of_deleted
 
         if resource_ids and loader.drop_confirmation_message:
@@ -150,15 +167,18 @@ class CleanCommand(ToolkitCommand):
         try:
             nr_of_deleted += loader.delete(resource_ids)
         except CogniteAPIError as e:
-            self.warn(MediumSeverityWarning(f"Failed to delete {_print_ids_or_length(resource_ids)}. Error {e}."))
+            self.warn(
+                MediumSeverityWarning(f"Failed to delete {_print_ids_or_length(resource_ids)}. Error {e}."),
+                console=console,
+            )
             if verbose:
-                print(Panel(traceback.format_exc()))
+                console.print(Panel(traceback.format_exc()))
         except CogniteNotFoundError:
             if verbose:
-                print(f"  [bold]INFO:[/] {_print_ids_or_length(resource_ids)} do(es) not exist.")
+                console.print(f"  [bold]INFO:[/] {_print_ids_or_length(resource_ids)} do(es) not exist.")
         else:  # Delete succeeded
             if verbose:
-                print(f"  Deleted {_print_ids_or_length(resource_ids)}.")
+                console.print(f"  Deleted {_print_ids_or_length(resource_ids)}.")
         return nr_of_deleted
 
     def _drop_data(
@@ -167,29 +187,52 @@ class CleanCommand(ToolkitCommand):
         loader: ResourceContainerIO,
         dry_run: bool,
         verbose: bool,
+        console: Console | None = None,
     ) -> int:
+        console = console or Console()
         nr_of_dropped = 0
         resource_ids = loader.get_ids(loaded_resources)
         if dry_run:
-            resource_drop_count = loader.count(resource_ids)
+            resource_drop_count = self._run_in_chunks(loader.count, resource_ids, loader.drop_data_chunk_size)
             nr_of_dropped += resource_drop_count
             if verbose:
-                self._verbose_print_drop(resource_drop_count, resource_ids, loader, dry_run)
+                self._verbose_print_drop(resource_drop_count, resource_ids, loader, dry_run, console)
             return nr_of_dropped
 
         try:
-            resource_drop_count = loader.drop_data(resource_ids)
+            resource_drop_count = self._run_in_chunks(loader.drop_data, resource_ids, loader.drop_data_chunk_size)
             nr_of_dropped += resource_drop_count
         except CogniteAPIError as e:
             if e.code == 404 and verbose:
-                print(f"  [bold]INFO:[/] {len(resource_ids)} {loader.display_name} do(es) not exist.")
+                console.print(f"  [bold]INFO:[/] {len(resource_ids)} {loader.display_name} do(es) not exist.")
         except CogniteNotFoundError:
             return nr_of_dropped
         else:  # Delete succeeded
             if verbose:
-                self._verbose_print_drop(resource_drop_count, resource_ids, loader, dry_run)
+                self._verbose_print_drop(resource_drop_count, resource_ids, loader, dry_run, console)
         return nr_of_dropped
 
+    @classmethod
+    def _run_in_chunks(
+        cls,
+        operation: Callable[[Sequence[T_Identifier]], int],
+        resource_ids: Sequence[T_Identifier],
+        chunk_size: int | None,
+    ) -> int:
+        """Counts or drops the data of the resources in chunks, through a bounded worker pool.
+
+        Returns:
+            The total count, or -1 if the count is not supported.
+        """
+        if chunk_size is None or len(resource_ids) <= chunk_size:
+            return operation(resource_ids)
+        chunks = list(chunker_sequence(resource_ids, chunk_size))
+        with ThreadPoolExecutor(max_workers=min(cls._MAX_DROP_DATA_WORKERS, len(chunks))) as executor:
+            counts = list(executor.map(operation, chunks))
+        if any(count < 0 for count in counts):
+            return -1
+        return sum(counts)
+
     def _interactive_module_selection(self, built_modules: list[ReadModule] | None) -> list[ReadModule] | None:
         if not built_modules:
             return None
@@ -209,23 +252,31 @@ class CleanCommand(ToolkitCommand):
         return selected_modules
 
     def _verbose_print_drop(
-        self, drop_count: int, resource_ids: Sequence[T_Identifier], loader: ResourceContainerIO, dry_run: bool
+        self,
+        drop_count: int,
+        resource_ids: Sequence[T_Identifier],
+        loader: ResourceContainerIO,
+        dry_run: bool,
+        console: Console | None = None,
     ) -> None:
+        console = console or Console()
         prefix = "Would have dropped" if dry_run else "Dropped"
         if drop_count > 0:
-            print(
+            console.print(
                 f"  {prefix} {drop_count:,} {loader.item_name} from {loader.display_name}: "
                 f"{_print_ids_or_length(resource_ids)}."
             )
         elif drop_count == 0:
             verb = "is" if len(resource_ids) == 1 else "are"
-            print(
+            console.print(
                 f"  The {loader.display_name}: {_print_ids_or_length(resource_ids)} {verb} empty, "
                 f"thus no {loader.item_name} will be {'touched' if dry_run else 'dropped'}."
             )
         else:
             # Count is not supported
-            print(f" {prefix} all {loader.item_name} from {loader.display_name}: {_print_ids_or_length(resource_ids)}.")
+            console.print(
+                f" {prefix} all {loader.item_name} from {loader.display_name}: {_print_ids_or_length(resource_ids)}."
+            )
 
     def _select_modules(self, clean_state: BuildEnvironment, module_str: str | None) -> list[ReadModule] | None:
         if module_str:
@@ -316,6 +367,7 @@ class CleanCommand(ToolkitCommand):
         if should_include:
             self.warn(ToolkitDependenciesIncludedWarning([item.folder_name for item in should_include]))
 
+        loaders: list[ResourceIO] = []
         for loader_cls in reversed(resolved_list):
             if not issubclass(loader_cls, ResourceIO):
                 continue
@@ -323,15 +375,12 @@ class CleanCommand(ToolkitCommand):
             if isinstance(loader, DataSetsIO | SimulatorModelRevisionIO | SimulatorRoutineRevisionIO):
                 self.warn(ToolkitNotSupportedWarning(feature=f"{loader.display_name} clean."))
                 continue
-            result = self.clean_resources(
-                loader,
-                env_vars=env_vars,
-                read_modules=selected_modules,
-                drop=True,
-                dry_run=dry_run,
-                drop_data=True,
-                verbose=verbose,
-            )
+            loaders.append(loader)
+
+        clean_results = self._clean_concurrently(
+            loaders, selected_loaders, env_vars, selected_modules, dry_run=dry_run, verbose=verbose
+        )
+        for result in clean_results:
             if result:
                 results[result.name] = result
         if results.has_counts:
@@ -339,6 +388,121 @@ class CleanCommand(ToolkitCommand):
         if results.has_uploads:
             print(results.uploads_table())
 
+    def _clean_concurrently(
+        self,
+        loaders: list[ResourceIO],
+        dependencies: dict[type[Loader], frozenset[type[Loader]]],
+        env_vars: EnvironmentVariables,
+        read_modules: list[ReadModule],
+        dry_run: bool,
+        verbose: bool,
+    ) -> list[ResourceDeployResult | None]:
+        """Cleans the resource types, running the resource types that do not depend on each other concurrently.
+
+        A resource type is cleaned once all resource types that depend on it are cleaned. The output of each
+        resource type is buffered and printed in the given order, such that the output is the same as when
+        cleaning one resource type at a time. Resource types that ask for confirmation before deleting are
+        cleaned in the main thread, when no other resource types are being cleaned.
+
+        Args:
+            loaders: The loaders to clean, in reverse dependency order.
+            dependencies: The dependencies of each loader class.
+            env_vars: The environment variables used to load the resources.
+            read_modules: The modules to clean.
+            dry_run: Whether to only count what would be cleaned.
+            verbose: Whether to print detailed information.
+
+        Returns:
+            The results of cleaning each loader, in the same order as the loaders.
+        """
+        main_console = Console()
+        clean_after = self._clean_after(loaders, dependencies)
+        results: dict[int, ResourceDeployResult | None] = {}
+        output_by_index: dict[int, str] = {}
+        next_to_print = 0
+
+        def clean(index: int, console: Console) -> None:
+            results[index] = self.clean_resources(
+                loaders[index],
+                env_vars=env_vars,
+                read_modules=read_modules,
+                drop=True,
+                dry_run=dry_run,
+                drop_data=True,
+                verbose=verbose,
+                console=console,
+            )
+
+        def clean_buffered(index: int) -> None:
+            buffer = io.StringIO()
+            console = Console(
+                file=buffer,
+                width=main_console.width,
+                force_terminal=main_console.is_terminal,
+                color_system=main_console.color_system,  # type: ignore[arg-type]
+            )
+            try:
+                clean(index, console)
+            finally:
+                output_by_index[index] = buffer.getvalue()
+
+        waiting = list(range(len(loaders)))
+        done: set[int] = set()
+        with ThreadPoolExecutor(max_workers=max(1, min(self._MAX_CLEAN_WORKERS, len(loaders)))) as executor:
+            running: dict[Future[None], int] = {}
+            try:
+                while waiting or running:
+                    for index in list(waiting):
+                        if not clean_after[index] <= done:
+                            continue
+                        if not dry_run and loaders[index].drop_confirmation_message:
+                            if running or index != next_to_print:
+                                continue
+                            waiting.remove(index)
+                            clean(index, main_console)
+                            output_by_index[index] = ""
+                            done.add(index)
+                        else:
+                            waiting.remove(index)
+                            running[executor.submit(clean_buffered, index)] = index
+                    if running:
+                        completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in completed:
+                            done.add(running.pop(future))
+                            future.result()
+                    while next_to_print in output_by_index:
+                        main_console.file.write(output_by_index.pop(next_to_print))
+                        next_to_print += 1
+            finally:
+                for output in (output_by_index[index] for index in sorted(output_by_index)):
+                    main_console.file.write(output)
+        return [results.get(index) for index in range(len(loaders))]
+
+    @staticmethod
+    def _clean_after(
+        loaders: list[ResourceIO], dependencies: dict[type[Loader], frozenset[type[Loader]]]
+    ) -> list[set[int]]:
+        """The indices of the loaders that must be cleaned before each loader.
+
+        A loader is cleaned after the loaders that depend on it, either directly or through
+        resource types that are not cleaned.
+        """
+        index_by_cls = {type(loader): index for index, loader in enumerate(loaders)}
+        clean_after: list[set[int]] = [set() for _ in loaders]
+        for index, loader in enumerate(loaders):
+            to_check: list[type[Loader]] = [type(loader)]
+            seen: set[type[Loader]] = set()
+            while to_check:
+                loader_cls = to_check.pop()
+                for dependency in dependencies.get(loader_cls, loader_cls.dependencies):
+                    if dependency in seen:
+                        continue
+                    seen.add(dependency)
+                    to_check.append(dependency)
+                    if (dependency_index := index_by_cls.get(dependency)) is not None and dependency_index != index:
+                        clean_after[dependency_index].add(index)
+        return clean_after
+
     def get_selected_loaders(
         self, build_dir: Path, read_resource_folders: set[str], include: list[str] | None
     ) -> dict[type[Loader], frozenset[type[Loader]]]:
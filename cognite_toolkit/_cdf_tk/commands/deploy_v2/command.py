@@ -1,7 +1,7 @@
 import csv
 import json
 from collections import Counter, defaultdict
-from collections.abc import Iterable, Mapping, Sequence, Set
+from collections.abc import Hashable, Iterable, Mapping, Sequence, Set
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -30,6 +30,8 @@ from cognite_toolkit._cdf_tk.commands._utils import (
     validate_soft_delete_capacity,
 )
 from cognite_toolkit._cdf_tk.commands.build_v2.data_classes import BuildLineage
+from cognite_toolkit._cdf_tk.commands.deploy_v2.incremental import DeployedLineage
+from cognite_toolkit._cdf_tk.commands.deploy_v2.snapshot import RemoteStateSnapshot
 from cognite_toolkit._cdf_tk.constants import HINT_LEAD_TEXT
 from cognite_toolkit._cdf_tk.data_classes._tracking_info import DeploymentTracking
 from cognite_toolkit._cdf_tk.dataio.selectors import RawTableSelector, SelectedTable
@@ -46,6 +48,7 @@ from cognite_toolkit._cdf_tk.exceptions import (
     ToolkitWrongResourceError,
     ToolkitYAMLFormatError,
 )
+from cognite_toolkit._cdf_tk.feature_flags import Flags
 from cognite_toolkit._cdf_tk.resource_ios import (
     RESOURCE_CRUD_BY_FOLDER_NAME,
     ContainerCRUD,
@@ -231,6 +234,7 @@ class DeployV2Command(ToolkitCommand):
 
         self._validate_cdf_project(build_dir, options.operation, options.cdf_project, env_vars.CDF_PROJECT)
         plan = self._display_setup(options.operation, build_dir, client.config.project, client.console, options.verbose)
+        self._prefetch_lookups(client, (step.crud_cls for step in plan))
 
         if options.drop:
             self._validate_plan_container_references(client, plan, options)
@@ -239,16 +243,44 @@ class DeployV2Command(ToolkitCommand):
             if not self._confirm_drop_data(client, plan, options):
                 return []
 
+        snapshot: RemoteStateSnapshot | None = None
+        if Flags.DEPLOY_SNAPSHOT.is_enabled():
+            snapshot = RemoteStateSnapshot(user_build_dir / RemoteStateSnapshot.filename, client.config.project)
+            if options.drop and not options.dry_run:
+                # Dropping resources can cascade to other resource types, for example, deleting a space
+                # deletes the containers in it. Thus, the snapshot of every resource type is outdated.
+                snapshot.invalidate()
+
+        deployed: DeployedLineage | None = None
+        if Flags.INCREMENTAL_DEPLOY.is_enabled() and build_lineage is not None:
+            deployed = DeployedLineage(
+                DeployedLineage.default_filepath(),
+                DeployedLineage.create_key(client.config.base_url, client.config.project, user_build_dir),
+                force_full_reconcile=options.force_update,
+            )
+            if options.drop or options.operation == "clean":
+                if not options.dry_run:
+                    # The deleted resources must be compared to CDF in the next deploy.
+                    deployed.reset()
+                deployed = None
+            elif not deployed.is_full_reconcile:
+                client.console.print(
+                    f"{HINT_LEAD_TEXT}Incremental deploy: only resources changed since the last successful deploy "
+                    "are compared to CDF. Use --force-update to compare all resources."
+                )
+
         clean_result: Sequence[DeploymentResult] | None = None
         if options.drop and (options.operation == "clean" or not options.dry_run):
             # If we are deploying, and it is dry-run, we skip this step, as apply_plan accounts
             # for drop in dry-run mode.
-            clean_result = self.apply_plan(client, list(reversed(plan)), options, is_delete=True)
+            clean_result = self.apply_plan(client, list(reversed(plan)), options, is_delete=True, snapshot=snapshot)
             if options.operation == "clean":
                 self._display_results(clean_result, options.operation, client.console, options.verbose)
                 return clean_result
 
-        results = self.apply_plan(client, plan, options)
+        results = self.apply_plan(client, plan, options, snapshot=snapshot, deployed=deployed)
+        if deployed is not None and not options.dry_run:
+            deployed.save(is_complete=not options.include)
 
         if clean_result is not None:
             self._merge_clean_results(results, clean_result)
@@ -666,7 +698,13 @@ class DeployV2Command(ToolkitCommand):
 
     @classmethod
     def apply_plan(
-        cls, client: ToolkitClient, plan: list[DeploymentStep], options: DeployOptions, is_delete: bool = False
+        cls,
+        client: ToolkitClient,
+        plan: list[DeploymentStep],
+        options: DeployOptions,
+        is_delete: bool = False,
+        snapshot: RemoteStateSnapshot | None = None,
+        deployed: DeployedLineage | None = None,
     ) -> Sequence[DeploymentResult]:
         """Applies the given plan using the given client.
 
@@ -674,6 +712,12 @@ class DeployV2Command(ToolkitCommand):
             client: The client to use to apply the plan.
             plan: The plan to apply.
             options: The options to use when applying the plan.
+            is_delete: Whether the resources in the plan should be deleted.
+            snapshot: The snapshot of the CDF state from a previous run. If given, the CDF resources are
+                read from it when it is valid, and it is updated with the resources retrieved from CDF.
+            deployed: The fingerprints of the last successful deploy. If given, resources that are unchanged since
+                then, and do not depend on a resource changed in this deploy, are not compared to CDF. The
+                fingerprints of the resources that are in sync with CDF are recorded in it.
 
         Returns:
             A list of DeploymentResult objects matching the given plan.
@@ -681,6 +725,8 @@ class DeployV2Command(ToolkitCommand):
 
         results: list[DeploymentResult] = []
         console = client.console
+        # The keys of the resources that are created, updated, or deleted, by resource type.
+        changed_by_crud: dict[type[ResourceIO], set[str]] = defaultdict(set)
         with Progress(console=console) as progress:
             total_files = sum(len(step.files) for step in plan)
             task_id = progress.add_task(f"Starting {options.operation}", total=total_files)
@@ -699,28 +745,67 @@ class DeployV2Command(ToolkitCommand):
 
                 is_missing_write = cls._validate_access(crud, request_resources, is_dry_run=options.dry_run)
 
-                progress.update(task_id, description=f"Comparing {resource_count} {resource_name} to CDF")
-                try:
-                    cdf_resource_by_id = {
-                        crud.get_id(resource): resource for resource in crud.retrieve(list(resource_by_id.keys()))
+                fingerprint_by_id: dict[Hashable, str] = {}
+                unchanged_since_deploy: list[Hashable] = []
+                to_compare_by_id = resource_by_id
+                if deployed is not None and not is_delete:
+                    fingerprint_by_id = {
+                        identifier: deployed.fingerprint(crud, resource.raw_dict)
+                        for identifier, resource in resource_by_id.items()
                     }
-                except ValidationError as validation_error:
-                    cls._handle_validation_error(
-                        validation_error,
-                        "retrieve",
-                        crud,
-                        [read.request for read in resource_by_id.values()],
-                        options.deployment_dir,
-                    )
+                    unchanged_since_deploy = [
+                        identifier
+                        for identifier, resource in resource_by_id.items()
+                        if len(resource.source_files) == 1
+                        and deployed.is_unchanged(crud, identifier, fingerprint_by_id[identifier])
+                        and not cls._has_changed_dependency(crud, resource.raw_dict, changed_by_crud)
+                    ]
+                    unchanged_set = set(unchanged_since_deploy)
+                    to_compare_by_id = {
+                        identifier: resource
+                        for identifier, resource in resource_by_id.items()
+                        if identifier not in unchanged_set
+                    }
+                    resource_count = len(to_compare_by_id)
+
+                progress.update(task_id, description=f"Comparing {resource_count} {resource_name} to CDF")
+                ids = list(to_compare_by_id.keys())
+                cdf_resources = snapshot.get(crud, ids) if snapshot is not None and ids else None
+                if cdf_resources is None and not ids:
+                    cdf_resources = []
+                elif cdf_resources is None:
+                    try:
+                        cdf_resources = crud.retrieve(ids)
+                    except ValidationError as validation_error:
+                        cls._handle_validation_error(
+                            validation_error,
+                            "retrieve",
+                            crud,
+                            [read.request for read in to_compare_by_id.values()],
+                            options.deployment_dir,
+                        )
+                    if snapshot is not None:
+                        snapshot.set(crud, ids, cdf_resources)
+                cdf_resource_by_id = {crud.get_id(resource): resource for resource in cdf_resources}
                 resources_to_deploy = cls._categorize_resources(
                     crud,
-                    resource_by_id,
+                    to_compare_by_id,
                     cdf_resource_by_id,
                     console,
                     options,
                     is_delete,
                     is_data_resource=isinstance(crud, ResourceContainerIO),
                 )
+                resources_to_deploy.unchanged.extend(unchanged_since_deploy)
+                if deployed is not None:
+                    changed_by_crud[type(crud)].update(
+                        deployed.as_key(identifier)
+                        for identifier in [
+                            *crud.get_ids(resources_to_deploy.to_create),
+                            *crud.get_ids(resources_to_deploy.to_update),
+                            *resources_to_deploy.to_delete,
+                        ]
+                    )
 
                 if options.dry_run:
                     result = cls.deploy_dry_run(crud, resources_to_deploy, is_missing_write, options)
@@ -732,9 +817,21 @@ class DeployV2Command(ToolkitCommand):
                         progress.start()
                         if not confirmed:
                             resources_to_deploy.to_delete.clear()
+                    if snapshot is not None and (
+                        resources_to_deploy.to_create or resources_to_deploy.to_update or resources_to_deploy.to_delete
+                    ):
+                        # Discarded before writing, such that a failing deploy does not leave an outdated snapshot.
+                        snapshot.invalidate(crud)
                     progress.update(task_id, description=f"{options.operation.title()}ing {resource_name} to CDF")
                     result = cls.deploy_resources(crud, resources_to_deploy, step.skipped_cruds, options.deployment_dir)
                     progress.update(task_id, description=f"{options.operation.title()}ed {resource_name} successfully.")
+                    if deployed is not None and not is_delete:
+                        for identifier in [
+                            *resources_to_deploy.unchanged,
+                            *crud.get_ids(resources_to_deploy.to_create),
+                            *crud.get_ids(resources_to_deploy.to_update),
+                        ]:
+                            deployed.record(crud, identifier, fingerprint_by_id[identifier])
 
                 results.append(result)
 
@@ -743,6 +840,15 @@ class DeployV2Command(ToolkitCommand):
             progress.update(task_id, description=finished)
         return results
 
+    @classmethod
+    def _has_changed_dependency(
+        cls, crud: ResourceIO, resource_dict: dict[str, Any], changed_by_crud: Mapping[type[ResourceIO], Set[str]]
+    ) -> bool:
+        for dependency_cls, identifier in crud.get_dependent_items(resource_dict):
+            if (changed := changed_by_crud.get(dependency_cls)) and DeployedLineage.as_key(identifier) in changed:
+                return True
+        return False
+
     @classmethod
     def _read_resource_files(
         cls,
@@ -823,6 +929,8 @@ class DeployV2Command(ToolkitCommand):
         is_data_resource: bool,
     ) -> ResourceToDeploy:
         resources = ResourceToDeploy[T_Identifier, T_RequestResource]()
+        if not is_delete:
+            crud.prepare_dump([cdf_by_id[identifier] for identifier in resource_by_id if identifier in cdf_by_id])
         for identifier, resource in resource_by_id.items():
             if len(resource.source_files) > 1:
                 first_file = resource.source_files[0]
@@ -867,7 +975,7 @@ class DeployV2Command(ToolkitCommand):
                     resources.to_create.append(resource.request)
                     continue
                 cdf_dict = crud.dump_resource(cdf_resource, resource.raw_dict)
-                if not options.force_update and cdf_dict == resource.raw_dict:
+                if not options.force_update and crud.is_unchanged(cdf_dict, resource.raw_dict):
                     resources.unchanged.append(identifier)
                     continue
                 if crud.support_update:
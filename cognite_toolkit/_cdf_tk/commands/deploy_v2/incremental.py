@@ -0,0 +1,133 @@
+import json
+import os
+import time
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+from cognite_toolkit._cdf_tk.client._resource_base import Identifier
+from cognite_toolkit._cdf_tk.client.api.lookup import LookUpCache
+from cognite_toolkit._cdf_tk.resource_ios import ResourceIO
+from cognite_toolkit._cdf_tk.utils import calculate_content_hash
+
+
+class DeployedLineage:
+    """The fingerprints of the resources as of the last successful deploy of a build directory to a CDF project.
+
+    An incremental deploy only retrieves and compares the resources whose fingerprint changed since the last
+    successful deploy, or that depend on a resource that changed in the current deploy. The fingerprint is a
+    hash of the resource as it is deployed, that is, after variables and environment variables are replaced.
+    Thus, it changes both when the source file and when the variables used to build it change.
+
+    Changes made directly in CDF are not detected by the fingerprints. To correct such drift, every resource
+    is compared to CDF when the last full comparison is older than full_reconcile_seconds.
+
+    Args:
+        filepath: The path to the JSON file the fingerprints are stored in.
+        key: Identifies the CDF project and build directory the fingerprints belong to.
+        full_reconcile_seconds: How often all resources are compared to CDF.
+        force_full_reconcile: Whether to compare all resources to CDF in this deploy.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        key: str,
+        full_reconcile_seconds: float = 24 * 60 * 60,
+        force_full_reconcile: bool = False,
+    ) -> None:
+        self.filepath = filepath
+        self.key = key
+        state: dict[str, Any] = {}
+        if filepath.exists():
+            try:
+                loaded = json.loads(filepath.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict) and isinstance(loaded.get(key), dict):
+                    state = loaded[key]
+            except (OSError, ValueError):
+                # A corrupt file only means that all resources are compared to CDF.
+                pass
+        previous = state.get("fingerprints")
+        self._previous: dict[str, dict[str, str]] = previous if isinstance(previous, dict) else {}
+        self._fingerprints: dict[str, dict[str, str]] = {}
+        last_full_reconcile = state.get("lastFullReconcile")
+        self.is_full_reconcile = (
+            force_full_reconcile
+            or not self._previous
+            or not isinstance(last_full_reconcile, int | float)
+            or not (0 <= time.time() - last_full_reconcile <= full_reconcile_seconds)
+        )
+        self._previous_full_reconcile = last_full_reconcile
+        self._last_full_reconcile = time.time() if self.is_full_reconcile else last_full_reconcile
+
+    @classmethod
+    def default_filepath(cls) -> Path:
+        """The location of the fingerprints, next to the lookup cache in the user's cache directory."""
+        return LookUpCache.default_filepath().with_name("deployed-lineage.json")
+
+    @classmethod
+    def create_key(cls, base_url: str, project: str, build_dir: Path) -> str:
+        return f"{base_url}|{project}|{build_dir.resolve().as_posix()}"
+
+    @classmethod
+    def fingerprint(cls, crud: ResourceIO, resource_dict: dict[str, Any]) -> str:
+        return calculate_content_hash(resource_dict, crud.unordered_list_paths, shorten=True)
+
+    @classmethod
+    def as_key(cls, identifier: Hashable) -> str:
+        """A key for the identifier, which is equal for equal identifiers of any type."""
+        if isinstance(identifier, Identifier):
+            return json.dumps(identifier.dump(), sort_keys=True)
+        return json.dumps(identifier, sort_keys=True, default=str)
+
+    def is_unchanged(self, crud: ResourceIO, identifier: Hashable, fingerprint: str) -> bool:
+        """Whether the resource is unchanged since the last successful deploy."""
+        if self.is_full_reconcile:
+            return False
+        return self._previous.get(type(crud).__name__, {}).get(self.as_key(identifier)) == fingerprint
+
+    def record(self, crud: ResourceIO, identifier: Hashable, fingerprint: str) -> None:
+        """Records that the resource is in sync with CDF after this deploy."""
+        self._fingerprints.setdefault(type(crud).__name__, {})[self.as_key(identifier)] = fingerprint
+
+    def save(self, is_complete: bool = True) -> None:
+        """Stores the fingerprints of this deploy. This should only be called when the deploy succeeded.
+
+        Args:
+            is_complete: Whether all resource types in the build were deployed. If not, the time of the last
+                full comparison is not updated.
+        """
+        # Resource types that were not deployed, for example, due to the include filter, keep their fingerprints.
+        fingerprints = {**self._previous, **self._fingerprints}
+        last_full_reconcile = self._last_full_reconcile
+        if self.is_full_reconcile and not is_complete:
+            last_full_reconcile = self._previous_full_reconcile
+        self._write({"lastFullReconcile": last_full_reconcile, "fingerprints": fingerprints})
+
+    def reset(self) -> None:
+        """Discards the fingerprints, such that the next deploy compares all resources to CDF."""
+        self._previous = {}
+        self._fingerprints = {}
+        self._write(None)
+
+    def _write(self, state: dict[str, Any] | None) -> None:
+        all_states: dict[str, Any] = {}
+        try:
+            if self.filepath.exists():
+                loaded = json.loads(self.filepath.read_text(encoding="utf-8"))
+                all_states = loaded if isinstance(loaded, dict) else {}
+        except (OSError, ValueError):
+            all_states = {}
+        if state is None:
+            all_states.pop(self.key, None)
+        else:
+            all_states[self.key] = state
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and replace, such that a concurrent run never reads a partial file.
+            tmp_path = self.filepath.with_name(f"{self.filepath.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(all_states), encoding="utf-8")
+            tmp_path.replace(self.filepath)
+        except OSError:
+            # Failing to store the fingerprints only means that the next deploy compares all resources.
+            pass
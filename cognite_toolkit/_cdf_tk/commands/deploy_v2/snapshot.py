@@ -0,0 +1,136 @@
+import json
+import os
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from cognite_toolkit._cdf_tk.client._resource_base import T_Identifier, T_RequestResource, T_ResponseResource
+from cognite_toolkit._cdf_tk.resource_ios import RESOURCE_CRUD_LIST, ResourceIO
+
+
+class RemoteStateSnapshot:
+    """The CDF resources retrieved by a deploy, persisted next to the built resources.
+
+    This lets a deploy right after a dry-run, or a repeated dry-run, reuse the resources the previous run
+    retrieved instead of retrieving the full CDF state for every resource type again. The snapshot is keyed
+    by CDF project, resource type, and identifier. It also records the identifiers that did not exist in CDF,
+    such that the resources to create are known without a lookup.
+
+    A snapshot of a resource type is only reused if it is younger than max_age_seconds and covers all the
+    identifiers that are deployed. It is discarded as soon as a deploy changes the resource type in CDF, together
+    with the snapshots of the resource types that depend on it. For example, recreating a function deletes its
+    schedules.
+
+    Args:
+        filepath: The path to the JSON file the snapshot is stored in.
+        project: The CDF project the snapshot is for.
+        max_age_seconds: How long a snapshot of a resource type is valid after it was retrieved.
+    """
+
+    filename = ".remote-state-snapshot.json"
+
+    def __init__(self, filepath: Path, project: str, max_age_seconds: float = 300.0) -> None:
+        self.filepath = filepath
+        self.project = project
+        self.max_age_seconds = max_age_seconds
+        self._snapshot: dict[str, dict[str, Any]] = {}
+        if filepath.exists():
+            try:
+                loaded = json.loads(filepath.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    self._snapshot = {key: value for key, value in loaded.items() if isinstance(value, dict)}
+            except (OSError, ValueError):
+                # A corrupt snapshot only means we retrieve the resources from CDF.
+                pass
+
+    def get(
+        self, crud: ResourceIO[T_Identifier, T_RequestResource, T_ResponseResource], ids: Sequence[T_Identifier]
+    ) -> list[T_ResponseResource] | None:
+        """Returns the snapshot of the given resources, or None if it is missing, stale, or incomplete."""
+        entry = self._snapshot.get(self.project, {}).get(self._crud_key(crud))
+        if not self._is_fresh(entry):
+            return None
+        items = entry.get("items", {})
+        keys = [self._id_key(crud, identifier) for identifier in ids]
+        if any(key not in items for key in keys):
+            return None
+        try:
+            return [crud.resource_cls._load(items[key]) for key in keys if items[key] is not None]
+        except (ValidationError, ValueError, TypeError, KeyError):
+            # The snapshot was written by a different version of the resource class.
+            return None
+
+    def set(
+        self,
+        crud: ResourceIO[T_Identifier, T_RequestResource, T_ResponseResource],
+        ids: Sequence[T_Identifier],
+        resources: Sequence[T_ResponseResource],
+    ) -> None:
+        """Stores the resources retrieved for the given identifiers. Identifiers without a resource do not exist."""
+        items: dict[str, dict[str, Any] | None] = {self._id_key(crud, identifier): None for identifier in ids}
+        for resource in resources:
+            items[self._id_key(crud, crud.get_id(resource))] = resource.dump()
+        self._snapshot.setdefault(self.project, {})[self._crud_key(crud)] = {
+            "retrievedAt": time.time(),
+            "items": items,
+        }
+        self._write()
+
+    def invalidate(self, crud: ResourceIO | None = None) -> None:
+        """Discards the snapshot of the given resource type and the resource types that depend on it, or of all
+        resource types if crud is None."""
+        project_snapshot = self._snapshot.get(self.project, {})
+        if crud is None:
+            changed = bool(project_snapshot)
+            self._snapshot.pop(self.project, None)
+        else:
+            changed = False
+            for crud_cls in self._with_dependents(type(crud)):
+                changed |= project_snapshot.pop(crud_cls.__name__, None) is not None
+        if changed:
+            self._write()
+
+    @staticmethod
+    def _with_dependents(crud_cls: type[ResourceIO]) -> frozenset[type[ResourceIO]]:
+        """The given resource type and all resource types that depend on it, directly or indirectly."""
+        affected = {crud_cls}
+        to_check = [crud_cls]
+        while to_check:
+            dependency = to_check.pop()
+            for candidate in RESOURCE_CRUD_LIST:
+                if candidate not in affected and dependency in candidate.dependencies:
+                    affected.add(candidate)
+                    to_check.append(candidate)
+        return frozenset(affected)
+
+    def _is_fresh(self, entry: Any) -> bool:
+        retrieved_at = entry.get("retrievedAt") if isinstance(entry, dict) else None
+        if not isinstance(retrieved_at, int | float):
+            return False
+        return 0 <= time.time() - retrieved_at <= self.max_age_seconds
+
+    @staticmethod
+    def _crud_key(crud: ResourceIO) -> str:
+        return type(crud).__name__
+
+    @staticmethod
+    def _id_key(crud: ResourceIO[T_Identifier, T_RequestResource, T_ResponseResource], identifier: T_Identifier) -> str:
+        return json.dumps(crud.dump_id(identifier), sort_keys=True)
+
+    def _write(self) -> None:
+        # Drop the stale entries, such that the file does not grow with every deploy.
+        for project_snapshot in self._snapshot.values():
+            for key in [key for key, entry in project_snapshot.items() if not self._is_fresh(entry)]:
+                del project_snapshot[key]
+        self._snapshot = {project: entries for project, entries in self._snapshot.items() if entries}
+        try:
+            # Write to a temporary file and replace, such that a concurrent run never reads a partial file.
+            tmp_path = self.filepath.with_name(f"{self.filepath.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._snapshot), encoding="utf-8")
+            tmp_path.replace(self.filepath)
+        except OSError:
+            # The snapshot is an optimization, failing to write it only means the next run retrieves from CDF.
+            pass
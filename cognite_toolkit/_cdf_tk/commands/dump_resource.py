@@ -998,10 +998,15 @@ class DumpResourceCommand(ToolkitCommand):
             output_dir.mkdir(exist_ok=True)
 
         dumped_ids: list[Hashable] = []
+        prefetched: set[type[ResourceIO]] = set()
         for identifiers, resources, loader, subfolder in finder:
             if not identifiers and not resources:
                 # No resources to dump
                 continue
+            if type(loader) not in prefetched:
+                # Dumping a resource replaces internal IDs, such as data set IDs, with external IDs.
+                self._prefetch_lookups(finder.client, [type(loader)])
+                prefetched.add(type(loader))
             if resources is None:
                 try:
                     resources = loader.retrieve(list(identifiers))
@@ -1017,6 +1022,7 @@ class DumpResourceCommand(ToolkitCommand):
             if subfolder:
                 resource_folder = resource_folder / subfolder
             resource_folder.mkdir(exist_ok=True, parents=True)
+            loader.prepare_dump(resources)
             for resource in resources:
                 resource_id = loader.get_id(resource)
                 name = loader.as_str(resource_id)
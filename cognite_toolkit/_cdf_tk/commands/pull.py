@@ -510,6 +510,9 @@ class PullCommand(ToolkitCommand):
                 self.warn(LowSeverityWarning(f"No valid resources recognized in {selected}"))
             return
 
+        self._prefetch_lookups(
+            client, (loader_cls for loader_cls in selected_loaders if issubclass(loader_cls, ResourceIO))
+        )
         results = DeployResults([], action="pull", dry_run=dry_run)
         for loader_cls in selected_loaders:
             if not issubclass(loader_cls, ResourceIO):
@@ -587,6 +590,9 @@ class PullCommand(ToolkitCommand):
     ) -> tuple[bool, dict[T_ID, dict[str, Any]]]:
         to_write: dict[T_ID, dict[str, Any]] = {}
         has_changes = False
+        loader.prepare_dump(
+            [cdf_resource_by_id[item_id] for item_id in local_resource_by_id if item_id in cdf_resource_by_id]
+        )
         for item_id, local_dict in local_resource_by_id.items():
             cdf_resource = cdf_resource_by_id.get(item_id)
             if cdf_resource is None:
@@ -600,7 +606,7 @@ class PullCommand(ToolkitCommand):
                 continue
             cdf_dumped = loader.dump_resource(cdf_resource, local_dict)
 
-            if cdf_dumped == local_dict:
+            if loader.is_unchanged(cdf_dumped, local_dict):
                 file_results.unchanged += 1
                 to_write[item_id] = local_dict
             else:
@@ -12,6 +12,7 @@ from ._asset_centric import (
 )
 from ._base import (
     Bookmark,
+    ColumnarTableDataIO,
     ConfigurableDataIO,
     DataIO,
     DataItem,
@@ -53,6 +54,7 @@ __all__ = [
     "CanvasIO",
     "ChartIO",
     "CogniteFileContentIO",
+    "ColumnarTableDataIO",
     "ConfigurableDataIO",
     "DataIO",
     "DataItem",
@@ -12,7 +12,7 @@ from cognite_toolkit._cdf_tk.client.http_client import HTTPClient
 from cognite_toolkit._cdf_tk.client.http_client._item_classes import ItemsRequest, ItemsResultList
 from cognite_toolkit._cdf_tk.dataio.progress import Bookmark, FileBookmark, NoBookmark
 from cognite_toolkit._cdf_tk.exceptions import ToolkitNotImplementedError
-from cognite_toolkit._cdf_tk.utils.fileio import MultiFileReader, SchemaColumn
+from cognite_toolkit._cdf_tk.utils.fileio import ColumnBatch, MultiFileReader, SchemaColumn
 from cognite_toolkit._cdf_tk.utils.useful_types import JsonVal
 
 from .logger import DataLogger, NoOpLogger
@@ -88,6 +88,11 @@ class Page(Generic[T_DataItem], Sized):
     def __len__(self) -> int:
         return len(self.items)
 
+    @property
+    def item_count(self) -> int:
+        """The number of items in the page, counting each row of a ColumnBatch item as one item."""
+        return sum(len(item.item) if isinstance(item.item, ColumnBatch) else 1 for item in self.items)
+
     def __iter__(self) -> Iterator[DataItem[T_DataItem]]:
         return iter(self.items)
 
@@ -406,3 +411,28 @@ class TableDataIO(DataIO[T_Selector, T_DataResponse], ABC):
             A dictionary representing the data in a row-based JSON-compatible format.
         """
         raise NotImplementedError()
+
+
+class ColumnarTableDataIO(TableDataIO[T_Selector, T_DataResponse], ABC):
+    """A base class for storage items that can convert downloaded data directly to columns.
+
+    This is used for high-volume data, such as datapoints, where creating one dictionary per row
+    dominates the download time.
+    """
+
+    @abstractmethod
+    def data_to_columns(
+        self, data_chunk: Page[T_DataResponse], selector: T_Selector | None = None
+    ) -> Page[ColumnBatch]:
+        """Convert a chunk of data to column batches.
+
+        The column batches must contain the same data as the rows returned by `data_to_row`.
+
+        Args:
+            data_chunk: The chunk of data to convert.
+            selector: Optional selection criteria to identify the data. This is required for some storage types.
+
+        Returns:
+            A page of column batches.
+        """
+        raise NotImplementedError()
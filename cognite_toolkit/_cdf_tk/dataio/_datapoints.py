@@ -1,5 +1,6 @@
-from collections.abc import Iterable, Mapping
-from itertools import groupby
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import chain, groupby
+from operator import attrgetter
 from typing import Any, ClassVar, Literal, cast
 
 from cognite.client._proto.data_point_insertion_request_pb2 import DataPointInsertionItem, DataPointInsertionRequest
@@ -32,11 +33,11 @@ from cognite_toolkit._cdf_tk.utils.dtype_conversion import (
     _TextConverter,
     _ValueConverter,
 )
-from cognite_toolkit._cdf_tk.utils.fileio import SchemaColumn
+from cognite_toolkit._cdf_tk.utils.fileio import ColumnBatch, SchemaColumn
 from cognite_toolkit._cdf_tk.utils.fileio._readers import MultiFileReader
 from cognite_toolkit._cdf_tk.utils.useful_types import JsonVal
 
-from ._base import Bookmark, DataItem, Page, TableDataIO, TableUploadableDataIO
+from ._base import Bookmark, ColumnarTableDataIO, DataItem, Page, TableUploadableDataIO
 from .selectors import DataPointsDataSetSelector, DataPointsFileSelector, DataPointsSelector
 
 
@@ -54,7 +55,7 @@ class DatapointsRequestAdapter(RequestResource):
 
 
 class DatapointsIO(
-    TableDataIO[DataPointsSelector, DataPointListResponse],
+    ColumnarTableDataIO[DataPointsSelector, DataPointListResponse],
     TableUploadableDataIO[DataPointsSelector, DataPointListResponse, DatapointsRequestAdapter],
 ):
     CHUNK_SIZE = 10_000
@@ -250,6 +251,42 @@ class DatapointsIO(
                         )
         return data_chunk.create_from(result)
 
+    def data_to_columns(
+        self, data_chunk: Page[DataPointListResponse], selector: DataPointsSelector | None = None
+    ) -> Page[ColumnBatch]:
+        import numpy as np
+
+        # The datapoints are protobuf messages, so their fields cannot be read as an array. Reading each field
+        # in a single pass over all time series with attrgetter keeps the iteration in C, like the Cognite SDK.
+        timestamp_of = attrgetter("timestamp")
+        value_of = attrgetter("value")
+        result: list[DataItem[ColumnBatch]] = []
+        for data_item in data_chunk.items:
+            external_ids: list[str] = []
+            segments: list[Sequence[Any]] = []
+            is_numeric = True
+            for item in data_item.item.items:
+                if datapoints := item.numericDatapoints.datapoints:
+                    segments.append(datapoints)
+                elif datapoints := item.stringDatapoints.datapoints:
+                    segments.append(datapoints)
+                    is_numeric = False
+                else:
+                    continue
+                external_ids.extend([item.externalId] * len(datapoints))
+            if not external_ids:
+                continue
+            count = len(external_ids)
+            value_column: np.ndarray | list[Any]
+            if is_numeric:
+                value_column = np.fromiter(map(value_of, chain.from_iterable(segments)), dtype=np.float64, count=count)
+            else:
+                value_column = list(map(value_of, chain.from_iterable(segments)))
+            timestamps = np.fromiter(map(timestamp_of, chain.from_iterable(segments)), dtype=np.int64, count=count)
+            batch = ColumnBatch(columns={"externalId": external_ids, "timestamp": timestamps, "value": value_column})
+            result.append(DataItem(tracking_id=data_item.tracking_id, item=batch))
+        return data_chunk.create_from(result)
+
     def json_to_row(
         self, item_json: dict[str, JsonVal], selector: DataPointsSelector | None = None
     ) -> dict[str, JsonVal]:
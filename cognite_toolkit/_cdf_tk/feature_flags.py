@@ -94,6 +94,26 @@ class Flags(Enum):
         visible=True,
         description="Enables support for transformation external data sources (OneLake / Fabric)",
     )
+    LOOKUP_CACHE = FlagMetadata(
+        visible=True,
+        description="Enables an on-disk cache of external ID to internal ID lookups that is reused between runs",
+    )
+    QUERY_CHUNK_SIZE_CACHE = FlagMetadata(
+        visible=True,
+        description="Enables reusing the page sizes learned for instance queries and syncs between runs",
+    )
+    DEPLOY_SNAPSHOT = FlagMetadata(
+        visible=True,
+        description="Enables reusing the CDF state retrieved by a deploy dry-run in the following deploy",
+    )
+    INCREMENTAL_DEPLOY = FlagMetadata(
+        visible=True,
+        description="Enables deploying only the resources that changed since the last successful deploy",
+    )
+    FUNCTION_ARCHIVE_CACHE = FlagMetadata(
+        visible=True,
+        description="Enables reusing the zipped and hashed function code between runs",
+    )
 
     def is_enabled(self) -> bool:
         return FeatureFlag.is_enabled(self)
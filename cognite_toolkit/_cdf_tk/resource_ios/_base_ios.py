@@ -19,7 +19,12 @@ from cognite_toolkit._cdf_tk.client.resource_classes.group import ScopeDefinitio
 from cognite_toolkit._cdf_tk.client.resource_classes.group.acls import AclType
 from cognite_toolkit._cdf_tk.constants import BUILD_FOLDER_ENCODING, YAML_SUFFIX
 from cognite_toolkit._cdf_tk.tk_warnings import ToolkitWarning
-from cognite_toolkit._cdf_tk.utils import load_yaml_inject_variables, safe_read, sanitize_filename
+from cognite_toolkit._cdf_tk.utils import (
+    calculate_content_hash,
+    load_yaml_inject_variables,
+    safe_read,
+    sanitize_filename,
+)
 from cognite_toolkit._cdf_tk.yaml_classes import ToolkitResource
 
 if TYPE_CHECKING:
@@ -164,6 +169,10 @@ class ResourceIO(Loader, ABC, Generic[T_Identifier, T_RequestResource, T_Respons
         dependencies: A set of other resource resource_ios that must be loaded before this crud.
         parent_resource: A set of other resource resource_ios that are parent resources to this resource. This is used
             to determine if the iterate method should return any resources when filtering by parent ids.
+        unordered_list_paths: Paths to lists in the resource where the order of the elements does not matter. A "*"
+            in a path matches any key. This is used when checking whether a resource has changed.
+        prefetch_lookups: The client lookups, for example, 'data_sets', this resource uses to resolve external IDs.
+            Commands can prefetch these in one sweep instead of looking up one ID at a time.
     """
 
     # Must be set in the subclass
@@ -174,6 +183,8 @@ class ResourceIO(Loader, ABC, Generic[T_Identifier, T_RequestResource, T_Respons
     support_drop = True
     support_update = True
     drop_confirmation_message: ClassVar[str | None] = None
+    unordered_list_paths: ClassVar[frozenset[tuple[str, ...]]] = frozenset()
+    prefetch_lookups: ClassVar[frozenset[str]] = frozenset()
     dependencies: "frozenset[type[ResourceIO]]" = frozenset()
     # For example, TransformationNotification and Schedule has Transformation as the parent resource
     # This is used in the iterate method to ensure that nothing is returned if
@@ -367,6 +378,36 @@ class ResourceIO(Loader, ABC, Generic[T_Identifier, T_RequestResource, T_Respons
         """
         return resource.as_write().dump()
 
+    def prepare_dump(self, resources: Sequence[T_ResponseResource]) -> None:
+        """Looks up, in bulk, what dump_resource needs for the given resources.
+
+        This is called once with all the resources of a kind before dump_resource is called for each of them. It
+        is intended to be overwritten in subclasses that would otherwise make one request per resource in
+        dump_resource, for example, the FunctionIO that looks up the code file of each function.
+
+        Args:
+            resources (Sequence[T_ResponseResource]): The resources that are about to be dumped.
+        """
+        return None
+
+    def is_unchanged(self, cdf_dict: dict[str, Any], local_dict: dict[str, Any]) -> bool:
+        """Checks whether the dumped CDF resource is the same as the local resource.
+
+        The dictionaries are compared directly first, which stops at the first difference. Only if they
+        differ, and the resource has lists where the order does not matter, the content hashes are compared.
+
+        Args:
+            cdf_dict: The CDF resource dumped with the dump_resource method.
+            local_dict: The local resource.
+        """
+        if cdf_dict == local_dict:
+            return True
+        if not self.unordered_list_paths:
+            return False
+        return calculate_content_hash(cdf_dict, self.unordered_list_paths) == calculate_content_hash(
+            local_dict, self.unordered_list_paths
+        )
+
     def split_resource(
         self, base_filepath: Path, resource: dict[str, Any]
     ) -> Iterable[tuple[Path, dict[str, Any] | str]]:
@@ -480,9 +521,12 @@ class ResourceContainerIO(ResourceIO[T_Identifier, T_RequestResource, T_Response
     class attributes:
         item_name: The name of the item that is stored in the resource container. This should be set in the subclass.
             It is used to display messages when running operations.
+        drop_data_chunk_size: The number of resources the data can be counted and dropped for independently of the
+            other resources. If set, the data is dropped in chunks of this size concurrently.
     """
 
     item_name: str
+    drop_data_chunk_size: ClassVar[int | None] = None
 
     @abstractmethod
     def count(self, ids: Sequence[T_Identifier]) -> int:
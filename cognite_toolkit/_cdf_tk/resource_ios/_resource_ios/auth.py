@@ -79,6 +79,7 @@ class GroupIO(ResourceIO[NameId, GroupRequest, GroupResponse]):
     resource_cls = GroupResponse
     resource_write_cls = GroupRequest
     yaml_cls = GroupYAML
+    prefetch_lookups = frozenset({"data_sets", "security_categories"})
     resource_scopes = frozenset(
         {
             cap.IDScope,
@@ -91,6 +92,8 @@ class GroupIO(ResourceIO[NameId, GroupRequest, GroupResponse]):
         }
     )
     resource_scope_names = frozenset({scope._scope_name for scope in resource_scopes})  # type: ignore[attr-defined]
+    # A group has a set of capabilities, each with a set of actions.
+    unordered_list_paths = frozenset({("capabilities",), ("capabilities", "*", "actions")})
     _doc_url = "Groups/operation/createGroups"
 
     def __init__(
@@ -564,6 +567,9 @@ class SecurityCategoryIO(ResourceIO[NameId, SecurityCategoryRequest, SecurityCat
         retrieved = self.retrieve(ids)
         if retrieved:
             self.client.tool.security_categories.delete([InternalUnwrappedId(id=cat.id) for cat in retrieved])
+            self.client.lookup.security_categories.invalidate(
+                external_id=[cat.name for cat in retrieved], id=[cat.id for cat in retrieved]
+            )
         return len(retrieved)
 
     def _iterate(
@@ -46,6 +46,7 @@ class AssetIO(ResourceIO[ExternalId, AssetRequest, AssetResponse]):
     yaml_cls = AssetYAML
     kind = "Asset"
     dependencies = frozenset({DataSetsIO, LabelIO})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Assets/operation/createAssets"
 
     @property
@@ -94,6 +95,7 @@ class AssetIO(ResourceIO[ExternalId, AssetRequest, AssetResponse]):
         if not ids:
             return 0
         self.client.tool.assets.delete(list(ids), ignore_unknown_ids=True)
+        self.client.lookup.assets.invalidate_identifiers(ids)
         return len(ids)
 
     def _iterate(
@@ -188,6 +190,7 @@ class SequenceIO(ResourceIO[ExternalId, SequenceRequest, SequenceResponse]):
     kind = "Sequence"
     dependencies = frozenset({DataSetsIO, AssetIO})
     yaml_cls = SequenceYAML
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Sequences/operation/createSequence"
 
     @property
@@ -447,6 +450,7 @@ class EventIO(ResourceIO[ExternalId, EventRequest, EventResponse]):
     yaml_cls = EventYAML
     kind = "Event"
     dependencies = frozenset({DataSetsIO, AssetIO})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Events/operation/createEvents"
 
     @property
@@ -495,6 +499,7 @@ class EventIO(ResourceIO[ExternalId, EventRequest, EventResponse]):
         if not ids:
             return 0
         self.client.tool.events.delete(list(ids), ignore_unknown_ids=True)
+        self.client.lookup.events.invalidate_identifiers(ids)
         return len(ids)
 
     def _iterate(
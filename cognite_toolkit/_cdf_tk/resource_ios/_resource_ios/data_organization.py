@@ -140,6 +140,7 @@ class LabelIO(ResourceIO[ExternalId, LabelRequest, LabelResponse]):
     yaml_cls = LabelsYAML
     kind = "Label"
     dependencies = frozenset({DataSetsIO, GroupAllScopedCRUD})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Labels/operation/createLabelDefinitions"
     support_update = False
 
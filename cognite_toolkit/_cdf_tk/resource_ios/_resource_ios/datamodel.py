@@ -119,7 +119,7 @@ from cognite_toolkit._cdf_tk.utils import (
 )
 from cognite_toolkit._cdf_tk.utils.acl_helper import as_instance_acl_actions, space_scoped_resource
 from cognite_toolkit._cdf_tk.utils.diff_list import diff_list_identifiable, dm_identifier
-from cognite_toolkit._cdf_tk.utils.tarjan import pack_into_batches
+from cognite_toolkit._cdf_tk.utils.tarjan import pack_into_batches, tarjan
 from cognite_toolkit._cdf_tk.yaml_classes import (
     ContainerYAML,
     DataModelYAML,
@@ -146,6 +146,7 @@ from .auth import GroupAllScopedCRUD
 @final
 class SpaceCRUD(ResourceContainerIO[SpaceId, SpaceRequest, SpaceResponse]):
     item_name = "nodes and edges"
+    drop_data_chunk_size = 1
     folder_name = "data_modeling"
     resource_cls = SpaceResponse
     resource_write_cls = SpaceRequest
@@ -1054,19 +1055,20 @@ class ViewIO(ResourceIO[ViewId, ViewRequest, ViewResponse]):
                     # This view doesn't implement the required container, so depend on all views that do
                     view_dependencies[view_id].update(container_to_views[required_container])
 
+        # The strongly connected components are in topological order. Components with more than one view,
+        # or a view depending on itself, are cycles. Computed in a single pass, instead of removing
+        # one cycle at a time, to stay linear in the size of the graph.
+        sorted_views: list[ViewId] = []
         cyclic_views: list[ViewId] = []
-        for _ in range(
-            len(view_dependencies)
-        ):  # Ensure an upper bound on the number of iterations we do when removing cycles.
-            try:
-                TopologicalSorter(view_dependencies).prepare()
-                break
-            except CycleError as e:
-                cycle_nodes = set(e.args[1])
-                cyclic_views.extend(cycle_nodes)
-                view_dependencies = {k: v - cycle_nodes for k, v in view_dependencies.items() if k not in cycle_nodes}
-
-        sorted_views = list(TopologicalSorter(view_dependencies).static_order())
+        for strongly_connected in tarjan(view_dependencies):
+            if len(strongly_connected) > 1:
+                cyclic_views.extend(strongly_connected)
+                continue
+            (view_id,) = strongly_connected
+            if view_id in view_dependencies.get(view_id, set()):
+                cyclic_views.append(view_id)
+            else:
+                sorted_views.append(view_id)
 
         return sorted_views, cyclic_views
 
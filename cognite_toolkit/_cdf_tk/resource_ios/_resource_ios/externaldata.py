@@ -33,6 +33,7 @@ class ExternalDataSourceIO(
     kind = "ExternalDataSource"
     yaml_cls = ExternalDataSourceYAML
     dependencies = frozenset({DataSetsIO})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Transformations-External-Data-Sources/operation/upsertExternalDataSources"
 
     @property
@@ -76,6 +76,7 @@ class ExtractionPipelineIO(ResourceIO[ExternalId, ExtractionPipelineRequest, Ext
     kind = "ExtractionPipeline"
     dependencies = frozenset({DataSetsIO, RawDatabaseCRUD, RawTableCRUD, GroupAllScopedCRUD})
     yaml_cls = ExtractionPipelineYAML
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Extraction-Pipelines/operation/createExtPipes"
 
     @property
@@ -184,6 +185,7 @@ class ExtractionPipelineIO(ResourceIO[ExternalId, ExtractionPipelineRequest, Ext
         if not ids:
             return 0
         self.client.tool.extraction_pipelines.delete(list(ids), ignore_unknown_ids=True)
+        self.client.lookup.extraction_pipelines.invalidate_identifiers(ids)
         return len(ids)
 
     def _iterate(
@@ -83,6 +83,7 @@ class FileMetadataCRUD(ResourceContainerIO[ExternalId, FileMetadataRequest, File
     yaml_cls = FileMetadataYAML
     kind = "FileMetadata"
     dependencies = frozenset({DataSetsIO, GroupAllScopedCRUD, LabelIO, AssetIO})
+    prefetch_lookups = frozenset({"data_sets", "security_categories"})
 
     _doc_url = "Files/operation/initFileUpload"
 
@@ -248,6 +249,7 @@ class FileMetadataCRUD(ResourceContainerIO[ExternalId, FileMetadataRequest, File
         if not ids:
             return 0
         self.client.tool.filemetadata.delete(list(ids), ignore_unknown_ids=True)
+        self.client.lookup.files.invalidate_identifiers(ids)
         return len(ids)
 
     def _iterate(
@@ -1,8 +1,16 @@
-from collections import defaultdict
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import cached_property
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Literal, cast, final
+from typing import Any, ClassVar, Literal, TypeAlias, cast, final
+from zipfile import ZipFile, ZipInfo
 
 from cognite.client import data_modeling as dm
 from cognite.client.data_classes import ClientCredentials
@@ -15,8 +23,10 @@ from rich.console import Console
 
 from cognite_toolkit._cdf_tk.cdf_toml import CDFToml
 from cognite_toolkit._cdf_tk.client import ToolkitClient
+from cognite_toolkit._cdf_tk.client.api.lookup import LookUpCache
 from cognite_toolkit._cdf_tk.client._resource_base import Identifier
 from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, InternalId
+from cognite_toolkit._cdf_tk.client.resource_classes.filemetadata import FileMetadataResponse
 from cognite_toolkit._cdf_tk.client.resource_classes.function import FunctionRequest, FunctionResponse
 from cognite_toolkit._cdf_tk.client.resource_classes.function_schedule import (
     FunctionScheduleId,
@@ -36,10 +46,10 @@ from cognite_toolkit._cdf_tk.exceptions import (
     ResourceCreationError,
     ToolkitRequiredValueError,
 )
+from cognite_toolkit._cdf_tk.feature_flags import Flags
 from cognite_toolkit._cdf_tk.resource_ios._base_ios import FailedReadExtra, ReadExtra, ResourceIO, SuccessExtra
 from cognite_toolkit._cdf_tk.tk_warnings import HighSeverityWarning, LowSeverityWarning
 from cognite_toolkit._cdf_tk.utils import (
-    calculate_directory_hash,
     calculate_hash,
     calculate_secure_hash,
     humanize_collection,
@@ -47,8 +57,6 @@ from cognite_toolkit._cdf_tk.utils import (
 from cognite_toolkit._cdf_tk.utils.acl_helper import dataset_scoped_resource
 from cognite_toolkit._cdf_tk.utils.cdf import read_auth, try_find_error
 from cognite_toolkit._cdf_tk.utils.file import (
-    create_temporary_zip,
-    create_zip_in_memory,
     sanitize_filename,
     yaml_safe_dump,
 )
@@ -62,6 +70,38 @@ from .group_scoped import GroupResourceScopedCRUD
 
 CDF_TOML = CDFToml.load()
 
+# The relative path, modification time, size and mode of each file in a function directory.
+_DirectorySignature: TypeAlias = tuple[tuple[str, int, int, int], ...]
+# Zip entries store local time with two-second resolution, so we use a fixed timestamp
+# to make the archive independent of when the files were checked out or built.
+_ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class _FunctionArchive:
+    """The function code zipped together with the hashes used to detect changes.
+
+    Args:
+        content: A deterministic zip of the function directory. Entries are sorted and have fixed
+            timestamps, so the same code with the same file permissions always gives the same bytes.
+        source_hash: The hash of the full directory, same as `calculate_directory_hash`.
+        code_hash: The shortened hash of the directory ignoring .pyc and .DS_Store files.
+        file_hash_by_path: The shortened hash of each file by its path relative to the directory.
+    """
+
+    content: bytes
+    source_hash: str
+    code_hash: str
+    file_hash_by_path: dict[str, str]
+
+    def dump(self, signature: _DirectorySignature) -> dict[str, Any]:
+        return {
+            "signature": [list(entry) for entry in signature],
+            "sourceHash": self.source_hash,
+            "codeHash": self.code_hash,
+            "fileHashByPath": self.file_hash_by_path,
+        }
+
 
 @final
 class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
@@ -72,10 +112,18 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
     kind = "Function"
     yaml_cls = FunctionsYAML
     dependencies = frozenset({DataSetsIO, GroupAllScopedCRUD})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Functions/operation/postFunctions"
     metadata_value_limit = 512
     support_update = False
     extra_kinds = frozenset({FileMetadataCRUD.kind, CogniteFileCRUD.kind})
+    # The maximum number of function code archives to zip and upload concurrently.
+    _MAX_UPLOAD_WORKERS = 8
+    # Build, dry-run and deploy all need the function archive, this avoids zipping and hashing
+    # unchanged function directories more than once. The least recently used archives are evicted.
+    _MAX_CACHED_ARCHIVES = 32
+    _archive_by_directory: ClassVar[OrderedDict[Path, tuple[_DirectorySignature, _FunctionArchive]]] = OrderedDict()
+    _archive_lock: ClassVar[threading.Lock] = threading.Lock()
 
     class _MetadataKey:
         function_hash = "cognite-toolkit-hash"
@@ -95,6 +143,7 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
         self.function_dir_by_external_id: dict[str, Path] = {}
         self.filemetadata_path_by_external_id: dict[str, Path] = {}
         self.cognitefile_path_by_external_id: dict[str, Path] = {}
+        self._code_file_by_id: dict[int, FileMetadataResponse] = {}
         self._file_upload_timeout_seconds = file_upload_timeout_seconds
         self.use_filio = use_fileio
 
@@ -199,6 +248,7 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
             )
             return
 
+        archive = cls._package_function(function_rootdir)
         # This mutates the input object, but it is the easiest way to pass
         # the hash-value.
         # This hash value is used to determine whether to redeploy the function.
@@ -209,13 +259,13 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
 
         # This hash value is used to determine whether you can deploy from the build folder.
         # (avoid the user running cdf build, modify the source code, then cdf deploy)
-        source_hash = calculate_directory_hash(function_rootdir)
+        source_hash = archive.source_hash
 
         yield SuccessExtra(
             source_path=function_rootdir,
             source_hash=source_hash,
             suffix=".zip",
-            byte_content=create_zip_in_memory(function_rootdir),
+            byte_content=archive.content,
             description="function code",
         )
         name = item.get("name")
@@ -266,10 +316,8 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
 
     @classmethod
     def _create_hash_values(cls, function_rootdir: Path) -> str:
-        root_hash = calculate_directory_hash(
-            function_rootdir, exclude_prefixes={".DS_Store"}, ignore_files={".pyc"}, shorten=True
-        )
-        hash_value = f"/={root_hash}"
+        archive = cls._package_function(function_rootdir)
+        hash_value = f"/={archive.code_hash}"
         to_search = [function_rootdir]
         while to_search:
             search_dir = to_search.pop()
@@ -281,13 +329,148 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
                     continue
                 elif file.is_file() and file.name == ".DS_Store":
                     continue
-                file_hash = calculate_hash(file, shorten=True)
-                new_entry = f"{file.relative_to(function_rootdir).as_posix()}={file_hash}"
+                relative_path = file.relative_to(function_rootdir).as_posix()
+                file_hash = archive.file_hash_by_path.get(relative_path) or calculate_hash(file, shorten=True)
+                new_entry = f"{relative_path}={file_hash}"
                 if len(hash_value) + len(new_entry) > (cls.metadata_value_limit - 1):
                     break
                 hash_value += f";{new_entry}"
         return hash_value
 
+    @classmethod
+    def _package_function(cls, function_rootdir: Path) -> _FunctionArchive:
+        """Zips and hashes the function code in a single pass over the function directory.
+
+        The result is cached by the path, modification time, size and mode of the files, so unchanged
+        function directories are only read once. With the function-archive-cache alpha flag, the cache
+        is also stored in the user's cache directory and reused between runs.
+
+        Args:
+            function_rootdir: The function code directory.
+
+        Returns:
+            The function archive.
+        """
+        # Same order as calculate_directory_hash, such that the hashes match.
+        paths = sorted(function_rootdir.rglob("*"), key=lambda p: str(p.relative_to(function_rootdir)))
+        files = [path for path in paths if not path.is_dir()]
+        stat_by_file = {file: file.stat() for file in files}
+        signature: _DirectorySignature = tuple(
+            (file.relative_to(function_rootdir).as_posix(), stat.st_mtime_ns, stat.st_size, stat.st_mode)
+            for file, stat in stat_by_file.items()
+        )
+        key = function_rootdir.resolve()
+        if cached := cls._get_cached_archive(key, signature):
+            return cached
+
+        source_hash = hashlib.sha256()
+        code_hash = hashlib.sha256()
+        file_hash_by_path: dict[str, str] = {}
+        buffer = BytesIO()
+        with ZipFile(buffer, "w") as zip_file:
+            for directory in (path for path in paths if path.is_dir()):
+                # Add directory entries to preserve directory structure, including empty ones.
+                info = ZipInfo(f"{directory.relative_to(function_rootdir).as_posix()}/", date_time=_ZIP_TIMESTAMP)
+                info.external_attr = (directory.stat().st_mode & 0xFFFF) << 16 | 0x10
+                zip_file.writestr(info, b"")
+            for file in files:
+                relative_path = file.relative_to(function_rootdir).as_posix()
+                content = file.read_bytes()
+                info = ZipInfo(relative_path, date_time=_ZIP_TIMESTAMP)
+                # Keep the file permissions, for example, executable scripts.
+                info.external_attr = (stat_by_file[file].st_mode & 0xFFFF) << 16
+                zip_file.writestr(info, content)
+
+                is_code = file.suffix != ".pyc" and not file.name.startswith(".DS_Store")
+                for hash_ in [source_hash, code_hash] if is_code else [source_hash]:
+                    hash_.update(relative_path.encode("utf-8"))
+                    for start in range(0, len(content), 8192):
+                        # Get rid of Windows line endings to make the hash consistent across platforms.
+                        hash_.update(content[start : start + 8192].replace(b"\r\n", b"\n"))
+                if file.suffix == ".zip":
+                    file_hash_by_path[relative_path] = calculate_hash(file, shorten=True)
+                else:
+                    file_hash_by_path[relative_path] = calculate_hash(content.replace(b"\r\n", b"\n"), shorten=True)
+
+        archive = _FunctionArchive(
+            content=buffer.getvalue(),
+            source_hash=source_hash.hexdigest(),
+            code_hash=code_hash.hexdigest()[:8],
+            file_hash_by_path=file_hash_by_path,
+        )
+        cls._cache_archive(key, signature, archive)
+        return archive
+
+    @classmethod
+    def archive_cache_dir(cls) -> Path:
+        """The location of the function archives that are reused between runs, in the user's cache directory."""
+        return LookUpCache.default_filepath().with_name("function-archives")
+
+    @classmethod
+    def _get_cached_archive(cls, key: Path, signature: _DirectorySignature) -> _FunctionArchive | None:
+        with cls._archive_lock:
+            if (cached := cls._archive_by_directory.get(key)) and cached[0] == signature:
+                cls._archive_by_directory.move_to_end(key)
+                return cached[1]
+        if not Flags.FUNCTION_ARCHIVE_CACHE.is_enabled():
+            return None
+        metadata_path, archive_path = cls._archive_cache_paths(key)
+        try:
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            if tuple(tuple(entry) for entry in metadata["signature"]) != signature:
+                return None
+            archive = _FunctionArchive(
+                content=archive_path.read_bytes(),
+                source_hash=metadata["sourceHash"],
+                code_hash=metadata["codeHash"],
+                file_hash_by_path=metadata["fileHashByPath"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or corrupt cache entry only means the function code is zipped again.
+            return None
+        cls._cache_archive(key, signature, archive, persist=False)
+        return archive
+
+    @classmethod
+    def _cache_archive(
+        cls, key: Path, signature: _DirectorySignature, archive: _FunctionArchive, persist: bool = True
+    ) -> None:
+        with cls._archive_lock:
+            cls._archive_by_directory[key] = signature, archive
+            cls._archive_by_directory.move_to_end(key)
+            while len(cls._archive_by_directory) > cls._MAX_CACHED_ARCHIVES:
+                cls._archive_by_directory.popitem(last=False)
+        if not (persist and Flags.FUNCTION_ARCHIVE_CACHE.is_enabled()):
+            return
+        metadata_path, archive_path = cls._archive_cache_paths(key)
+        try:
+            metadata_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files and replace, such that a concurrent run never reads a partial file.
+            # The archive is written first, such that the metadata never points to an outdated archive.
+            for path, content in [
+                (archive_path, archive.content),
+                (metadata_path, json.dumps(archive.dump(signature)).encode("utf-8")),
+            ]:
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(content)
+                tmp_path.replace(path)
+            # Keep only the most recently written archives.
+            metadata_paths = sorted(
+                metadata_path.parent.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True
+            )
+            for outdated in metadata_paths[cls._MAX_CACHED_ARCHIVES :]:
+                outdated.unlink(missing_ok=True)
+                outdated.with_suffix(".zip").unlink(missing_ok=True)
+        except OSError:
+            # Failing to store the archive only means the function code is zipped again in the next run.
+            pass
+
+    @classmethod
+    def _archive_cache_paths(cls, key: Path) -> tuple[Path, Path]:
+        name = hashlib.sha256(key.as_posix().encode("utf-8")).hexdigest()[:16]
+        cache_dir = cls.archive_cache_dir()
+        return cache_dir / f"{name}.json", cache_dir / f"{name}.zip"
+
     def get_function_required_capabilities(
         self, items: Sequence[FunctionRequest] | None, read_only: bool
     ) -> list[cap.Capability]:
@@ -347,6 +530,22 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
         if item.secrets:
             yield from item.secrets.values()
 
+    def prepare_dump(self, resources: Sequence[FunctionResponse]) -> None:
+        file_ids = {
+            resource.file_id
+            for resource in resources
+            if resource.file_id is not None and resource.file_id not in self._code_file_by_id
+        }
+        if not file_ids:
+            return
+        code_files = self.client.tool.filemetadata.retrieve(
+            InternalId.from_ids(list(file_ids)), ignore_unknown_ids=True
+        )
+        self._code_file_by_id.update({code_file.id: code_file for code_file in code_files})
+        if data_set_ids := list({code_file.data_set_id for code_file in code_files if code_file.data_set_id}):
+            # Populates the lookup cache, such that dump_resource does not look up the data sets one by one.
+            self.client.lookup.data_sets.external_id(data_set_ids)
+
     def dump_resource(self, resource: FunctionResponse, local: dict[str, Any] | None = None) -> dict[str, Any]:
         if resource.status == "Failed":
             dumped = self.dump_id(ExternalId(external_id=resource.external_id or resource.name))
@@ -386,7 +585,9 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
 
         if file_id := dumped.pop("fileId", None):
             # The fileId is not part of the write object.
-            function_zip_file = self.client.files.retrieve(id=file_id)
+            if file_id not in self._code_file_by_id:
+                self.prepare_dump([resource])
+            function_zip_file = self._code_file_by_id.get(file_id)
             if function_zip_file and (data_set_id := function_zip_file.data_set_id):
                 dumped["dataSetExternalId"] = self.client.lookup.data_sets.external_id(data_set_id)
             if function_zip_file and function_zip_file.instance_id is not None:
@@ -442,35 +643,22 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
     def _legacy_create(self, items: Sequence[FunctionRequest]) -> list[FunctionResponse]:
         if self.resource_build_path is None:
             raise ValueError("build_path must be set to compare functions as function code must be compared.")
-        created: list[FunctionResponse] = []
-        for item in items:
-            external_id = item.external_id or item.name
-            file_id = self._upload_function_code(external_id, item)
-            failed_upload, elapsed_time = self.client.tool.filemetadata.await_file_uploaded(
-                [file_id], timeout_seconds=self._file_upload_timeout_seconds
-            )
-            if file_id in failed_upload:
-                raise ResourceCreationError(
-                    f"Failed to create function {external_id}. CDF API timed out after {elapsed_time:.0f} "
-                    "seconds while waiting for the function code to be uploaded. Wait and try again.\nIf the"
-                    " problem persists, please contact Cognite support."
-                    "You can increase the timeout by setting the 'file_upload_timeout_seconds' parameter in "
-                    f"the CDF TOML configuration file. Current value: {self._file_upload_timeout_seconds} seconds."
-                )
-
+        if not items:
+            return []
+        external_ids = [item.external_id or item.name for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._MAX_UPLOAD_WORKERS, len(items))) as executor:
+            file_ids = list(executor.map(self._upload_function_code, external_ids, items))
+        to_create: list[tuple[str, InternalId, FunctionRequest, FunctionRequest]] = []
+        for external_id, file_id, item in zip(external_ids, file_ids, items):
             # Create a copy with the file_id set
             item_to_create = FunctionRequest.model_validate({**item.dump(), "fileId": file_id.id})
-            result = self.client.tool.functions.create([item_to_create])
-            if result:
-                created_item = result[0]
-                self._warn_if_cpu_or_memory_changed(created_item, item)
-                created.append(created_item)
-        return created
+            to_create.append((external_id, file_id, item_to_create, item))
+        return self._create_when_uploaded(to_create)
 
     def _create_with_fileio(self, items: Sequence[FunctionRequest]) -> list[FunctionResponse]:
         cognite_files, filemetadata_files = self._as_file_by_external_id(items)
         file_id_by_external_id = self._upload_files(cognite_files, filemetadata_files)
-        created: list[FunctionResponse] = []
+        to_create: list[tuple[str, InternalId, FunctionRequest, FunctionRequest]] = []
         for item in items:
             external_id = item.as_id().external_id
             file_id = file_id_by_external_id.get(external_id)
@@ -479,9 +667,49 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
                     f"Failed to find uploaded file for function {external_id}. This is required to create the function. "
                     "Wait and try again.\nIf the problem persists, please contact Cognite support."
                 )
-            failed_upload, elapsed_time = self.client.tool.filemetadata.await_file_uploaded(
-                [file_id], timeout_seconds=self._file_upload_timeout_seconds
-            )
+            # Create a copy with the file_id set
+            item_to_create = item.model_copy(update={"fileId": file_id.id})
+            to_create.append((external_id, file_id, item_to_create, item))
+        return self._create_when_uploaded(to_create)
+
+    def _create_when_uploaded(
+        self, to_create: Sequence[tuple[str, InternalId, FunctionRequest, FunctionRequest]]
+    ) -> list[FunctionResponse]:
+        """Creates the functions as soon as their code files are marked as uploaded.
+
+        The upload status of all the code files is polled together, and the functions whose files are ready
+        are created while waiting for the rest.
+
+        Args:
+            to_create: The external ID, the code file ID, the function with the file ID set, and the original
+                function for each function to create.
+
+        Returns:
+            The created functions.
+        """
+        created: list[FunctionResponse] = []
+        created_file_ids: set[InternalId] = set()
+
+        def create_uploaded(uploaded: set[InternalId]) -> None:
+            ready = [
+                (item_to_create, item)
+                for _, file_id, item_to_create, item in to_create
+                if file_id in uploaded and file_id not in created_file_ids
+            ]
+            created_file_ids.update(uploaded)
+            if not ready:
+                return
+            result = self.client.tool.functions.create([item_to_create for item_to_create, _ in ready])
+            for created_item, (_, item) in zip(result, ready):
+                self._warn_if_cpu_or_memory_changed(created_item, item)
+                created.append(created_item)
+
+        file_ids = [file_id for _, file_id, _, _ in to_create]
+        failed_upload, elapsed_time = self.client.tool.filemetadata.await_file_uploaded(
+            file_ids, timeout_seconds=self._file_upload_timeout_seconds, on_uploaded=create_uploaded
+        )
+        create_uploaded(set(file_ids) - failed_upload)
+        for external_id, file_id, _, _ in to_create:
             if file_id in failed_upload:
                 raise ResourceCreationError(
                     f"Failed to create function {external_id}. CDF API timed out after {elapsed_time:.0f} "
@@ -490,14 +718,6 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
                     "You can increase the timeout by setting the 'file_upload_timeout_seconds' parameter in "
                     f"the CDF TOML configuration file. Current value: {self._file_upload_timeout_seconds} seconds."
                 )
-
-            # Create a copy with the file_id set
-            item_to_create = item.model_copy(update={"fileId": file_id.id})
-            result = self.client.tool.functions.create([item_to_create])
-            if result:
-                created_item = result[0]
-                self._warn_if_cpu_or_memory_changed(created_item, item)
-                created.append(created_item)
         return created
 
     def _as_file_by_external_id(self, items: Sequence[FunctionRequest]) -> tuple[dict[Path, str], dict[Path, str]]:
@@ -560,26 +780,24 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
                 "This is used to set the NodeId of the CogniteFile created for the function code."
             )
 
-        with create_temporary_zip(function_rootdir, "function.zip") as zip_path:
-            if space:
-                cognite_file = CogniteFileApply(
-                    space=space,
-                    external_id=external_id,
-                    name=f"{sanitize_filename(item.name)}.zip",
-                    mime_type="application/zip",
-                )
-                _ = self.client.data_modeling.instances.apply(cognite_file, replace=True)
-                upload_file = self.client.files.upload_content_bytes(
-                    zip_path.read_bytes(), instance_id=cognite_file.as_id()
-                )
-            else:
-                upload_file = self.client.files.upload_bytes(
-                    zip_path.read_bytes(),
-                    name=f"{sanitize_filename(item.name)}.zip",
-                    external_id=external_id,
-                    overwrite=True,
-                    data_set_id=data_set_id,
-                )
+        archive = self._package_function(function_rootdir)
+        if space:
+            cognite_file = CogniteFileApply(
+                space=space,
+                external_id=external_id,
+                name=f"{sanitize_filename(item.name)}.zip",
+                mime_type="application/zip",
+            )
+            _ = self.client.data_modeling.instances.apply(cognite_file, replace=True)
+            upload_file = self.client.files.upload_content_bytes(archive.content, instance_id=cognite_file.as_id())
+        else:
+            upload_file = self.client.files.upload_bytes(
+                archive.content,
+                name=f"{sanitize_filename(item.name)}.zip",
+                external_id=external_id,
+                overwrite=True,
+                data_set_id=data_set_id,
+            )
         return InternalId(id=upload_file.id)
 
     @staticmethod
@@ -618,6 +836,7 @@ class FunctionIO(ResourceIO[ExternalId, FunctionRequest, FunctionResponse]):
         functions = self.retrieve(ids)
 
         self.client.tool.functions.delete(list(ids), ignore_unknown_ids=True)
+        self.client.lookup.functions.invalidate_identifiers(ids)
         file_ids = {func.file_id for func in functions if func.file_id}
         files = self.client.files.retrieve_multiple(list(file_ids), ignore_unknown_ids=True)
         dm_file_nodes: set[dm.NodeId] = set()
@@ -764,9 +983,11 @@ class FunctionScheduleIO(ResourceIO[FunctionScheduleId, FunctionScheduleRequest,
         function_external_ids = [ExternalId(external_id=ext_id) for ext_id in names_by_function]
         functions = FunctionIO(self.client, None, None).retrieve(function_external_ids)
         schedules: list[FunctionScheduleResponse] = []
+        if not functions:
+            return schedules
+        function_schedules = self.client.tool.functions.schedules.list()
         for func in functions:
             func_external_id = cast(str, func.external_id)
-            function_schedules = self.client.tool.functions.schedules.list()
             for schedule in function_schedules:
                 if schedule.function_id == func.id:
                     schedule.function_external_id = func_external_id
@@ -190,6 +190,7 @@ class HostedExtractorDestinationIO(
     _doc_base_url = "https://api-docs.cognite.com/20230101-alpha/tag/"
     _doc_url = "Destinations/operation/create_destinations"
     yaml_cls = HostedExtractorDestinationYAML
+    prefetch_lookups = frozenset({"data_sets"})
 
     def __init__(self, client: ToolkitClient, build_dir: Path | None, console: Console | None = None):
         super().__init__(client, build_dir, console)
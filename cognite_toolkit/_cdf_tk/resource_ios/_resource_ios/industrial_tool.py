@@ -56,6 +56,7 @@ class StreamlitIO(ResourceIO[ExternalId, StreamlitRequest, StreamlitResponse]):
     _doc_url = "Files/operation/initFileUpload"
     _metadata_hash_key = "cdf-toolkit-app-hash"
     yaml_cls = StreamlitYAML
+    prefetch_lookups = frozenset({"data_sets"})
 
     extra_kinds = frozenset({FileMetadataCRUD.kind})
 
@@ -54,6 +54,7 @@ class LocationFilterIO(ResourceIO[ExternalId, LocationFilterRequest, LocationFil
         }
     )
     kind = "LocationFilter"
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_base_url = "https://api-docs.cogheim.net/redoc/#tag/"
     _doc_url = "Location-Filters/operation/createLocationFilter"
 
@@ -219,6 +220,7 @@ class LocationFilterIO(ResourceIO[ExternalId, LocationFilterRequest, LocationFil
             return 0
         ids = [InternalId(id=loc.id) for loc in locations]
         self.client.tool.location_filters.delete(ids)
+        self.client.lookup.location_filters.invalidate_identifiers([*external_ids, *ids])
         return len(ids)
 
     def _iterate(
@@ -50,6 +50,7 @@ from .auth import GroupAllScopedCRUD
 @final
 class RawDatabaseCRUD(ResourceContainerIO[RawDatabaseId, RAWDatabaseRequest, RAWDatabaseResponse]):
     item_name = "raw tables"
+    drop_data_chunk_size = 1
     folder_name = "raw"
     resource_cls = RAWDatabaseResponse
     resource_write_cls = RAWDatabaseRequest
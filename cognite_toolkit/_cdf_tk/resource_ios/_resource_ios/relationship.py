@@ -31,6 +31,7 @@ class RelationshipIO(ResourceIO[ExternalId, RelationshipRequest, RelationshipRes
     kind = "Relationship"
     yaml_cls = RelationshipYAML
     dependencies = frozenset({DataSetsIO, AssetIO, EventIO, SequenceIO, FileMetadataCRUD, TimeSeriesCRUD, LabelIO})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Relationships/operation/createRelationships"
 
     @property
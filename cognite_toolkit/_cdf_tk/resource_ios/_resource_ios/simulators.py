@@ -60,6 +60,7 @@ class SimulatorModelIO(ResourceIO[ExternalId, SimulatorModelRequest, SimulatorMo
     yaml_cls = SimulatorModelYAML
     kind = "SimulatorModel"
     dependencies = frozenset({DataSetsIO})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Simulator-Models/operation/create_simulator_model_simulators_models_post"
 
     @property
@@ -35,8 +35,10 @@ class ThreeDModelCRUD(ResourceContainerIO[NameId, ThreeDModelClassicRequest, Thr
     kind = "3DModel"
     yaml_cls = ThreeDModelYAML
     dependencies = frozenset({DataSetsIO})
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "3D-Models/operation/create3DModels"
     item_name = "revisions"
+    drop_data_chunk_size = 1
 
     @property
     def display_name(self) -> str:
@@ -51,12 +51,14 @@ from .datamodel import NodeCRUD
 @final
 class TimeSeriesCRUD(ResourceContainerIO[ExternalId, TimeSeriesRequest, TimeSeriesResponse]):
     item_name = "datapoints"
+    drop_data_chunk_size = 10
     folder_name = "timeseries"
     resource_cls = TimeSeriesResponse
     resource_write_cls = TimeSeriesRequest
     yaml_cls = TimeSeriesYAML
     kind = "TimeSeries"
     dependencies = frozenset({DataSetsIO, GroupAllScopedCRUD, AssetIO})
+    prefetch_lookups = frozenset({"data_sets", "security_categories"})
     _doc_url = "Time-series/operation/postTimeSeries"
 
     @property
@@ -152,6 +154,7 @@ class TimeSeriesCRUD(ResourceContainerIO[ExternalId, TimeSeriesRequest, TimeSeri
         if not ids:
             return 0
         self.client.tool.timeseries.delete(list(ids), ignore_unknown_ids=True)
+        self.client.lookup.time_series.invalidate_identifiers(ids)
         return len(ids)
 
     def _iterate(
@@ -200,6 +203,7 @@ class DatapointSubscriptionIO(
     _doc_url = "Data-point-subscriptions/operation/postSubscriptions"
     dependencies = frozenset({TimeSeriesCRUD, GroupAllScopedCRUD, NodeCRUD})
     yaml_cls = DatapointSubscriptionYAML
+    prefetch_lookups = frozenset({"data_sets"})
 
     _hash_key = "cdf-hash"
     _description_character_limit = 1000
@@ -28,10 +28,12 @@
 
 import random
 import re
+import threading
 import time
 import warnings
 from collections import defaultdict
 from collections.abc import Callable, Hashable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast, final
@@ -167,6 +169,7 @@ class TransformationIO(ResourceIO[ExternalId, TransformationRequest, Transformat
             *({ExternalDataSourceIO} if FeatureFlag.is_enabled(Flags.EXTERNAL_DATA_SOURCES) else set()),
         }
     )
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_url = "Transformations/operation/createTransformations"
     _hash_key = "-- cdf-auth"
 
@@ -174,12 +177,18 @@ class TransformationIO(ResourceIO[ExternalId, TransformationRequest, Transformat
     # however, when the transformation has credentials, the session API times out on
     # larger number of transformations. Thus, we use a conservative batch size.
     _BATCH_SIZE = 20  # The maximum number of transformations to create in a single batch
+    # Each session is created with a separate request, so we create the sessions for a batch concurrently.
+    _MAX_SESSION_WORKERS = 8
 
     def __init__(self, client: ToolkitClient, build_dir: Path | None, console: Console | None = None):
         super().__init__(client, build_dir, console)
         self._authentication_by_id_operation: dict[
             tuple[str, Literal["read", "write"]], OidcCredentials | ClientCredentials
         ] = {}
+        # OIDC credentials can point to another project, these need a separate client to create the session.
+        # Many transformations typically share the same credentials, so we reuse the client for each set.
+        self._session_client_by_credentials: dict[tuple[str | None, ...], ToolkitClient] = {}
+        self._session_client_lock = threading.Lock()
 
     @property
     def display_name(self) -> str:
@@ -662,17 +671,32 @@ class TransformationIO(ResourceIO[ExternalId, TransformationRequest, Transformat
         time.sleep(sleep_time)
 
     def _update_nonce(self, items: Sequence[TransformationRequest]) -> None:
+        missing_nonces: list[tuple[TransformationRequest, Literal["read", "write"]]] = []
+        credentials: list[OidcCredentials | ClientCredentials] = []
         for item in items:
             if not item.external_id:
                 raise ToolkitRequiredValueError("Transformation must have external_id set.")
             if item.source_nonce is None and (
                 read_credentials := self._authentication_by_id_operation.get((item.external_id, "read"))
             ):
-                item.source_nonce = self._create_nonce(read_credentials)
+                missing_nonces.append((item, "read"))
+                credentials.append(read_credentials)
             if item.destination_nonce is None and (
                 write_credentials := self._authentication_by_id_operation.get((item.external_id, "write"))
             ):
-                item.destination_nonce = self._create_nonce(write_credentials)
+                missing_nonces.append((item, "write"))
+                credentials.append(write_credentials)
+        if not credentials:
+            return
+        # A nonce can only be bound once, so each transformation needs its own session even when
+        # the credentials are the same.
+        with ThreadPoolExecutor(max_workers=min(self._MAX_SESSION_WORKERS, len(credentials))) as executor:
+            nonces = list(executor.map(self._create_nonce, credentials))
+        for (item, operation), nonce in zip(missing_nonces, nonces):
+            if operation == "read":
+                item.source_nonce = nonce
+            else:
+                item.destination_nonce = nonce
 
     def _create_nonce(self, credentials: OidcCredentials | ClientCredentials) -> NonceCredentials:
         if isinstance(credentials, ClientCredentials):
@@ -684,10 +708,7 @@ class TransformationIO(ResourceIO[ExternalId, TransformationRequest, Transformat
                 client_id=credentials.client_id,
             )
         elif isinstance(credentials, OidcCredentials):
-            config = deepcopy(self.client.config)
-            config.project = credentials.cdf_project_name
-            config.credentials = credentials.as_credential_provider()
-            other_client = ToolkitClient(config)
+            other_client = self._get_session_client(credentials)
             session = other_client.iam.sessions.create(credentials.as_client_credentials())
             nonce = NonceCredentials(
                 session_id=session.id,
@@ -699,6 +720,24 @@ class TransformationIO(ResourceIO[ExternalId, TransformationRequest, Transformat
             raise ValueError(f"Error in TransformationLoader: {type(credentials)} is not a valid credentials type")
         return nonce
 
+    def _get_session_client(self, credentials: OidcCredentials) -> ToolkitClient:
+        scopes = credentials.scopes if isinstance(credentials.scopes, str | None) else " ".join(credentials.scopes)
+        key = (
+            credentials.cdf_project_name,
+            credentials.client_id,
+            credentials.client_secret,
+            credentials.token_uri,
+            scopes,
+            credentials.audience,
+        )
+        with self._session_client_lock:
+            if key not in self._session_client_by_credentials:
+                config = deepcopy(self.client.config)
+                config.project = credentials.cdf_project_name
+                config.credentials = credentials.as_credential_provider()
+                self._session_client_by_credentials[key] = ToolkitClient(config)
+            return self._session_client_by_credentials[key]
+
     def _iterate(
         self,
         data_set_external_id: str | None = None,
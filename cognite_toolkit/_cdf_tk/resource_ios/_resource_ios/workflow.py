@@ -90,6 +90,7 @@ class WorkflowIO(ResourceIO[ExternalId, WorkflowRequest, WorkflowResponse]):
         }
     )
     yaml_cls = WorkflowYAML
+    prefetch_lookups = frozenset({"data_sets"})
     _doc_base_url = "https://api-docs.cognite.com/20230101-beta/tag/"
     _doc_url = "Workflows/operation/CreateOrUpdateWorkflow"
 
@@ -147,13 +147,16 @@ class ResourceWorker(Generic[T_Identifier, T_RequestResource, T_ResponseResource
     ) -> CategorizedResources[T_Identifier, T_RequestResource]:
         resources: CategorizedResources[T_Identifier, T_RequestResource] = CategorizedResources()
         cdf_resource_by_id = {self.loader.get_id(resource): resource for resource in cdf_resources}
+        self.loader.prepare_dump(
+            [cdf_resource_by_id[identifier] for identifier in local_by_id if identifier in cdf_resource_by_id]
+        )
         for identifier, (local_dict, local_resource) in local_by_id.items():
             cdf_resource = cdf_resource_by_id.get(identifier)
             if cdf_resource is None:
                 resources.to_create.append(local_resource)
                 continue
             cdf_dict = self.loader.dump_resource(cdf_resource, local_dict)
-            if not force_update and cdf_dict == local_dict:
+            if not force_update and self.loader.is_unchanged(cdf_dict, local_dict):
                 resources.unchanged.append(local_resource)
                 continue
             if self.loader.support_update:
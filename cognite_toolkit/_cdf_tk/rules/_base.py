@@ -55,6 +55,11 @@ class ToolkitGlobalRuleSet(ABC):
 
     CODE_PREFIX: ClassVar[str]
     DISPLAY_NAME: ClassVar[str]
+    # The CODE_PREFIX of the rule sets that must finish before this rule set runs.
+    DEPENDS_ON: ClassVar[frozenset[str]] = frozenset()
+    # Whether the rule set can run concurrently with other rule sets. Rule sets that
+    # modify shared state, for example, the built modules, must set this to False.
+    IS_THREAD_SAFE: ClassVar[bool] = True
 
     def __init__(self, modules: list[BuiltModule], client: ToolkitClient | None = None) -> None:
         self.modules = modules
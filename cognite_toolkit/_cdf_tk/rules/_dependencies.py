@@ -1,6 +1,11 @@
+import threading
+import time
+import weakref
 from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
+from cognite_toolkit._cdf_tk.client import ToolkitClient
 from cognite_toolkit._cdf_tk.client._resource_base import Identifier
 from cognite_toolkit._cdf_tk.commands.build_v2.data_classes._build import BuiltResource
 from cognite_toolkit._cdf_tk.commands.build_v2.data_classes._insights import ConsistencyError, Insight
@@ -10,9 +15,51 @@ from cognite_toolkit._cdf_tk.utils.file import format_insight_source_file, relat
 from ._base import FailedValidation, RuleSetStatus, ToolkitGlobalRuleSet
 
 
+class _ExistenceCache:
+    """Remembers which resources exist in CDF, including the ones that are known to be missing.
+
+    Entries expire after the time to live, such that resources created or deleted outside Toolkit
+    are picked up by later builds.
+    """
+
+    ttl_seconds: float = 5 * 60
+
+    def __init__(self) -> None:
+        self._exists_by_key: dict[tuple[str, type[ResourceIO], Identifier], tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, project: str, crud_cls: type[ResourceIO], identifiers: Iterable[Identifier]
+    ) -> dict[Identifier, bool]:
+        """Returns whether the resources exist, for the identifiers that are cached."""
+        now = time.monotonic()
+        output: dict[Identifier, bool] = {}
+        with self._lock:
+            for identifier in identifiers:
+                cached = self._exists_by_key.get((project, crud_cls, identifier))
+                if cached is not None and now - cached[1] < self.ttl_seconds:
+                    output[identifier] = cached[0]
+        return output
+
+    def set(self, project: str, crud_cls: type[ResourceIO], exists_by_identifier: dict[Identifier, bool]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for identifier, exists in exists_by_identifier.items():
+                self._exists_by_key[(project, crud_cls, identifier)] = (exists, now)
+
+
 class DependencyRuleSet(ToolkitGlobalRuleSet):
     CODE_PREFIX = "MISSING-DEPENDENCY"
     DISPLAY_NAME = "dependencies"
+    DEPENDS_ON = frozenset()
+    # Only reads the built modules. The existence cache is shared between runs and guarded by a lock.
+    IS_THREAD_SAFE = True
+    _MAX_WORKERS = 8
+    # One cache per client, such that repeated builds in the same session, for example, in watch mode,
+    # do not look up the same resources again.
+    _existence_cache_by_client: "weakref.WeakKeyDictionary[ToolkitClient, _ExistenceCache]" = (
+        weakref.WeakKeyDictionary()
+    )
 
     def get_status(self) -> RuleSetStatus:
         if self.client is None:
@@ -36,21 +83,17 @@ class DependencyRuleSet(ToolkitGlobalRuleSet):
                         missing_locally_by_crud_cls[crud_cls][dependency_id].append(resource)
 
         if self.client:
+            missing_in_cdf_by_crud_cls = self._find_missing_in_cdf(self.client, missing_locally_by_crud_cls)
             for crud_cls, expected_by_identifier in missing_locally_by_crud_cls.items():
-                crud = crud_cls(self.client, None, None)
-                display_name = crud.display_name
-                existing_in_cdf = {
-                    crud.get_id(cdf_item) for cdf_item in crud.retrieve(list(expected_by_identifier.keys()))
-                }
-                if missing := set(expected_by_identifier.keys()) - existing_in_cdf:
-                    for identifier in missing:
-                        referencing_resources = expected_by_identifier[identifier]
-                        yield ConsistencyError(
-                            code=f"{self.CODE_PREFIX}-CDF",
-                            message=f"Broken reference to {display_name} with id [bold]{identifier}[/]",
-                            fix=f"Ensure that {display_name} exists or remove the reference to it.",
-                            source_file=self._source_files_for_resources(referencing_resources),
-                        )
+                display_name = crud_cls(self.client, None, None).display_name
+                for identifier in missing_in_cdf_by_crud_cls[crud_cls]:
+                    referencing_resources = expected_by_identifier[identifier]
+                    yield ConsistencyError(
+                        code=f"{self.CODE_PREFIX}-CDF",
+                        message=f"Broken reference to {display_name} with id [bold]{identifier}[/]",
+                        fix=f"Ensure that {display_name} exists or remove the reference to it.",
+                        source_file=self._source_files_for_resources(referencing_resources),
+                    )
         else:
             for crud_cls, expected_by_identifier in missing_locally_by_crud_cls.items():
                 resource_type_name = f"{crud_cls.kind.lower()} ({crud_cls.folder_name})"
@@ -64,6 +107,38 @@ class DependencyRuleSet(ToolkitGlobalRuleSet):
                         source_file=self._source_files_for_resources(expected_resources),
                     )
 
+    def _find_missing_in_cdf(
+        self,
+        client: ToolkitClient,
+        expected_by_crud_cls: dict[type[ResourceIO], dict[Identifier, list[BuiltResource]]],
+    ) -> dict[type[ResourceIO], set[Identifier]]:
+        """Looks up the expected resources in CDF, concurrently across resource types.
+
+        Returns:
+            The identifiers that do not exist in CDF by resource type.
+        """
+        cache = self._existence_cache_by_client.setdefault(client, _ExistenceCache())
+        project = client.config.project
+
+        def find_missing(crud_cls: type[ResourceIO], identifiers: list[Identifier]) -> set[Identifier]:
+            exists_by_identifier = cache.get(project, crud_cls, identifiers)
+            if to_lookup := [identifier for identifier in identifiers if identifier not in exists_by_identifier]:
+                crud = crud_cls(client, None, None)
+                existing_in_cdf = {crud.get_id(cdf_item) for cdf_item in crud.retrieve(to_lookup)}
+                looked_up = {identifier: identifier in existing_in_cdf for identifier in to_lookup}
+                cache.set(project, crud_cls, looked_up)
+                exists_by_identifier.update(looked_up)
+            return {identifier for identifier, exists in exists_by_identifier.items() if not exists}
+
+        if not expected_by_crud_cls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self._MAX_WORKERS, len(expected_by_crud_cls))) as executor:
+            futures = {
+                crud_cls: executor.submit(find_missing, crud_cls, list(expected_by_identifier.keys()))
+                for crud_cls, expected_by_identifier in expected_by_crud_cls.items()
+            }
+            return {crud_cls: future.result() for crud_cls, future in futures.items()}
+
     def _source_files_for_resources(self, resources: list[BuiltResource]) -> str:
         unique_paths = list(dict.fromkeys(format_insight_source_file(resource.source_path) for resource in resources))
         return ", ".join(unique_paths)
@@ -15,6 +15,9 @@ from cognite_toolkit._cdf_tk.yaml_classes.functions import FunctionsYAML
 class FunctionRules(ToolkitGlobalRuleSet):
     CODE_PREFIX = "FUNCTION"
     DISPLAY_NAME = "Functions checks"
+    DEPENDS_ON = frozenset()
+    # Only reads the built function files. The requirements are validated in a separate pip process.
+    IS_THREAD_SAFE = True
 
     def get_status(self) -> RuleSetStatus:
         if not self.client:
@@ -35,6 +35,9 @@ _DEFAULT_ASSET_VIEW_ID = ViewId(space="cdf_cdm", external_id="CogniteAsset", ver
 class InFieldCDMViewPropertiesRuleSet(ToolkitGlobalRuleSet):
     CODE_PREFIX = "INFIELD-CDM"
     DISPLAY_NAME = "InField CDM view properties"
+    DEPENDS_ON = frozenset()
+    # Only reads the built location configs and retrieves the referenced views.
+    IS_THREAD_SAFE = True
 
     def get_status(self) -> RuleSetStatus:
         if not self.client:
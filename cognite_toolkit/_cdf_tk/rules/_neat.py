@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 class NeatRuleSet(ToolkitGlobalRuleSet):
     CODE_PREFIX = "NEAT"
     DISPLAY_NAME = "Neat (data modeling)"
+    DEPENDS_ON = frozenset()
+    # Only reads the built data model files, and fetches the CDF snapshot with its own Neat client.
+    IS_THREAD_SAFE = True
 
     def get_status(self) -> RuleSetStatus:
         if self.installed():
@@ -15,6 +15,7 @@ from .file import (
 )
 from .graphql_parser import GraphQLParser
 from .hashing import (
+    calculate_content_hash,
     calculate_directory_hash,
     calculate_hash,
     calculate_secure_hash,
@@ -36,6 +37,7 @@ __all__ = [
     "PipValidationResult",
     "YAMLComment",
     "YAMLWithComments",
+    "calculate_content_hash",
     "calculate_directory_hash",
     "calculate_hash",
     "calculate_secure_hash",
@@ -1,6 +1,12 @@
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable
 from functools import lru_cache
 from typing import ClassVar, Generic, Literal, TypeVar
+from weakref import WeakKeyDictionary
 
 from cognite.client.data_classes import (
     AssetFilter,
@@ -25,7 +31,6 @@ from cognite_toolkit._cdf_tk.utils.cdf import (
     metadata_key_counts,
     relationship_aggregate_count,
 )
-from cognite_toolkit._cdf_tk.utils.sql_parser import SQLParser
 
 T_CogniteFilter = TypeVar(
     "T_CogniteFilter",
@@ -34,6 +39,87 @@ T_CogniteFilter = TypeVar(
 )
 
 
+_DATA_SET_EXTERNAL_ID_PATTERN = re.compile(r"""dataset_id\((?:"([^"]*)"|'([^']*)')\)""")
+
+
+class TransformationUsageIndex:
+    """An in-memory index of the transformations in a project.
+
+    The transformations are listed once, and indexed by destination type and by the data sets their queries
+    reference. The index is shared by all aggregators of the same client, such that profiling several resource
+    types does not list and scan the transformations once per resource type. The transformations are listed
+    again when the index is older than the time to live, such that long sessions pick up changes.
+
+    Args:
+        client: The client to list the transformations with.
+    """
+
+    _by_client: ClassVar["WeakKeyDictionary[ToolkitClient, TransformationUsageIndex]"] = WeakKeyDictionary()
+    _by_client_lock: ClassVar[threading.Lock] = threading.Lock()
+    ttl_seconds: float = 5 * 60
+
+    def __init__(self, client: ToolkitClient) -> None:
+        self.client = client
+        self._lock = threading.Lock()
+        self._loaded_at: float | None = None
+        # The transformations by destination type, with the data set external IDs their query references.
+        self._by_destination: dict[str, list[tuple[Transformation, frozenset[str]]]] = {}
+
+    @classmethod
+    def get(cls, client: ToolkitClient) -> "TransformationUsageIndex":
+        """Returns the index shared by all aggregators of the given client."""
+        with cls._by_client_lock:
+            if client not in cls._by_client:
+                cls._by_client[client] = cls(client)
+            return cls._by_client[client]
+
+    def _load(self) -> dict[str, list[tuple[Transformation, frozenset[str]]]]:
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+                return self._by_destination
+            by_destination: dict[str, list[tuple[Transformation, frozenset[str]]]] = defaultdict(list)
+            for chunk in self.client.transformations(chunk_size=1000, limit=None):
+                for transformation in chunk:
+                    destination_type = transformation.destination.type if transformation.destination else None
+                    data_set_external_ids = frozenset(
+                        double_quoted or single_quoted
+                        for double_quoted, single_quoted in _DATA_SET_EXTERNAL_ID_PATTERN.findall(
+                            transformation.query or ""
+                        )
+                    )
+                    by_destination[destination_type or ""].append((transformation, data_set_external_ids))
+            self._by_destination = by_destination
+            self._loaded_at = time.monotonic()
+            return by_destination
+
+    def transformations(self, destination_types: Iterable[str]) -> list[Transformation]:
+        """Returns the transformations writing to any of the given destination types."""
+        by_destination = self._load()
+        return [
+            transformation
+            for destination_type in destination_types
+            for transformation, _ in by_destination.get(destination_type, [])
+        ]
+
+    def using_data_sets(
+        self, destination_types: Iterable[str], data_set_ids: list[int], data_set_external_ids: list[str]
+    ) -> list[Transformation]:
+        """Returns the transformations writing to any of the given destination types that use any of the data sets.
+
+        This gives the same result as SQLParser.is_using_data_set, without scanning every query for every data set.
+        """
+        by_destination = self._load()
+        external_ids = set(data_set_external_ids)
+        id_markers = [f"{data_set_id} " for data_set_id in data_set_ids]
+        return [
+            transformation
+            for destination_type in destination_types
+            for transformation, referenced_external_ids in by_destination.get(destination_type, [])
+            if not referenced_external_ids.isdisjoint(external_ids)
+            or any(marker in (transformation.query or "") for marker in id_markers)
+        ]
+
+
 class AssetCentricAggregator(ABC):
     _transformation_destination: ClassVar[tuple[str, ...]]
 
@@ -53,11 +139,7 @@ class AssetCentricAggregator(ABC):
 
     def transformation_count(self) -> int:
         """Returns the number of transformations associated with the resource."""
-        transformation_count = 0
-        for destination in self._transformation_destination:
-            for chunk in self.client.transformations(chunk_size=1000, destination_type=destination, limit=None):
-                transformation_count += len(chunk)
-        return transformation_count
+        return len(TransformationUsageIndex.get(self.client).transformations(self._transformation_destination))
 
     @abstractmethod
     def used_data_sets(self, hierarchy: str | None = None) -> list[str]:
@@ -67,15 +149,9 @@ class AssetCentricAggregator(ABC):
     def used_transformations(self, data_set_external_ids: list[str]) -> list[Transformation]:
         """Returns a list of transformations used by the resource."""
         data_set_ids = self.client.lookup.data_sets.id(data_set_external_ids, allow_empty=True)
-        found_transformations: list[Transformation] = []
-        for destination in self._transformation_destination:
-            for chunk in self.client.transformations(chunk_size=1000, destination_type=destination, limit=None):
-                for transformation in chunk:
-                    if SQLParser(transformation.query or "", operation="profiling").is_using_data_set(
-                        data_set_ids, data_set_external_ids
-                    ):
-                        found_transformations.append(transformation)
-        return found_transformations
+        return TransformationUsageIndex.get(self.client).using_data_sets(
+            self._transformation_destination, data_set_ids, data_set_external_ids
+        )
 
     @staticmethod
     def _to_unique_int_list(results: list) -> list[int]:
@@ -0,0 +1,85 @@
+"""JSON encoding and decoding for the high-volume data paths, such as NDJSON files and HTTP response bodies.
+
+orjson is used when it is installed, otherwise this falls back to the standard library json module. Both write
+compact JSON, i.e., `{"a":1}`, keep the key insertion order, write non-ASCII characters as is, and write dates
+and datetimes in ISO 8601 format. The only difference in the written JSON is the notation of some floats, for
+example, orjson writes `1e16` while the standard library writes `1e+16`. Both are read back as the same value.
+
+orjson does not support all values the standard library does. It reads integers wider than 64 bits as floats,
+fails to write them, and writes NaN and Infinity as null. JSON with such values is read and written with the
+standard library instead, such that the data is the same whether orjson is installed or not.
+"""
+
+import importlib.util
+import json
+import math
+import re
+from datetime import date, datetime
+from typing import Any
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+# Integers with 19 or more digits may not fit in 64 bits. Matching digits in strings as well only
+# means that the document is read with the standard library.
+_WIDE_INTEGER = re.compile(r"\d{19}")
+_WIDE_INTEGER_BYTES = re.compile(rb"\d{19}")
+
+
+class _DateTimeEncoder(json.JSONEncoder):
+    def default(self, obj: object) -> object:
+        if isinstance(obj, date | datetime):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def _stdlib_loads(data: str | bytes) -> Any:
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, cls=_DateTimeEncoder, separators=(",", ":"), ensure_ascii=False)
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, list | tuple):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+
+if HAS_ORJSON:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document."""
+        pattern = _WIDE_INTEGER_BYTES if isinstance(data, bytes | bytearray) else _WIDE_INTEGER
+        if pattern.search(data):  # type: ignore[arg-type]
+            # orjson reads integers wider than 64 bits as floats, which loses precision.
+            return _stdlib_loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # For example, NaN and Infinity, which the standard library accepts.
+            return _stdlib_loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string. Dates and datetimes are written in ISO 8601 format."""
+        try:
+            dumped = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # For example, integers wider than 64 bits.
+            return _stdlib_dumps(obj)
+        # orjson writes NaN and Infinity as null. Only documents with a null can contain them,
+        # so the object is only checked when there is one.
+        if b"null" in dumped and _has_non_finite_float(obj):
+            return _stdlib_dumps(obj)
+        return dumped.decode("utf-8")
+
+else:
+    loads = _stdlib_loads
+    dumps = _stdlib_dumps
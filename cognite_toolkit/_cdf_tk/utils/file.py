@@ -12,7 +12,7 @@ from collections import UserDict, defaultdict
 from collections.abc import Hashable, ItemsView, KeysView, ValuesView
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from io import BytesIO
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 from typing import Any, Literal, TypeVar, overload
 from zipfile import ZipFile
@@ -28,6 +28,7 @@ from cognite_toolkit._cdf_tk.exceptions import (
     ToolkitYAMLFormatError,
 )
 from cognite_toolkit._cdf_tk.tk_warnings import EnvironmentVariableMissingWarning, MediumSeverityWarning
+from cognite_toolkit._cdf_tk.utils.hashing import calculate_hash
 
 
 @overload
@@ -260,6 +261,45 @@ def safe_read(file: Path | str, encoding: str | None = None) -> str:
             raise
 
 
+@dataclass(frozen=True)
+class FileContent:
+    """The content of a file read once from disk.
+
+    The hash and the text are computed from the same buffer, such that a file is not read once
+    for hashing and once more for parsing.
+
+    Args:
+        filepath: The path the content was read from.
+        data: The raw bytes of the file.
+    """
+
+    filepath: Path
+    data: bytes
+
+    @classmethod
+    def read(cls, filepath: Path) -> "FileContent":
+        return cls(filepath=filepath, data=filepath.read_bytes())
+
+    def hash(self, shorten: bool = False) -> str:
+        """The same hash as calculate_hash(filepath)."""
+        if self.filepath.suffix == ".zip":
+            return calculate_hash(self.filepath, shorten=shorten)
+        return calculate_hash(self.data.replace(b"\r\n", b"\n"), shorten=shorten)
+
+    def text(self, encoding: str | None = None) -> str:
+        """The same text as safe_read(filepath, encoding)."""
+        encoding = encoding or CDFToml.load().cdf.file_encoding
+        try:
+            return self._decode(encoding)
+        except UnicodeDecodeError:
+            # Same fallback as in safe_read.
+            return self._decode("utf-8" if encoding is None else None)
+
+    def _decode(self, encoding: str | None) -> str:
+        # A text wrapper translates line endings the same way as reading the file in text mode.
+        return TextIOWrapper(BytesIO(self.data), encoding=encoding).read()
+
+
 def safe_write(file: Path, content: str, encoding: str | None = None) -> None:
     """Falls back on explicit using utf-8 if the default .write_text()"""
     try:
@@ -269,7 +309,62 @@ def safe_write(file: Path, content: str, encoding: str | None = None) -> None:
         file.write_text(content, encoding="utf-8")
 
 
+# Used to analyze how the pure Python emitter would write a string.
+_SCALAR_ANALYZER = yaml.emitter.Emitter(StringIO(), allow_unicode=True)
+# libyaml escapes characters outside the Basic Multilingual Plane, for example, emojis, while the
+# pure Python emitter writes them as is.
+_NON_BMP_CHARACTER = re.compile("[\U00010000-\U0010ffff]")
+
+
+def _requires_python_emitter(data: Any) -> bool:
+    """Whether the libyaml emitter could write the data differently from the pure Python emitter.
+
+    The two emitters differ in how they wrap long double-quoted strings, in how they write characters
+    outside the Basic Multilingual Plane and non-printable characters, such as the Unicode line breaks,
+    and in when empty and long keys are written as complex keys. Strings are double-quoted when they
+    contain special characters, such as tabs, or spaces next to line breaks. Multiline keys are
+    double-quoted as well.
+    """
+    if not isinstance(data, dict | list):
+        # The pure Python emitter ends documents with a single scalar with a document end marker.
+        return True
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            # Fast path, single line strings with only printable characters are written the same way.
+            if item.isprintable() and (item.isascii() or not _NON_BMP_CHARACTER.search(item)):
+                continue
+            if (
+                # The emitters disagree on how to write, for example, the Unicode line breaks NEL, LS and PS.
+                # Thus, only strings where newlines are the only non-printable characters are analyzed.
+                not item.replace("\n", "").isprintable()
+                or _NON_BMP_CHARACTER.search(item)
+                or not _SCALAR_ANALYZER.analyze_scalar(item).allow_single_quoted
+            ):
+                return True
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                if isinstance(key, str) and (
+                    not key.isprintable()
+                    # The emitters disagree on whether empty keys and keys close to 128 bytes are simple keys.
+                    or not key
+                    or len(key) >= 100
+                    or (len(key) >= 32 and not key.isascii())
+                ):
+                    return True
+                stack.append(key)
+                stack.append(value)
+        elif isinstance(item, list | tuple):
+            stack.extend(item)
+    return False
+
+
 def yaml_safe_dump(data: Any, sort_keys: bool = False, indent: int | None = None) -> str:
+    # The libyaml emitter is several times faster than the pure Python one, and writes the same output
+    # except for a few edge cases. Data with these edge cases uses the pure Python emitter.
+    if yaml.__with_libyaml__ and not _requires_python_emitter(data):
+        return yaml.dump(data, Dumper=yaml.CSafeDumper, sort_keys=sort_keys, allow_unicode=True, indent=indent)
     return yaml.safe_dump(data, sort_keys=sort_keys, allow_unicode=True, indent=indent)
 
 
@@ -1,10 +1,12 @@
-from ._base import CellValue, Chunk, DataType, PrimaryCellValue, SchemaColumn
+from ._base import CellValue, Chunk, ColumnBatch, DataType, PrimaryCellValue, SchemaColumn
 from ._compression import (
     COMPRESSION_BY_NAME,
     COMPRESSION_BY_SUFFIX,
     Compression,
     GzipCompression,
+    LZ4Compression,
     Uncompressed,
+    ZstdCompression,
 )
 from ._readers import (
     FILE_READ_CLS_BY_FORMAT,
@@ -40,12 +42,14 @@ __all__ = [
     "CSVWriter",
     "CellValue",
     "Chunk",
+    "ColumnBatch",
     "Compression",
     "DataType",
     "FailedParsing",
     "FileReader",
     "FileWriter",
     "GzipCompression",
+    "LZ4Compression",
     "MultiFileReader",
     "NDJsonReader",
     "NDJsonWriter",
@@ -58,4 +62,5 @@ __all__ = [
     "YAMLWriter",
     "YMLReader",
     "YMLWriter",
+    "ZstdCompression",
 ]
@@ -1,13 +1,18 @@
 from abc import ABC
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import IO, ClassVar, TypeAlias, TypeVar
+from typing import IO, TYPE_CHECKING, ClassVar, TypeAlias, TypeVar
 
 from cognite_toolkit._cdf_tk.utils.useful_types import DataType, JsonVal
 
+if TYPE_CHECKING:
+    import numpy as np
+
 PrimaryCellValue: TypeAlias = datetime | date | JsonVal
 CellValue: TypeAlias = PrimaryCellValue | list[PrimaryCellValue]
 Chunk: TypeAlias = dict[str, CellValue]
+ColumnValues: TypeAlias = "Sequence[CellValue] | np.ndarray"
 
 
 T_IO = TypeVar("T_IO", bound=IO)
@@ -30,3 +35,38 @@ class SchemaColumn:
     def __post_init__(self) -> None:
         if self.type == "json" and self.is_array:
             raise ValueError("JSON columns cannot be arrays. Use 'is_array=False' for JSON columns.")
+
+
+@dataclass(frozen=True)
+class ColumnBatch:
+    """A batch of table data stored column by column.
+
+    This is used by the columnar download path to avoid creating one dictionary per row. All columns
+    must have the same length.
+
+    Args:
+        columns: The column values by column name.
+    """
+
+    columns: Mapping[str, ColumnValues]
+
+    def __len__(self) -> int:
+        for values in self.columns.values():
+            return len(values)
+        return 0
+
+    def column_as_list(self, name: str) -> list[CellValue]:
+        """Get the values of a column as a list of Python objects. Missing columns are returned as nulls."""
+        if name not in self.columns:
+            return [None] * len(self)
+        import numpy as np
+
+        values = self.columns[name]
+        if isinstance(values, np.ndarray):
+            return values.tolist()
+        return list(values)
+
+    def to_rows(self) -> list[Chunk]:
+        """Convert the batch to a list of rows."""
+        names = list(self.columns.keys())
+        return [dict(zip(names, row)) for row in zip(*(self.column_as_list(name) for name in names))]
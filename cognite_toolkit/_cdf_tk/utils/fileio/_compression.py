@@ -1,11 +1,12 @@
 import gzip
+import importlib.util
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from io import TextIOWrapper
 from pathlib import Path
 from typing import ClassVar, Literal
 
-from cognite_toolkit._cdf_tk.exceptions import ToolkitValueError
+from cognite_toolkit._cdf_tk.exceptions import ToolkitMissingDependencyError, ToolkitValueError
 from cognite_toolkit._cdf_tk.utils import humanize_collection
 from cognite_toolkit._cdf_tk.utils._auxiliary import get_concrete_subclasses
 
@@ -15,15 +16,32 @@ class Compression(ABC):
     newline = "\n"
     name: ClassVar[str]
     file_suffix: ClassVar[str]
+    # The valid compression levels, None if the compression method does not have levels.
+    levels: ClassVar[range | None] = None
 
-    def __init__(self, filepath: Path) -> None:
+    def __init__(self, filepath: Path, level: int | None = None) -> None:
         self.filepath = filepath
+        # The compression level used when writing. None means the default level of the codec.
+        self.level = level
 
     @abstractmethod
     def open(self, mode: Literal["r", "w"]) -> TextIOWrapper:
         """Open the compressed file and return a file-like object."""
         raise NotImplementedError("This method should be implemented in subclasses.")
 
+    @classmethod
+    def validate_level(cls, level: int | None) -> None:
+        """Raises a ToolkitValueError if the compression level is not valid for this compression method."""
+        if level is None:
+            return
+        if cls.levels is None:
+            raise ToolkitValueError(f"The compression type {cls.name} does not support a compression level.")
+        if level not in cls.levels:
+            raise ToolkitValueError(
+                f"Invalid compression level {level} for {cls.name}. "
+                f"Expected a level from {cls.levels.start} to {cls.levels.stop - 1}."
+            )
+
     @classmethod
     def from_filepath(cls, filepath: Path) -> "Compression":
         return COMPRESSION_BY_SUFFIX.get(filepath.suffix, Uncompressed)(filepath=filepath)
@@ -49,11 +67,73 @@ class Uncompressed(Compression):
 class GzipCompression(Compression):
     name = "gzip"
     file_suffix = ".gz"
+    levels = range(0, 10)
 
     def open(self, mode: Literal["r", "w"]) -> TextIOWrapper:
         """Open the gzip compressed file."""
         # MyPy (or gzip) fails to recognize that gzip.open returns a TextIOWrapper
-        return gzip.open(self.filepath, mode=f"{mode}t", encoding=self.encoding, newline=self.newline)  # type: ignore[return-value]
+        return gzip.open(  # type: ignore[return-value]
+            self.filepath,
+            mode=f"{mode}t",
+            encoding=self.encoding,
+            newline=self.newline,
+            compresslevel=9 if self.level is None else self.level,
+        )
+
+
+class ZstdCompression(Compression):
+    """Zstandard compression. This is much faster than gzip with a similar compression ratio.
+
+    Writing uses multi-threaded compression, zstd splits large files into independent jobs that are
+    compressed in parallel, while small files are compressed as a single frame.
+    """
+
+    name = "zstd"
+    file_suffix = ".zst"
+    levels = range(1, 23)
+    default_level = 3
+
+    def open(self, mode: Literal["r", "w"]) -> TextIOWrapper:
+        """Open the zstd compressed file."""
+        _check_dependency("zstandard", self.name)
+        import zstandard
+
+        if mode == "w":
+            compressor = zstandard.ZstdCompressor(
+                level=self.default_level if self.level is None else self.level, threads=-1
+            )
+            return zstandard.open(
+                self.filepath, mode="wt", cctx=compressor, encoding=self.encoding, newline=self.newline
+            )
+        return zstandard.open(self.filepath, mode="rt", encoding=self.encoding, newline=self.newline)
+
+
+class LZ4Compression(Compression):
+    """LZ4 frame compression. This has a lower compression ratio than zstd, but is the fastest codec."""
+
+    name = "lz4"
+    file_suffix = ".lz4"
+    levels = range(0, 17)
+
+    def open(self, mode: Literal["r", "w"]) -> TextIOWrapper:
+        """Open the lz4 compressed file."""
+        _check_dependency("lz4", self.name)
+        import lz4.frame
+
+        return lz4.frame.open(
+            self.filepath,
+            mode=f"{mode}t",
+            encoding=self.encoding,
+            newline=self.newline,
+            compression_level=self.level or 0,
+        )
+
+
+def _check_dependency(module: str, compression: str) -> None:
+    if importlib.util.find_spec(module) is None:
+        raise ToolkitMissingDependencyError(
+            f"{compression} compression requires {module}. Install with 'pip install \"cognite-toolkit[compression]\"'"
+        )
 
 
 _all_compression_types: list[type[Compression]] = get_concrete_subclasses(Compression)  # type: ignore[type-abstract]
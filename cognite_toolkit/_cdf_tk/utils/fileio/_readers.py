@@ -1,6 +1,8 @@
 import csv
 import json
+import queue
 import re
+import threading
 from abc import ABC, abstractmethod
 from collections import Counter, defaultdict
 from collections.abc import Callable, Iterator, Mapping, Sequence
@@ -13,8 +15,9 @@ from typing import Any
 import yaml
 
 from cognite_toolkit._cdf_tk.exceptions import ToolkitFileNotFoundError, ToolkitValueError
+from cognite_toolkit._cdf_tk.utils import fast_json
 from cognite_toolkit._cdf_tk.utils._auxiliary import get_concrete_subclasses
-from cognite_toolkit._cdf_tk.utils.collection import humanize_collection
+from cognite_toolkit._cdf_tk.utils.collection import chunker, humanize_collection
 from cognite_toolkit._cdf_tk.utils.dtype_conversion import convert_str_to_data_type, infer_data_type_from_value
 from cognite_toolkit._cdf_tk.utils.useful_types import JsonVal
 
@@ -77,14 +80,21 @@ class MultiFileReader(FileReader):
         input_files (Sequence[Path]): The list of file paths to read.
         schema (Sequence[SchemaColumn] | None): Optional schema passed to TableReader subclasses
             to ensure correct type parsing (e.g., CSV columns that look numeric but are strings).
+        read_ahead (int): The number of batches of READ_AHEAD_BATCH_SIZE chunks to decompress and parse in a
+            background thread while the earlier chunks are consumed. The chunks are still yielded in part order.
+            The default, 0, reads the files when the chunks are consumed.
     """
 
     PART_PATTERN = re.compile(r"part-(\d{4})$")
+    READ_AHEAD_BATCH_SIZE = 1000
 
-    def __init__(self, input_files: Sequence[Path], schema: Sequence[SchemaColumn] | None = None) -> None:
+    def __init__(
+        self, input_files: Sequence[Path], schema: Sequence[SchemaColumn] | None = None, read_ahead: int = 0
+    ) -> None:
         super().__init__(input_file=input_files[0])
         self.input_files = input_files
         self.schema = schema
+        self.read_ahead = read_ahead
         self.current_file = input_files[0]
 
     @cached_property
@@ -111,16 +121,61 @@ class MultiFileReader(FileReader):
         return self.reader_class.FORMAT
 
     def _create_reader(self, input_file: Path) -> FileReader:
-        reader_cls = self.reader_class
-        if self.schema is not None and issubclass(reader_cls, TableReader):
-            return reader_cls(input_file, schema=self.schema)
-        return reader_cls(input_file)
+        return _create_file_reader(self.reader_class, input_file, self.schema)
 
     def read_chunks(self) -> Iterator[dict[str, JsonVal]]:
-        for input_file in sorted(self.input_files, key=self._part_no):
+        input_files = sorted(self.input_files, key=self._part_no)
+        if self.read_ahead > 0:
+            yield from self._read_chunks_in_background(input_files)
+            return
+        for input_file in input_files:
             self.current_file = input_file
             yield from self._create_reader(input_file).read_chunks()
 
+    def _read_chunks_in_background(self, input_files: list[Path]) -> Iterator[dict[str, JsonVal]]:
+        # A thread, not processes, as this is typically called from a worker thread, and forking from a
+        # multithreaded process is unsafe. Decompression and the consumer, which typically waits on the
+        # network, release the GIL, so the files are decoded while the earlier chunks are, for example, uploaded.
+        # The chunks are handed over in batches, such that only a few decoded chunks are kept in memory.
+        batches: queue.Queue[tuple[Path, list[dict[str, JsonVal]]] | BaseException | None] = queue.Queue(
+            maxsize=self.read_ahead
+        )
+        is_stopped = threading.Event()
+        reader_class = self.reader_class
+
+        def put(item: tuple[Path, list[dict[str, JsonVal]]] | BaseException | None) -> bool:
+            while not is_stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read_files() -> None:
+            try:
+                for input_file in input_files:
+                    reader = _create_file_reader(reader_class, input_file, self.schema)
+                    for batch in chunker(reader.read_chunks(), self.READ_AHEAD_BATCH_SIZE):
+                        if not put((input_file, batch)):
+                            return
+                put(None)
+            except BaseException as error:
+                put(error)
+
+        thread = threading.Thread(target=read_files, name="file-read-ahead", daemon=True)
+        thread.start()
+        try:
+            while (item := batches.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                self.current_file, batch = item
+                yield from batch
+        finally:
+            # Stops the thread if the consumer stops early.
+            is_stopped.set()
+            thread.join()
+
     def _part_no(self, path: Path) -> int:
         match = self.PART_PATTERN.search(path.stem)
         if match:
@@ -144,7 +199,7 @@ class NDJsonReader(FileReader):
     def _read_chunks_from_file(self, file: TextIOWrapper) -> Iterator[dict[str, JsonVal]]:
         for line in file:
             if stripped := line.strip():
-                yield json.loads(stripped)
+                yield fast_json.loads(stripped)
 
     def count(self) -> int:
         """Count the number of lines (chunks) in the NDJSON file."""
@@ -379,7 +434,7 @@ class ParquetReader(TableReader):
         """Parse a string value into its appropriate type."""
         if isinstance(value, str) and value:
             try:
-                return json.loads(value)
+                return fast_json.loads(value)
             except json.JSONDecodeError:
                 return value
         return value
@@ -414,6 +469,14 @@ class ParquetReader(TableReader):
             return parquet_file.metadata.num_rows
 
 
+def _create_file_reader(
+    reader_cls: type[FileReader], input_file: Path, schema: Sequence[SchemaColumn] | None
+) -> FileReader:
+    if schema is not None and issubclass(reader_cls, TableReader):
+        return reader_cls(input_file, schema=schema)
+    return reader_cls(input_file)
+
+
 FILE_READ_CLS_BY_FORMAT: Mapping[str, type[FileReader]] = {}
 TABLE_READ_CLS_BY_FORMAT: Mapping[str, type[TableReader]] = {}
 for subclass in get_concrete_subclasses(FileReader):  # type: ignore[type-abstract]
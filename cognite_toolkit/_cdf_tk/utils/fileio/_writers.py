@@ -1,6 +1,5 @@
 import csv
 import importlib.util
-import json
 import sys
 import threading
 from abc import ABC, abstractmethod
@@ -16,12 +15,13 @@ from typing import TYPE_CHECKING, Generic
 import yaml
 
 from cognite_toolkit._cdf_tk.exceptions import ToolkitMissingDependencyError, ToolkitTypeError, ToolkitValueError
+from cognite_toolkit._cdf_tk.utils import fast_json
 from cognite_toolkit._cdf_tk.utils._auxiliary import get_concrete_subclasses
 from cognite_toolkit._cdf_tk.utils.collection import humanize_collection
 from cognite_toolkit._cdf_tk.utils.file import sanitize_filename
 from cognite_toolkit._cdf_tk.utils.useful_types import DataType
 
-from ._base import T_IO, CellValue, Chunk, FileIO, SchemaColumn
+from ._base import T_IO, CellValue, Chunk, ColumnBatch, FileIO, SchemaColumn
 from ._compression import Compression, Uncompressed
 
 if sys.version_info >= (3, 11):
@@ -43,10 +43,13 @@ class FileWriter(FileIO, ABC, Generic[T_IO]):
         compression: type[Compression],
         default_filestem: str | None = None,
         max_file_size_bytes: int = 128 * 1024 * 1024,
+        compression_level: int | None = None,
     ) -> None:
         self.output_dir = output_dir
         self.kind = kind
+        compression.validate_level(compression_level)
         self.compression_cls = compression
+        self.compression_level = compression_level
         self.default_filestem = default_filestem
         self.max_file_size_bytes = max_file_size_bytes
         self._file_count_by_filename: dict[str, int] = Counter()
@@ -76,6 +79,20 @@ class FileWriter(FileIO, ABC, Generic[T_IO]):
             writer = self._get_writer(filepath, selected_filestem)
             self._write(writer, chunks)
 
+    def write_columns(self, batch: ColumnBatch, filestem: str = "") -> None:
+        """Write a batch of column-oriented data.
+
+        Writers that can consume columns directly override `_write_columns`, the default falls back
+        to converting the batch to rows.
+        """
+        if len(batch) == 0:
+            return
+        with self._lock:
+            selected_filestem = filestem or self.default_filestem or ""
+            filepath = self._get_filepath(selected_filestem)
+            writer = self._get_writer(filepath, selected_filestem)
+            self._write_columns(writer, batch)
+
     def _get_filepath(self, filestem: str) -> Path:
         # This method is now called within the lock context from write_chunks
         sanitized_name = f"{sanitize_filename(filestem)}-" if filestem else ""
@@ -92,7 +109,7 @@ class FileWriter(FileIO, ABC, Generic[T_IO]):
         if filepath not in self._writer_by_filepath:
             self._writer_by_filepath[filepath] = self._create_writer(filepath)
         elif self._is_above_file_size_limit(filepath, self._writer_by_filepath[filepath]):
-            self._writer_by_filepath[filepath].close()
+            self._close_writer(self._writer_by_filepath[filepath])
             del self._writer_by_filepath[filepath]
             self._file_count_by_filename[filename_base] += 1
             new_filepath = self._get_filepath(filename_base)
@@ -110,7 +127,7 @@ class FileWriter(FileIO, ABC, Generic[T_IO]):
     ) -> None:
         with self._lock:
             for writer in self._writer_by_filepath.values():
-                writer.close()
+                self._close_writer(writer)
             self._writer_by_filepath.clear()
             self._file_count_by_filename.clear()
             return None
@@ -130,11 +147,19 @@ class FileWriter(FileIO, ABC, Generic[T_IO]):
         """Create a writer for the given file path."""
         raise NotImplementedError("This method should be implemented in subclasses.")
 
+    def _close_writer(self, writer: T_IO) -> None:
+        """Close the writer of a file."""
+        writer.close()
+
     @abstractmethod
     def _write(self, writer: T_IO, chunks: Iterable[Chunk]) -> None:
         """Write the chunk to the file."""
         raise NotImplementedError("This method should be implemented in subclasses.")
 
+    def _write_columns(self, writer: T_IO, batch: ColumnBatch) -> None:
+        """Write the column batch to the file."""
+        self._write(writer, batch.to_rows())
+
     @classmethod
     def create_from_format(
         cls,
@@ -143,18 +168,37 @@ class FileWriter(FileIO, ABC, Generic[T_IO]):
         kind: str,
         compression: type[Compression] = Uncompressed,
         columns: Sequence[SchemaColumn] | None = None,
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
     ) -> "FileWriter":
         if format not in FILE_WRITE_CLS_BY_FORMAT:
             raise ToolkitValueError(
                 f"Unknown file format: {format}. Available formats: {humanize_collection(FILE_WRITE_CLS_BY_FORMAT.keys())}."
             )
         file_writs_cls = FILE_WRITE_CLS_BY_FORMAT[format]
-        if issubclass(file_writs_cls, TableWriter) and columns is not None:
-            return file_writs_cls(output_dir=output_dir, kind=kind, compression=compression, columns=columns)
+        if issubclass(file_writs_cls, ParquetWriter) and columns is not None:
+            return file_writs_cls(
+                output_dir=output_dir,
+                kind=kind,
+                compression=compression,
+                columns=columns,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
+            )
+        elif issubclass(file_writs_cls, TableWriter) and columns is not None:
+            return file_writs_cls(
+                output_dir=output_dir,
+                kind=kind,
+                compression=compression,
+                columns=columns,
+                compression_level=compression_level,
+            )
         elif issubclass(file_writs_cls, TableWriter):
             raise ToolkitValueError(f"File format {format} requires columns to be provided for table writers.")
         else:
-            return file_writs_cls(output_dir=output_dir, kind=kind, compression=compression)
+            return file_writs_cls(
+                output_dir=output_dir, kind=kind, compression=compression, compression_level=compression_level
+            )
 
 
 class TableWriter(FileWriter[T_IO], ABC):
@@ -166,28 +210,21 @@ class TableWriter(FileWriter[T_IO], ABC):
         columns: Sequence[SchemaColumn],
         default_filestem: str | None = None,
         max_file_size_bytes: int = 128 * 1024 * 1024,
+        compression_level: int | None = None,
     ) -> None:
-        super().__init__(output_dir, kind, compression, default_filestem, max_file_size_bytes)
+        super().__init__(output_dir, kind, compression, default_filestem, max_file_size_bytes, compression_level)
         self.columns = columns
 
 
 class NDJsonWriter(FileWriter[TextIOWrapper]):
     FORMAT = ".ndjson"
 
-    class _DateTimeEncoder(json.JSONEncoder):
-        def default(self, obj: object) -> object:
-            if isinstance(obj, date | datetime):
-                return obj.isoformat()
-            return super().default(obj)
-
     def _create_writer(self, filepath: Path) -> TextIOWrapper:
         """Create a writer for the given file path."""
-        return self.compression_cls(filepath).open("w")
+        return self.compression_cls(filepath, self.compression_level).open("w")
 
     def _write(self, writer: TextIOWrapper, chunks: Iterable[Chunk]) -> None:
-        writer.writelines(
-            f"{json.dumps(chunk, cls=self._DateTimeEncoder)}{self.compression_cls.newline}" for chunk in chunks
-        )
+        writer.writelines(f"{fast_json.dumps(chunk)}{self.compression_cls.newline}" for chunk in chunks)
 
     def flush(self) -> None:
         """Flush all open file handles to disk."""
@@ -198,7 +235,7 @@ class NDJsonWriter(FileWriter[TextIOWrapper]):
 
 class YAMLBaseWriter(FileWriter[TextIOWrapper], ABC):
     def _create_writer(self, filepath: Path) -> TextIOWrapper:
-        return self.compression_cls(filepath).open("w")
+        return self.compression_cls(filepath, self.compression_level).open("w")
 
     def _write(self, writer: TextIOWrapper, chunks: Iterable[Chunk]) -> None:
         yaml.safe_dump_all(chunks, writer, sort_keys=False, explicit_start=True)
@@ -223,12 +260,15 @@ class CSVWriter(TableWriter[TextIOWrapper]):
         columns: Sequence[SchemaColumn],
         default_filestem: str | None = None,
         max_file_size_bytes: int = 128 * 1024 * 1024,
+        compression_level: int | None = None,
     ) -> None:
-        super().__init__(output_dir, kind, compression, columns, default_filestem, max_file_size_bytes)
+        super().__init__(
+            output_dir, kind, compression, columns, default_filestem, max_file_size_bytes, compression_level
+        )
         self._csvwriter_by_file: dict[TextIOWrapper, csv.DictWriter] = {}
 
     def _create_writer(self, filepath: Path) -> TextIOWrapper:
-        file = self.compression_cls(filepath).open("w")
+        file = self.compression_cls(filepath, self.compression_level).open("w")
         self._csvwriter_by_file[file] = self._create_dict_writer(file)
         return file
 
@@ -240,6 +280,19 @@ class CSVWriter(TableWriter[TextIOWrapper]):
             self._csvwriter_by_file[writer] = csv_writer
         csv_writer.writerows(self._prepare_row(row) for row in chunks)
 
+    def _write_columns(self, writer: TextIOWrapper, batch: ColumnBatch) -> None:
+        if any(col.is_array or col.type in ("json", "date", "timestamp") for col in self.columns):
+            # These columns need per-cell conversion.
+            return super()._write_columns(writer, batch)
+        if writer not in self._csvwriter_by_file:
+            self._csvwriter_by_file[writer] = self._create_dict_writer(writer)
+        # The header is written by the DictWriter, the rows are written with a plain csv.writer
+        # in the same column order, which avoids creating one dictionary per row.
+        column_values = [
+            ["" if value is None else value for value in batch.column_as_list(col.name)] for col in self.columns
+        ]
+        csv.writer(writer).writerows(zip(*column_values))
+
     @staticmethod
     def _prepare_row(row: Chunk) -> dict[str, str | int | float | bool]:
         """Prepare a row for writing to CSV."""
@@ -247,7 +300,7 @@ class CSVWriter(TableWriter[TextIOWrapper]):
         value: str | int | float | bool
         for col, cell in row.items():
             if isinstance(cell, list | dict):
-                value = json.dumps(cell, cls=NDJsonWriter._DateTimeEncoder)
+                value = fast_json.dumps(cell)
             elif isinstance(cell, date | datetime):
                 value = cell.isoformat()
             elif cell is None:
@@ -266,6 +319,15 @@ class CSVWriter(TableWriter[TextIOWrapper]):
 
 
 class ParquetWriter(TableWriter["pq.ParquetWriter"]):  # type: ignore[type-var]
+    """Writes the chunks to Parquet files with the schema given by the columns.
+
+    JSON columns are written as JSON strings, and a missing value is written as null, not as the string "null".
+    Timestamps and dates given as integers or floats are interpreted as milliseconds since epoch in UTC.
+
+    If row_group_size is set, rows are buffered until there are enough to write a full row group, such that
+    the row groups are not limited by the size of each written batch. Otherwise, each batch is a row group.
+    """
+
     FORMAT = ".parquet"
 
     def __init__(
@@ -276,8 +338,17 @@ class ParquetWriter(TableWriter["pq.ParquetWriter"]):  # type: ignore[type-var]
         columns: Sequence[SchemaColumn],
         default_filestem: str | None = None,
         max_file_size_bytes: int = 128 * 1024 * 1024,
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
     ) -> None:
-        super().__init__(output_dir, kind, compression, columns, default_filestem, max_file_size_bytes)
+        super().__init__(
+            output_dir, kind, compression, columns, default_filestem, max_file_size_bytes, compression_level
+        )
+        if row_group_size is not None and row_group_size < 1:
+            raise ToolkitValueError(f"The row group size must be at least 1, got {row_group_size}.")
+        self.row_group_size = row_group_size
+        # The rows that are not yet written, as they do not fill a row group, by writer.
+        self._pending_by_writer: dict["pq.ParquetWriter", "pa.Table"] = {}
         self._check_pyarrow_dependency()
 
     def _create_writer(self, filepath: Path) -> "pq.ParquetWriter":
@@ -287,56 +358,65 @@ class ParquetWriter(TableWriter["pq.ParquetWriter"]):  # type: ignore[type-var]
         return pq.ParquetWriter(filepath, schema)
 
     def _write(self, writer: "pq.ParquetWriter", chunks: Iterable[Chunk]) -> None:
+        rows = chunks if isinstance(chunks, list) else list(chunks)
+        if not rows:
+            return
+        columns = {col.name: [row.get(col.name) for row in rows] for col in self.columns}
+        self._write_columns(writer, ColumnBatch(columns))
+
+    def _write_columns(self, writer: "pq.ParquetWriter", batch: ColumnBatch) -> None:
         import pyarrow as pa
 
-        json_columns = self._json_columns()
-        timestamp_columns = self._timestamp_columns()
-        date_columns = self._date_columns()
-        if not json_columns and not timestamp_columns and not date_columns:
-            # If no special columns, we can write directly without processing
-            table = pa.Table.from_pylist(chunks, schema=self._create_schema())
-            writer.write_table(table)
+        if len(batch) == 0:
             return
-
-        processed_chunks: list[Chunk] = []
-        for chunk in chunks:
-            # Create a copy to avoid mutating the input, which is an unexpected side-effect.
-            processed_chunk = chunk.copy()
-            for col, cell_value in processed_chunk.items():
-                if col in json_columns:
-                    processed_chunk[col] = json.dumps(cell_value)
-                elif col in timestamp_columns:
-                    if isinstance(cell_value, list):
-                        # MyPy fails to recognize that list of datetime and date are valid CellValues.
-                        processed_chunk[col] = [self._to_datetime(value) for value in cell_value]  # type: ignore[assignment]
-                    else:
-                        processed_chunk[col] = self._to_datetime(cell_value)
-                elif col in date_columns:
-                    if isinstance(cell_value, list):
-                        processed_chunk[col] = [self._to_date(value) for value in cell_value]  # type: ignore[assignment]
-                    else:
-                        processed_chunk[col] = self._to_date(cell_value)
-            processed_chunks.append(processed_chunk)
-
-        if not processed_chunks:
+        schema = self._create_schema()
+        arrays = [self._create_array(column, field.type, batch) for column, field in zip(self.columns, schema)]
+        table = pa.Table.from_arrays(arrays, schema=schema)
+        if self.row_group_size is None:
+            writer.write_table(table)
             return
+        if (pending := self._pending_by_writer.pop(writer, None)) is not None:
+            table = pa.concat_tables([pending, table])
+        full_row_groups = (table.num_rows // self.row_group_size) * self.row_group_size
+        if full_row_groups:
+            writer.write_table(table.slice(0, full_row_groups), row_group_size=self.row_group_size)
+        if table.num_rows > full_row_groups:
+            self._pending_by_writer[writer] = table.slice(full_row_groups)
+
+    def _close_writer(self, writer: "pq.ParquetWriter") -> None:
+        if (pending := self._pending_by_writer.pop(writer, None)) is not None:
+            writer.write_table(pending, row_group_size=self.row_group_size)
+        writer.close()
+
+    def _create_array(self, column: SchemaColumn, pa_type: "pa.DataType", batch: ColumnBatch) -> "pa.Array":
+        """Create the Arrow array for a column, converting the values to the column type in bulk."""
+        import numpy as np
+        import pyarrow as pa
 
-        table = pa.Table.from_pylist(processed_chunks, schema=self._create_schema())
-        writer.write_table(table)
-
-    @lru_cache(maxsize=1)
-    def _json_columns(self) -> set[str]:
-        """Check if the writer supports JSON format."""
-        return {col.name for col in self.columns if col.type == "json"}
-
-    @lru_cache(maxsize=1)
-    def _timestamp_columns(self) -> set[str]:
-        """Check if the writer supports timestamp format."""
-        return {col.name for col in self.columns if col.type == "timestamp"}
+        if column.name not in batch.columns:
+            return pa.nulls(len(batch), type=pa_type)
+        values = batch.columns[column.name]
+        if column.type == "json":
+            return pa.array([None if value is None else fast_json.dumps(value) for value in values], type=pa_type)
+        elif column.type not in ("timestamp", "date"):
+            return pa.array(values, type=pa_type)
+        elif column.is_array:
+            convert = self._to_datetime if column.type == "timestamp" else self._to_date
+            return pa.array(
+                [None if value is None else [convert(item) for item in value] for value in values],  # type: ignore[union-attr]
+                type=pa_type,
+            )
 
-    @lru_cache(maxsize=1)
-    def _date_columns(self) -> set[str]:
-        return {col.name for col in self.columns if col.type == "date"}
+        if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.integer):
+            epoch_ms = pa.array(values, type=pa.int64())
+        elif all(value is None or (isinstance(value, int) and not isinstance(value, bool)) for value in values):
+            # Timestamps given as milliseconds since epoch.
+            epoch_ms = pa.array(values, type=pa.int64())
+        else:
+            convert = self._to_datetime if column.type == "timestamp" else self._to_date
+            return pa.array([convert(value) for value in values], type=pa_type)
+        timestamps = epoch_ms.cast(pa.timestamp("ms", tz="UTC"))
+        return timestamps if column.type == "timestamp" else timestamps.cast(pa_type)
 
     @classmethod
     def _to_datetime(cls, value: CellValue) -> CellValue:
@@ -346,7 +426,7 @@ class ParquetWriter(TableWriter["pq.ParquetWriter"]):  # type: ignore[type-var]
             output = datetime.combine(value, datetime.min.time())
         elif isinstance(value, int | float):
             # Assuming the value is a timestamp in milliseconds
-            output = datetime.fromtimestamp(value / 1000.0)
+            output = datetime.fromtimestamp(value / 1000.0, tz=timezone.utc)
         elif isinstance(value, str):
             output = cls._convert_data_modelling_timestamp(value)
         else:
@@ -369,7 +449,7 @@ class ParquetWriter(TableWriter["pq.ParquetWriter"]):  # type: ignore[type-var]
             return value.date()
         elif isinstance(value, int | float):
             # Assuming the value is a timestamp in milliseconds
-            return date.fromtimestamp(value / 1000.0)
+            return datetime.fromtimestamp(value / 1000.0, tz=timezone.utc).date()
         elif isinstance(value, str):
             return cls._convert_data_modelling_timestamp(value).date()
         else:
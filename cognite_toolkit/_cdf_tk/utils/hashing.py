@@ -1,6 +1,7 @@
 import hashlib
 import json
 import zipfile
+from collections.abc import Set
 from pathlib import Path
 from typing import Any
 
@@ -45,6 +46,47 @@ def calculate_secure_hash(item: dict[str, Any], shorten: bool = False) -> str:
     return calculated_hash
 
 
+def calculate_content_hash(
+    item: dict[str, Any], unordered_paths: Set[tuple[str, ...]] = frozenset(), shorten: bool = False
+) -> str:
+    """Calculate a hash of the content of a dictionary, which is independent of the key order.
+
+    Args:
+        item: The dictionary to hash.
+        unordered_paths: Paths of keys to lists where the order of the elements does not matter, for example,
+            ("capabilities",). A "*" in a path matches any key.
+        shorten: Whether to shorten the hash to 8 characters.
+
+    Returns:
+        The hash of the content.
+    """
+    sha256_hash = hashlib.sha256()
+    canonical = _canonical_json(item, unordered_paths, ()) if unordered_paths else item
+    sha256_hash.update(json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    calculated = sha256_hash.hexdigest()
+    if shorten:
+        return calculated[:8]
+    return calculated
+
+
+def _canonical_json(value: Any, unordered_paths: Set[tuple[str, ...]], path: tuple[str, ...]) -> Any:
+    if isinstance(value, dict):
+        return {key: _canonical_json(item, unordered_paths, (*path, key)) for key, item in value.items()}
+    if isinstance(value, list):
+        items = [_canonical_json(item, unordered_paths, path) for item in value]
+        if _is_unordered(path, unordered_paths):
+            return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+        return items
+    return value
+
+
+def _is_unordered(path: tuple[str, ...], unordered_paths: Set[tuple[str, ...]]) -> bool:
+    return any(
+        len(unordered) == len(path) and all(part in ("*", key) for part, key in zip(unordered, path))
+        for unordered in unordered_paths
+    )
+
+
 def calculate_hash(content: str | bytes | Path, shorten: bool = False) -> str:
     sha256_hash = hashlib.sha256()
     if isinstance(content, Path):
@@ -65,6 +107,21 @@ def calculate_zipfile_hash(filepath: Path, shorten: bool = False) -> str:
     """Calculate a hash of a zip file based on its contents, ignoring zip metadata.
 
     It reads the contents directly from the zip file without extracting,
-    which ensures consistent hashing across platforms.
+    which ensures consistent hashing across platforms. Only the file names and contents
+    are hashed, so timestamps, permissions, compression and entry order do not affect the hash.
     """
-    return "zipfil-hash-not-supported"
+    sha256_hash = hashlib.sha256()
+    with zipfile.ZipFile(filepath) as zip_file:
+        for info in sorted(zip_file.infolist(), key=lambda info: info.filename):
+            if info.is_dir():
+                continue
+            sha256_hash.update(info.filename.encode("utf-8"))
+            with zip_file.open(info) as file:
+                while chunk := file.read(8192):
+                    # Get rid of Windows line endings to make the hash consistent across platforms.
+                    sha256_hash.update(chunk.replace(b"\r\n", b"\n"))
+
+    calculated = sha256_hash.hexdigest()
+    if shorten:
+        return calculated[:8]
+    return calculated
@@ -1,3 +1,5 @@
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Sequence
@@ -5,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import cached_property, lru_cache, partial
 from typing import Any, ClassVar, Literal, TypeVar, get_args, overload
+from weakref import WeakKeyDictionary
 
 import questionary
 from cognite.client import data_modeling as dm
@@ -69,8 +72,16 @@ from .useful_types import AssetCentricDestinationType
 
 T_Type = TypeVar("T_Type", bound=Asset | DataSetResponse)
 
+# The aggregate counts are shared by all interactive selects of the same client, such that repeated prompts
+# in a session do not count the same resources again. The value is the count and when it expires.
+_COUNT_CACHE_BY_CLIENT: "WeakKeyDictionary[ToolkitClient, dict[tuple, tuple[int, float]]]" = WeakKeyDictionary()
+_COUNT_CACHE_LOCK = threading.Lock()
+
 
 class AssetCentricInteractiveSelect(ABC):
+    count_ttl_seconds: ClassVar[float] = 5 * 60
+    _MAX_COUNT_WORKERS: ClassVar[int] = 8
+
     def __init__(self, client: ToolkitClient, operation: str) -> None:
         self.client = client
         self.operation = operation
@@ -80,9 +91,17 @@ class AssetCentricInteractiveSelect(ABC):
     def _get_aggregator(self, client: ToolkitClient) -> AssetCentricAggregator:
         raise NotImplementedError()
 
-    @lru_cache
     def aggregate_count(self, hierarchies: tuple[str, ...], data_sets: tuple[str, ...]) -> int:
-        return self._aggregate_count(list(hierarchies), list(data_sets))
+        key = (self.client.config.project, self._aggregator.display_name, hierarchies, data_sets)
+        with _COUNT_CACHE_LOCK:
+            cache = _COUNT_CACHE_BY_CLIENT.setdefault(self.client, {})
+            cached = cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        count = self._aggregate_count(list(hierarchies), list(data_sets))
+        with _COUNT_CACHE_LOCK:
+            cache[key] = (count, time.monotonic() + self.count_ttl_seconds)
+        return count
 
     def _aggregate_count(self, hierarchies: list[str], data_sets: list[str]) -> int:
         return self._aggregator.count(hierarchies, data_sets)
@@ -100,6 +119,13 @@ class AssetCentricInteractiveSelect(ABC):
         data_set_external_ids = [data_set] if data_set else None
         return list(self.client.assets.list(root=True, limit=-1, data_set_external_ids=data_set_external_ids))
 
+    def _create_choices(self, items: Sequence[Asset | DataSetResponse]) -> list[tuple[questionary.Choice, int]]:
+        """Create questionary choices for the given items, counting their resources concurrently."""
+        if len(items) <= 1:
+            return [self._create_choice(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._MAX_COUNT_WORKERS, len(items))) as executor:
+            return list(executor.map(self._create_choice, items))
+
     def _create_choice(self, item: Asset | DataSetResponse) -> tuple[questionary.Choice, int]:
         """Create a questionary choice for the given item."""
         if item.external_id is None:
@@ -227,7 +253,7 @@ class AssetCentricInteractiveSelect(ABC):
             choices.append(questionary.Choice(title=f"All {what}", value=none_sentinel))
 
         for choice, count in sorted(
-            (self._create_choice(item) for item in options), key=lambda x: (-x[1], x[0].title)
+            self._create_choices(options), key=lambda x: (-x[1], x[0].title)
         ):  # cont, choice.title
             if count > 0:
                 choices.append(choice)
@@ -5,7 +5,7 @@ import time
 import traceback
 import typing
 from collections.abc import Callable, Iterable, Sized
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
 
 from rich.console import Console, RenderableType
 from rich.markup import escape
@@ -36,11 +36,33 @@ PROCESS_FINISH_SENTINEL = object()
 WRITE_FINISH_SENTINEL = object()
 
 
+@runtime_checkable
+class ItemCounted(Protocol):
+    """A chunk where one element can hold several items, for example, a batch of table rows."""
+
+    @property
+    def item_count(self) -> int: ...
+
+
+def count_items(chunk: Sized) -> int:
+    """The number of items in a chunk, used to advance the progress bars."""
+    if isinstance(chunk, ItemCounted):
+        return chunk.item_count
+    return len(chunk)
+
+
 class ItemCountColumn(ProgressColumn):
     def render(self, task: Task) -> str:
         return f"[green]{int(task.fields.get('item_count', 0)):,} items"
 
 
+class ItemRateColumn(ProgressColumn):
+    def render(self, task: Task) -> str:
+        if task.speed is None:
+            return "[cyan]- items/s"
+        return f"[cyan]{task.speed:,.0f} items/s"
+
+
 class ProgressWithFooter(Progress):
     def __init__(self, *args: Any, footer: str = "", **kwargs: Any) -> None:
         self.footer = footer
@@ -72,6 +94,9 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
         process_description (str): A description of the processing step, used for progress tracking.
         write_description (str): A description of the writing step, used for progress tracking.
         console (Console | None): An optional Rich Console instance for outputting progress and error messages.
+        process_workers (int): The number of threads processing chunks concurrently. Chunks may be written in a
+            different order than they were downloaded when this is larger than one.
+        show_throughput (bool): Whether to show the number of items per second for each step.
 
     Examples:
         >>> from cognite_toolkit._cdf_tk.utils.producer_worker import ProducerWorkerExecutor
@@ -106,6 +131,8 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
         write_description: str = "Writing",
         console: Console | None = None,
         verbose: bool = False,
+        process_workers: int = 1,
+        show_throughput: bool = False,
     ) -> None:
         self._download_iterable = download_iterable
         self._process = process
@@ -126,6 +153,11 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
         self.error_traceback = ""
         self.error_exception: Exception | None = None
         self.verbose = verbose
+        self.process_workers = max(process_workers, 1)
+        self.show_throughput = show_throughput
+        self._process_lock = threading.Lock()
+        self._process_count = 0
+        self._finished_process_workers = 0
 
     @property
     def error_occurred(self) -> bool:
@@ -139,24 +171,38 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
 
     def _get_progress_columns(self) -> list[ProgressColumn]:
         """Helper to set up the progress bar and tasks based on iteration_count."""
+        return self.get_progress_columns(self.total_item_count is not None, self.show_throughput)
+
+    @staticmethod
+    def get_progress_columns(has_total: bool, show_throughput: bool = False) -> list[ProgressColumn]:
+        """The progress columns, also used to create a progress display shared by several executors.
+
+        Args:
+            has_total: Whether the total number of items is known.
+            show_throughput: Whether to show the number of items per second.
+        """
         description = TextColumn(
             "[bold blue]{task.description}",
             table_column=Column(no_wrap=True, overflow="ellipsis", ratio=1),
         )
-        if self.total_item_count is None:
-            return [
+        columns: list[ProgressColumn]
+        if not has_total:
+            columns = [
                 SpinnerColumn(),
                 description,
                 ItemCountColumn(),
                 TimeElapsedColumn(),
             ]
         else:
-            return [
+            columns = [
                 description,
                 BarColumn(),
                 TaskProgressColumn(),
                 TimeRemainingColumn(),
             ]
+        if show_throughput:
+            columns.append(ItemRateColumn())
+        return columns
 
     def _user_input_listener(self, producer_thread: threading.Thread) -> None:
         while not self._error_event.is_set() and not self._stop_event.is_set():
@@ -175,50 +221,73 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
                 )
                 break
 
-    def run(self, start_item: int = 0) -> None:
+    def run(self, start_item: int = 0, progress: Progress | None = None) -> None:
         """Runs the producer-worker execution, optionally resuming from a specified item count.
 
         Args:
             start_item (int): The initial item count to start the progress from, used for resuming operations.
+            progress (Progress | None): A progress display shared with other executors running concurrently.
+                The steps are added as tasks to it. The executor does not listen for the user pressing 'q'
+                in this case, the caller is responsible for calling stop().
         """
+        if progress is not None:
+            self._run(progress, start_item, listen_for_input=False)
+            return
         self.console.print()
         columns = self._get_progress_columns()
         with ProgressWithFooter(*columns, console=self.console, expand=True, footer="Press 'q' to stop.") as progress:
-            task_args: dict[str, Any] = (
-                {"item_count": start_item, "total": None}
-                if self.total_item_count is None
-                else {"total": self.total_item_count}
-            )
-            download_task = progress.add_task(self.download_description, **task_args)
-            process_task = progress.add_task(self.process_description, **task_args)
-            write_task = progress.add_task(self.write_description, **task_args)
+            self._run(progress, start_item, listen_for_input=True)
+            progress.footer = ""
+            progress.refresh()
 
-            download_thread = threading.Thread(target=self._download_worker, args=(progress, download_task, start_item))
-            process_thread = threading.Thread(target=self._process_worker, args=(progress, process_task, start_item))
-            write_thread = threading.Thread(target=self._write_worker, args=(progress, write_task, start_item))
+    def stop(self) -> None:
+        """Stops the execution gracefully, finishing the chunks that are already being written."""
+        self._stop_event.set()
 
-            download_thread.start()
+    def _run(self, progress: Progress, start_item: int, listen_for_input: bool) -> None:
+        task_args: dict[str, Any] = (
+            {"item_count": start_item, "total": None}
+            if self.total_item_count is None
+            else {"total": self.total_item_count}
+        )
+        download_task = progress.add_task(self.download_description, **task_args)
+        process_task = progress.add_task(self.process_description, **task_args)
+        write_task = progress.add_task(self.write_description, **task_args)
+
+        download_thread = threading.Thread(target=self._download_worker, args=(progress, download_task, start_item))
+        self._process_count = start_item
+        self._finished_process_workers = 0
+        progress.update(process_task, advance=start_item)
+        process_threads = [
+            threading.Thread(target=self._process_worker, args=(progress, process_task))
+            for _ in range(self.process_workers)
+        ]
+        write_thread = threading.Thread(target=self._write_worker, args=(progress, write_task, start_item))
+
+        download_thread.start()
+        for process_thread in process_threads:
             process_thread.start()
-            write_thread.start()
+        write_thread.start()
 
+        threads = [download_thread, *process_threads, write_thread]
+        if listen_for_input:
             input_thread = threading.Thread(target=self._user_input_listener, args=(download_thread,))
             input_thread.start()
+            threads.append(input_thread)
 
-            for t in [download_thread, process_thread, write_thread]:
-                try:
-                    t.join()
-                except KeyboardInterrupt:
-                    self.console.print("[red]Execution interrupted by user.[/red]")
-                    self._stop_event.set()
-                    break
+        for t in [download_thread, *process_threads, write_thread]:
+            try:
+                t.join()
+            except KeyboardInterrupt:
+                self.console.print("[red]Execution interrupted by user.[/red]")
+                self._stop_event.set()
+                break
 
-            # After a possible interrupt, we must wait for all threads to finish their
-            # graceful shutdown. This is important to prevent data loss.
-            for t in [download_thread, process_thread, write_thread, input_thread]:
-                if t.is_alive():
-                    t.join()
-            progress.footer = ""
-            progress.refresh()
+        # After a possible interrupt, we must wait for all threads to finish their
+        # graceful shutdown. This is important to prevent data loss.
+        for t in threads:
+            if t.is_alive():
+                t.join()
 
     def raise_on_error(self) -> None:
         """Raises an exception if an error occurred during execution."""
@@ -281,7 +350,7 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
                 if self._stop_event.is_set():
                     break
                 items = next(iterator)
-                batch_len = len(items)
+                batch_len = count_items(items)
                 self.downloaded_items += batch_len
                 if self._put_with_error_check(items, self.process_queue):
                     progress.update(download_task, advance=batch_len, item_count=self.downloaded_items)
@@ -304,23 +373,29 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
                 continue
         return False
 
-    def _process_worker(self, progress: Progress, process_task: TaskID, start_item: int = 0) -> None:
+    def _process_worker(self, progress: Progress, process_task: TaskID) -> None:
         """Worker thread for processing data."""
-        process_count = start_item
-        progress.update(process_task, advance=start_item)
         while not self._error_event.is_set():
             try:
                 items = self.process_queue.get(timeout=0.5)
                 if items is PROCESS_FINISH_SENTINEL:
-                    # Signal writer to finish
-                    self._put_with_error_check(WRITE_FINISH_SENTINEL, self.write_queue)  # type: ignore[misc]
+                    with self._process_lock:
+                        self._finished_process_workers += 1
+                        is_last = self._finished_process_workers == self.process_workers
+                    if is_last:
+                        # Signal writer to finish
+                        self._put_with_error_check(WRITE_FINISH_SENTINEL, self.write_queue)  # type: ignore[misc]
+                    else:
+                        # Pass the sentinel on to the other process workers.
+                        self._put_with_error_check(PROCESS_FINISH_SENTINEL, self.process_queue)  # type: ignore[misc]
                     self.process_queue.task_done()
                     break
                 processed_items = self._process(items)
                 if self._put_with_error_check(processed_items, self.write_queue):
-                    batch_len = len(processed_items)
-                    process_count += batch_len
-                    progress.update(process_task, advance=batch_len, item_count=process_count)
+                    batch_len = count_items(processed_items)
+                    with self._process_lock:
+                        self._process_count += batch_len
+                        progress.update(process_task, advance=batch_len, item_count=self._process_count)
                     self.process_queue.task_done()
                     continue
                 else:
@@ -343,7 +418,7 @@ class ProducerWorkerExecutor(Generic[T_Download, T_Processed]):
                     self.write_queue.task_done()
                     break
                 self._write(items)
-                batch_len = len(items)
+                batch_len = count_items(items)
                 write_count += batch_len
                 progress.update(write_task, advance=batch_len, item_count=write_count)
                 self.write_queue.task_done()
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -15,35 +16,45 @@ def tarjan(dependencies_by_id: dict[T, set[T]]) -> list[set[T]]:
         A list of sets of ids that are strongly connected components in the dependency graph.
     """
 
-    stack = []
-    stack_set = set()
+    stack: list[T] = []
+    stack_set: set[T] = set()
     index: dict[T, int] = {}
-    lowlink = {}
-    result = []
+    lowlink: dict[T, int] = {}
+    result: list[set[T]] = []
 
-    def visit(v: T) -> None:
-        index[v] = len(index)
-        lowlink[v] = index[v]
-        stack.append(v)
-        stack_set.add(v)
-        for w in dependencies_by_id.get(v, []):
-            if w not in index:
-                visit(w)
-                lowlink[v] = min(lowlink[w], lowlink[v])
-            elif w in stack_set:
-                lowlink[v] = min(lowlink[v], index[w])
-        if lowlink[v] == index[v]:
-            scc = set()
-            dependency: T | None = None
-            while v != dependency:
-                dependency = stack.pop()
-                scc.add(dependency)
-                stack_set.remove(dependency)
-            result.append(scc)
-
-    for view_id in dependencies_by_id.keys():
-        if view_id not in index:
-            visit(view_id)
+    # The depth-first search is iterative, as a recursive search exceeds the recursion limit
+    # for deep dependency graphs. Each frame holds a node and the dependencies left to visit.
+    for root in dependencies_by_id.keys():
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        stack_set.add(root)
+        frames: list[tuple[T, Iterator[T]]] = [(root, iter(dependencies_by_id.get(root, [])))]
+        while frames:
+            v, dependencies = frames[-1]
+            for w in dependencies:
+                if w not in index:
+                    index[w] = lowlink[w] = len(index)
+                    stack.append(w)
+                    stack_set.add(w)
+                    frames.append((w, iter(dependencies_by_id.get(w, []))))
+                    break
+                elif w in stack_set:
+                    lowlink[v] = min(lowlink[v], index[w])
+            else:
+                frames.pop()
+                if lowlink[v] == index[v]:
+                    scc = set()
+                    dependency: T | None = None
+                    while v != dependency:
+                        dependency = stack.pop()
+                        scc.add(dependency)
+                        stack_set.remove(dependency)
+                    result.append(scc)
+                if frames:
+                    parent = frames[-1][0]
+                    lowlink[parent] = min(lowlink[v], lowlink[parent])
     return result
 
 
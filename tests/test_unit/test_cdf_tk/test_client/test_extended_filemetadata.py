@@ -1,10 +1,12 @@
 from collections.abc import Sequence
+from types import SimpleNamespace
 
 import pytest
 import respx
 from httpx import Response
 
 from cognite_toolkit._cdf_tk.client import ToolkitClient, ToolkitClientConfig
+from cognite_toolkit._cdf_tk.client.api import filemetadata as filemetadata_module
 from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, InternalId, InternalOrExternalId, NodeId
 from cognite_toolkit._cdf_tk.client.resource_classes.filemetadata import FileMetadataResponse
 from cognite_toolkit._cdf_tk.client.resource_classes.pending_instance_id import PendingInstanceId
@@ -93,3 +95,40 @@ class TestFileMetadataAPI:
 
         assert len(result) == 1
         assert isinstance(result[0], FileMetadataResponse)
+
+    def test_await_file_uploaded_reports_uploaded_files_per_poll(
+        self, toolkit_config: ToolkitClientConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client = ToolkitClient(config=toolkit_config)
+        polls = [
+            [self._file(1, uploaded=True), self._file(2, uploaded=False), self._file(3, uploaded=False)],
+            [self._file(2, uploaded=True), self._file(3, uploaded=False)],
+        ]
+        retrieved: list[list[InternalId]] = []
+
+        def retrieve(items: Sequence[InternalId]) -> list[FileMetadataResponse]:
+            retrieved.append(sorted(items, key=lambda item: item.id))
+            return polls[min(len(retrieved), len(polls)) - 1]
+
+        clock = [0.0]
+
+        def sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        monkeypatch.setattr(client.tool.filemetadata, "retrieve", retrieve)
+        monkeypatch.setattr(filemetadata_module, "time", SimpleNamespace(perf_counter=lambda: clock[0], sleep=sleep))
+        uploaded_per_poll: list[set[InternalId]] = []
+
+        failed, _ = client.tool.filemetadata.await_file_uploaded(
+            [InternalId(id=1), InternalId(id=2), InternalId(id=3)],
+            timeout_seconds=10,
+            on_uploaded=uploaded_per_poll.append,
+        )
+
+        assert uploaded_per_poll == [{InternalId(id=1)}, {InternalId(id=2)}]
+        assert retrieved[1] == [InternalId(id=2), InternalId(id=3)]
+        assert failed == {InternalId(id=3)}
+
+    @staticmethod
+    def _file(id_: int, uploaded: bool) -> FileMetadataResponse:
+        return FileMetadataResponse(id=id_, name=f"file_{id_}", created_time=0, last_updated_time=0, uploaded=uploaded)
@@ -0,0 +1,166 @@
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import respx
+
+from cognite_toolkit._cdf_tk.client import ToolkitClientConfig
+from cognite_toolkit._cdf_tk.client.api.instances import InstancesAPI, QueryChunkSizes
+from cognite_toolkit._cdf_tk.client.http_client import HTTPClient
+from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling import QueryRequest
+from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling._query import (
+    QueryNodeExpression,
+    QueryNodeTableExpression,
+    QuerySelect,
+)
+
+
+def node_query(limit: int = 1000, filter_: dict | None = None) -> QueryRequest:
+    return QueryRequest(
+        with_={"nodes": QueryNodeExpression(nodes=QueryNodeTableExpression(filter=filter_), limit=limit)},
+        select={"nodes": QuerySelect()},
+        root="nodes",
+    )
+
+
+class TestQueryChunkSizes:
+    def test_key_ignores_cursors_and_limits(self) -> None:
+        chunk_sizes = QueryChunkSizes()
+        query = node_query(limit=1000)
+        other = node_query(limit=10)
+        other.cursors = {"nodes": "cursor"}
+
+        assert chunk_sizes.create_key("query", query) == chunk_sizes.create_key("query", other)
+        assert chunk_sizes.create_key("query", query) != chunk_sizes.create_key("sync", query)
+
+    def test_key_ignores_literal_filter_values(self) -> None:
+        chunk_sizes = QueryChunkSizes()
+
+        def space_filter(space: str, property_: str = "space") -> dict:
+            return {
+                "and": [
+                    {"equals": {"property": ["node", property_], "value": space}},
+                    {"hasData": [{"type": "view", "space": space, "externalId": "MyView", "version": "v1"}]},
+                ]
+            }
+
+        key = chunk_sizes.create_key("query", node_query(filter_=space_filter("my_space")))
+
+        assert key == chunk_sizes.create_key("query", node_query(filter_=space_filter("other_space")))
+        assert key != chunk_sizes.create_key("query", node_query(filter_=space_filter("my_space", "externalId")))
+        assert key != chunk_sizes.create_key("query", node_query())
+
+    def test_chunk_sizes_are_persisted(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "chunk-sizes.json"
+        chunk_sizes = QueryChunkSizes(filepath, "my-project")
+        chunk_sizes.set("my-key", 250, 500)
+        assert not filepath.exists()
+
+        chunk_sizes.flush()
+
+        assert QueryChunkSizes(filepath, "my-project").get("my-key", 1000) == (250, 500)
+        assert QueryChunkSizes(filepath, "my-project").get("my-key", 100) == (100, 500)
+        assert QueryChunkSizes(filepath, "my-project").get("other-key", 1000) == (1000, 1001)
+
+    def test_expired_chunk_sizes_are_ignored(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        filepath = tmp_path / "chunk-sizes.json"
+        chunk_sizes = QueryChunkSizes(filepath, "my-project", ttl_seconds=60)
+        monkeypatch.setattr("cognite_toolkit._cdf_tk.client.api.instances.time.time", lambda: 1000.0)
+        chunk_sizes.set("my-key", 250, 500)
+        chunk_sizes.flush()
+
+        monkeypatch.setattr("cognite_toolkit._cdf_tk.client.api.instances.time.time", lambda: 1061.0)
+
+        assert "my-key" not in chunk_sizes
+        assert chunk_sizes.get("my-key", 1000) == (1000, 1001)
+        assert "my-key" not in QueryChunkSizes(filepath, "my-project", ttl_seconds=60)
+
+    def test_only_most_recently_updated_chunk_sizes_are_persisted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        filepath = tmp_path / "chunk-sizes.json"
+        chunk_sizes = QueryChunkSizes(filepath, "my-project", max_entries=2)
+        for no, key in enumerate(["first", "second", "third"]):
+            monkeypatch.setattr("cognite_toolkit._cdf_tk.client.api.instances.time.time", lambda no=no: 1000.0 + no)
+            chunk_sizes.set(key, 250, 500)
+        chunk_sizes.flush()
+
+        assert set(json.loads(filepath.read_text())) == {"second", "third"}
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "chunk-sizes.json"
+        filepath.write_text("not json")
+
+        assert QueryChunkSizes(filepath).get("my-key", 1000) == (1000, 1001)
+
+
+class TestInstancesAPIQuery:
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_learned_chunk_size_is_reused_between_calls(
+        self, toolkit_config: ToolkitClientConfig, respx_mock: respx.MockRouter
+    ) -> None:
+        api = InstancesAPI(HTTPClient(toolkit_config))
+        sent_limits: list[int] = []
+
+        def query_callback(request: httpx.Request) -> httpx.Response:
+            limit = json.loads(request.content.decode("utf-8"))["with"]["nodes"]["limit"]
+            sent_limits.append(limit)
+            if limit > 500:
+                return httpx.Response(status_code=408, json={"error": {"code": 408, "message": "Timeout"}})
+            return httpx.Response(status_code=200, json={"items": {"nodes": []}, "nextCursor": {"nodes": None}})
+
+        respx_mock.post(toolkit_config.create_api_url("/models/instances/query")).mock(side_effect=query_callback)
+
+        list(api.query_iterate(node_query()))
+        assert sent_limits == [1000, 500]
+
+        sent_limits.clear()
+        list(api.query_iterate(node_query()))
+        assert sent_limits == [500]
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_queries_that_never_time_out_are_not_stored(
+        self, toolkit_config: ToolkitClientConfig, respx_mock: respx.MockRouter, tmp_path: Path
+    ) -> None:
+        chunk_sizes = QueryChunkSizes(tmp_path / "chunk-sizes.json", "my-project")
+        api = InstancesAPI(HTTPClient(toolkit_config), chunk_sizes=chunk_sizes)
+        pages = iter(range(3))
+
+        def query_callback(request: httpx.Request) -> httpx.Response:
+            next_cursor = "cursor" if next(pages) < 2 else None
+            return httpx.Response(status_code=200, json={"items": {"nodes": []}, "nextCursor": {"nodes": next_cursor}})
+
+        respx_mock.post(toolkit_config.create_api_url("/models/instances/query")).mock(side_effect=query_callback)
+
+        list(api.query_iterate(node_query()))
+
+        assert chunk_sizes.create_key("query", node_query()) not in chunk_sizes
+        assert not (tmp_path / "chunk-sizes.json").exists()
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_chunk_sizes_are_written_once_per_stream(
+        self, toolkit_config: ToolkitClientConfig, respx_mock: respx.MockRouter, tmp_path: Path
+    ) -> None:
+        chunk_sizes = QueryChunkSizes(tmp_path / "chunk-sizes.json", "my-project")
+        write = MagicMock(side_effect=chunk_sizes._write)
+        chunk_sizes._write = write  # type: ignore[method-assign]
+        api = InstancesAPI(HTTPClient(toolkit_config), chunk_sizes=chunk_sizes)
+        pages = iter(range(5))
+
+        def query_callback(request: httpx.Request) -> httpx.Response:
+            limit = json.loads(request.content.decode("utf-8"))["with"]["nodes"]["limit"]
+            if limit > 100:
+                return httpx.Response(status_code=408, json={"error": {"code": 408, "message": "Timeout"}})
+            next_cursor = "cursor" if next(pages) < 4 else None
+            return httpx.Response(status_code=200, json={"items": {"nodes": []}, "nextCursor": {"nodes": next_cursor}})
+
+        respx_mock.post(toolkit_config.create_api_url("/models/instances/query")).mock(side_effect=query_callback)
+
+        list(api.query_iterate(node_query()))
+
+        write.assert_called_once()
+        assert QueryChunkSizes(tmp_path / "chunk-sizes.json", "my-project").get(
+            chunk_sizes.create_key("query", node_query()), 1000
+        ) == chunk_sizes.get(chunk_sizes.create_key("query", node_query()), 1000)
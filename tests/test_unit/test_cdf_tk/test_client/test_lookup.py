@@ -1,5 +1,9 @@
+import gc
 import json
+import sqlite3
 from collections.abc import Iterator, Sequence
+from pathlib import Path
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
@@ -10,6 +14,8 @@ from cognite.client.data_classes._base import CogniteResource
 from cognite.client.data_classes.capabilities import Capability, EventsAcl, FilesAcl
 
 from cognite_toolkit._cdf_tk.client import ToolkitClient, ToolkitClientConfig
+from cognite_toolkit._cdf_tk.client.api.lookup import DataSetLookUpAPI, LocationFiltersLookUpAPI, LookUpCache
+from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, InternalId
 from cognite_toolkit._cdf_tk.exceptions import AuthorizationError
 from tests.test_unit.utils import FakeCogniteResourceGenerator
 
@@ -161,3 +167,79 @@ class TestLookup:
         rsps.post(config.create_api_url(f"{endpoint}/byids")).mock(side_effect=retrieve_multiple_callback)
         client = ToolkitClient(config)
         return client
+
+
+class TestLookUpCache:
+    def test_set_get_and_invalidate(self, tmp_path: Path) -> None:
+        cache = LookUpCache(tmp_path / "cache.sqlite", project_key="my-project")
+        cache.set("Asset", {"ext-1": 1, "ext-2": 2})
+
+        assert cache.get_ids("Asset", ["ext-1", "ext-2", "ext-3"]) == {"ext-1": 1, "ext-2": 2}
+        assert cache.get_external_ids("Asset", [2, 3]) == {2: "ext-2"}
+        assert cache.get_ids("Event", ["ext-1"]) == {}
+        assert LookUpCache(tmp_path / "cache.sqlite", project_key="other-project").get_ids("Asset", ["ext-1"]) == {}
+
+        cache.invalidate("Asset", external_ids=["ext-1"], ids=[2])
+        assert cache.get_ids("Asset", ["ext-1", "ext-2"]) == {}
+
+    def test_expired_entries_are_ignored(self, tmp_path: Path) -> None:
+        cache = LookUpCache(tmp_path / "cache.sqlite", project_key="my-project", ttl_seconds=-1)
+        cache.set("Asset", {"ext-1": 1})
+
+        assert cache.get_ids("Asset", ["ext-1"]) == {}
+
+    def test_lookup_is_reused_between_clients(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache.sqlite"
+        first_client = MagicMock()
+        first_client.data_sets.retrieve_multiple.return_value = [MagicMock(external_id="ds-1", id=1)]
+        first = DataSetLookUpAPI(MagicMock(), first_client, MagicMock(), LookUpCache(cache_path, "my-project"))
+        assert first.id("ds-1") == 1
+
+        second_client = MagicMock()
+        second = DataSetLookUpAPI(MagicMock(), second_client, MagicMock(), LookUpCache(cache_path, "my-project"))
+        assert second.id("ds-1") == 1
+        assert second.external_id(1) == "ds-1"
+        second_client.data_sets.retrieve_multiple.assert_not_called()
+
+        second.invalidate_identifiers([ExternalId(external_id="ds-1"), InternalId(id=2)])
+        second_client.data_sets.retrieve_multiple.return_value = [MagicMock(external_id="ds-1", id=3)]
+        assert second.id("ds-1") == 3
+
+    def test_close(self, tmp_path: Path) -> None:
+        cache = LookUpCache(tmp_path / "cache.sqlite", project_key="my-project")
+        cache.close()
+
+        assert cache.is_closed
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get_ids("Asset", ["ext-1"])
+
+    def test_connection_is_closed_when_cache_is_garbage_collected(self, tmp_path: Path) -> None:
+        cache = LookUpCache(tmp_path / "cache.sqlite", project_key="my-project")
+        connection = cache._connection
+        del cache
+        gc.collect()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+    def test_invalidate_lists_all_resources_again(self) -> None:
+        client = MagicMock()
+        client.tool.location_filters.list.return_value = [MagicMock(external_id="loc", id=1)]
+        lookup = LocationFiltersLookUpAPI(MagicMock(), client, MagicMock())
+        assert lookup.id("loc") == 1
+
+        lookup.invalidate_identifiers([ExternalId(external_id="loc")])
+        client.tool.location_filters.list.return_value = [MagicMock(external_id="loc", id=2)]
+
+        assert lookup.id("loc") == 2
+
+    def test_prefetch(self) -> None:
+        client = MagicMock()
+        client.data_sets.list.return_value = [MagicMock(external_id=f"ds-{no}", id=no) for no in range(1, 4)]
+        lookup = DataSetLookUpAPI(MagicMock(), client, MagicMock())
+
+        lookup.prefetch()
+
+        assert lookup.id(["ds-1", "ds-3"]) == [1, 3]
+        assert lookup.external_id(2) == "ds-2"
+        client.data_sets.retrieve_multiple.assert_not_called()
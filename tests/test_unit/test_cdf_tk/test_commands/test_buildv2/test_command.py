@@ -1,3 +1,4 @@
+import threading
 from io import StringIO
 from pathlib import Path
 from typing import Any
@@ -9,8 +10,9 @@ from rich.console import Console
 
 from cognite_toolkit._cdf_tk.client._toolkit_client import ToolkitClient
 from cognite_toolkit._cdf_tk.client.config import ToolkitClientConfig
-from cognite_toolkit._cdf_tk.client.identifiers import ViewId, ViewNoVersionId
+from cognite_toolkit._cdf_tk.client.identifiers import SpaceId, ViewId, ViewNoVersionId
 from cognite_toolkit._cdf_tk.commands import BuildV2Command
+from cognite_toolkit._cdf_tk.commands.build_v2.build_v2 import ValidationStep
 from cognite_toolkit._cdf_tk.commands.build_v2.data_classes import BuildParameters, RelativeDirPath
 from cognite_toolkit._cdf_tk.commands.build_v2.data_classes._build import BuiltModule, BuiltResource
 from cognite_toolkit._cdf_tk.commands.build_v2.data_classes._insights import InsightList, ModelSyntaxWarning
@@ -31,7 +33,10 @@ from cognite_toolkit._cdf_tk.resource_ios import FileMetadataCRUD, SearchConfigI
 from cognite_toolkit._cdf_tk.resource_ios._base_ios import ResourceIO
 from cognite_toolkit._cdf_tk.resource_ios._resource_ios.datamodel import DataModelIO, ViewIO
 from cognite_toolkit._cdf_tk.resource_ios._resource_ios.workflow import WorkflowIO
+from cognite_toolkit._cdf_tk.rules import ToolkitGlobalRuleSet, get_global_rules_registry
+from cognite_toolkit._cdf_tk.rules._base import RuleSetStatus
 from cognite_toolkit._cdf_tk.rules._dependencies import DependencyRuleSet
+from cognite_toolkit._cdf_tk.utils import calculate_hash
 
 BASE_URL = "http://neat.cognitedata.com"
 
@@ -260,6 +265,112 @@ class TestDependencyValidationSearchConfig:
         result = list(DependencyRuleSet([module]).validate())
         assert len(result) == 0
 
+    def test_cdf_lookups_are_cached_per_client(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        module, source_file, build_file = self._minimal_module(tmp_path)
+        module.resources.append(
+            BuiltResource(
+                identifier=ViewId(space="my_space", external_id="View1", version="v1"),
+                source_hash="h-view",
+                type=ResourceType(resource_folder=ViewIO.folder_name, kind=ViewIO.kind),
+                source_path=AbsoluteFilePath(source_file.resolve()),
+                build_path=AbsoluteFilePath(build_file.resolve()),
+                crud_cls=ViewIO,
+                dependencies={(SpaceCRUD, SpaceId(space="my_space")), (SpaceCRUD, SpaceId(space="missing_space"))},
+                has_syntax_error=False,
+            )
+        )
+        retrieve = MagicMock(return_value=[{"space": "my_space"}])
+        monkeypatch.setattr(SpaceCRUD, "retrieve", retrieve)
+        client = MagicMock()
+        client.config.project = "my_project"
+
+        first = list(DependencyRuleSet([module], client).validate())
+        second = list(DependencyRuleSet([module], client).validate())
+
+        assert [insight.message for insight in first] == [insight.message for insight in second]
+        assert len(first) == 1
+        assert "missing_space" in first[0].message
+        retrieve.assert_called_once()
+
+
+class TestRunValidation:
+    @staticmethod
+    def _step(
+        code_prefix: str,
+        finished: list[str],
+        depends_on: frozenset[str] = frozenset(),
+        is_thread_safe: bool = True,
+        thread_by_prefix: dict[str, str] | None = None,
+    ) -> ValidationStep:
+        def validate() -> list[ModelSyntaxWarning]:
+            finished.append(code_prefix)
+            if thread_by_prefix is not None:
+                thread_by_prefix[code_prefix] = threading.current_thread().name
+            return [ModelSyntaxWarning(code=code_prefix, message=f"From {code_prefix}")]
+
+        rule = MagicMock(
+            CODE_PREFIX=code_prefix, DISPLAY_NAME=code_prefix, DEPENDS_ON=depends_on, IS_THREAD_SAFE=is_thread_safe
+        )
+        rule.validate.side_effect = validate
+        return ValidationStep(status=RuleSetStatus(code="ready"), rule=rule)
+
+    def test_results_in_plan_order_and_dependencies_respected(self) -> None:
+        finished: list[str] = []
+        plan = [
+            self._step("SECOND", finished, depends_on=frozenset({"FIRST"})),
+            self._step("FIRST", finished),
+            self._step("NOT-PLANNED-DEPENDENCY", finished, depends_on=frozenset({"UNKNOWN"})),
+        ]
+        plan.append(ValidationStep(status=RuleSetStatus(code="skip"), rule=MagicMock(DISPLAY_NAME="SKIPPED")))
+        console = Console(file=StringIO())
+
+        results = BuildV2Command()._run_validation(plan, console, verbose=True)
+
+        assert [result.name for result in results] == ["SECOND", "FIRST", "NOT-PLANNED-DEPENDENCY"]
+        assert [result.insights[0].message for result in results] == [
+            "From SECOND",
+            "From FIRST",
+            "From NOT-PLANNED-DEPENDENCY",
+        ]
+        assert finished.index("FIRST") < finished.index("SECOND")
+        assert "Validation timings" in console.file.getvalue()
+
+    def test_not_thread_safe_rule_sets_run_serially_after_the_others(self) -> None:
+        finished: list[str] = []
+        thread_by_prefix: dict[str, str] = {}
+        plan = [
+            self._step("SERIAL-1", finished, is_thread_safe=False, thread_by_prefix=thread_by_prefix),
+            self._step("CONCURRENT", finished, thread_by_prefix=thread_by_prefix),
+            self._step("SERIAL-2", finished, is_thread_safe=False, thread_by_prefix=thread_by_prefix),
+        ]
+
+        results = BuildV2Command()._run_validation(plan, Console(file=StringIO()))
+
+        assert [result.name for result in results] == ["SERIAL-1", "CONCURRENT", "SERIAL-2"]
+        assert finished == ["CONCURRENT", "SERIAL-1", "SERIAL-2"]
+        main_thread = threading.main_thread().name
+        assert thread_by_prefix["SERIAL-1"] == thread_by_prefix["SERIAL-2"] == main_thread
+        assert thread_by_prefix["CONCURRENT"] != main_thread
+
+    def test_dependency_cycle_still_runs_all_rule_sets(self) -> None:
+        finished: list[str] = []
+        plan = [
+            self._step("A", finished, depends_on=frozenset({"B"})),
+            self._step("B", finished, depends_on=frozenset({"A"})),
+        ]
+
+        results = BuildV2Command()._run_validation(plan, Console(file=StringIO()))
+
+        assert [result.name for result in results] == ["A", "B"]
+        assert sorted(finished) == ["A", "B"]
+
+    @pytest.mark.parametrize("rule_set_cls", get_global_rules_registry(force_reload=True))
+    def test_rule_sets_declare_dependencies_and_thread_safety(self, rule_set_cls: type[ToolkitGlobalRuleSet]) -> None:
+        assert "DEPENDS_ON" in vars(rule_set_cls)
+        assert "IS_THREAD_SAFE" in vars(rule_set_cls)
+        known_prefixes = {rule_set.CODE_PREFIX for rule_set in get_global_rules_registry()}
+        assert rule_set_cls.DEPENDS_ON <= known_prefixes
+
 
 class TestValidateBuildParameters:
     @pytest.mark.parametrize(
@@ -677,6 +788,22 @@ class TestReadResourceFile:
         assert len(result.resources) == expected_resource_count
         assert has_syntax_warning == (result.syntax_warning is not None)
 
+    def test_files_with_same_content_are_read_independently(self, tmp_path: Path) -> None:
+        content = "space: my_space\r\nname: My space\r\n"
+        first_file = tmp_path / "first.Space.yaml"
+        second_file = tmp_path / "second.Space.yaml"
+        first_file.write_bytes(content.encode("utf-8"))
+        second_file.write_bytes(content.encode("utf-8"))
+        cmd = BuildV2Command()
+
+        first = cmd._read_resource_file(AbsoluteFilePath(first_file), SpaceCRUD, [])
+        second = cmd._read_resource_file(AbsoluteFilePath(second_file), SpaceCRUD, [])
+
+        assert isinstance(first, SuccessfulReadYAMLFile) and isinstance(second, SuccessfulReadYAMLFile)
+        assert first.source_hash == second.source_hash == calculate_hash(first_file, shorten=True)
+        assert first.resources[0].raw == second.resources[0].raw == {"space": "my_space", "name": "My space"}
+        assert first.resources[0].raw is not second.resources[0].raw
+
 
 class TestFindUnresolvedVariables:
     @pytest.mark.parametrize(
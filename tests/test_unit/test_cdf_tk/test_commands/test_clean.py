@@ -1,5 +1,19 @@
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, RawDatabaseId
+from cognite_toolkit._cdf_tk.client.resource_classes.raw import RAWDatabaseResponse
+from cognite_toolkit._cdf_tk.client.resource_classes.streams import StreamResponse
+from cognite_toolkit._cdf_tk.client.testing import ToolkitClientMock
 from cognite_toolkit._cdf_tk.commands import CleanCommand
+from cognite_toolkit._cdf_tk.data_classes import ResourceDeployResult
 from cognite_toolkit._cdf_tk.data_classes._config_yaml import BuildEnvironment
+from cognite_toolkit._cdf_tk.resource_ios import ContainerCRUD, RawDatabaseCRUD, SpaceCRUD, StreamIO, ViewIO
 
 
 class TestCleanCommandSelectModules:
@@ -14,3 +28,103 @@ class TestCleanCommandSelectModules:
         result = cmd._select_modules(build_environment, module_str="my_example_module")
         assert len(result) == 1
         assert result[0].dir.name == "my_example_module", f"Expected 'my_example_module', got {result[0].dir.name}"
+
+
+class TestCleanCommandConcurrency:
+    def test_independent_resource_types_are_cleaned_concurrently(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        client = ToolkitClientMock()
+        loader_classes = [ViewIO, ContainerCRUD, RawDatabaseCRUD, SpaceCRUD]
+        loaders = [loader_cls.create_loader(client, Path("build")) for loader_cls in loader_classes]
+        dependencies = {loader_cls: loader_cls.dependencies for loader_cls in loader_classes}
+        events: list[str] = []
+        raw_started = threading.Event()
+
+        def clean_resources(loader: Any, console: Console, **_: Any) -> ResourceDeployResult:
+            name = type(loader).__name__
+            events.append(f"start {name}")
+            if isinstance(loader, RawDatabaseCRUD):
+                raw_started.set()
+            elif isinstance(loader, ViewIO):
+                # Raw databases do not depend on views, so they are cleaned in the meantime.
+                assert raw_started.wait(timeout=5)
+            console.print(f"Cleaned {name}")
+            events.append(f"end {name}")
+            return ResourceDeployResult(name=name, deleted=1)
+
+        cmd = CleanCommand(silent=True, skip_tracking=True)
+        monkeypatch.setattr(cmd, "clean_resources", clean_resources)
+
+        results = cmd._clean_concurrently(loaders, dependencies, MagicMock(), [], dry_run=True, verbose=False)
+
+        assert [result.name for result in results if result] == [loader_cls.__name__ for loader_cls in loader_classes]
+        assert events.index("start ContainerCRUD") > events.index("end ViewIO")
+        assert events.index("start SpaceCRUD") > events.index("end ContainerCRUD")
+        assert events.index("start RawDatabaseCRUD") < events.index("end ViewIO")
+        output = capsys.readouterr().out
+        positions = [output.index(f"Cleaned {loader_cls.__name__}") for loader_cls in loader_classes]
+        assert positions == sorted(positions)
+
+    def test_clean_resources_asks_for_confirmation_in_main_thread(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        (tmp_path / "streams").mkdir()
+        (tmp_path / "streams" / "my.Streams.yaml").write_text(
+            "externalId: my-stream\nsettings:\n  template:\n    name: BasicLiveData\n", encoding="utf-8"
+        )
+        (tmp_path / "raw").mkdir()
+        (tmp_path / "raw" / "my.Database.yaml").write_text("dbName: my_db\n", encoding="utf-8")
+        client = ToolkitClientMock()
+        client.streams.retrieve.return_value = [
+            StreamResponse.model_validate(
+                {
+                    "externalId": "my-stream",
+                    "createdTime": 0,
+                    "createdFromTemplate": "BasicLiveData",
+                    "type": "Mutable",
+                }
+            )
+        ]
+        client.tool.raw.databases.list.return_value = [RAWDatabaseResponse(name="my_db", created_time=0)]
+        loader_classes = [StreamIO, RawDatabaseCRUD]
+        loaders = [loader_cls.create_loader(client, tmp_path) for loader_cls in loader_classes]
+        dependencies = {loader_cls: loader_cls.dependencies for loader_cls in loader_classes}
+        confirm_threads: list[threading.Thread] = []
+
+        def confirm(message: str, default: bool) -> MagicMock:
+            assert message == StreamIO.drop_confirmation_message
+            confirm_threads.append(threading.current_thread())
+            return MagicMock(ask=MagicMock(return_value=True))
+
+        monkeypatch.setattr("cognite_toolkit._cdf_tk.commands.clean.questionary.confirm", confirm)
+        env_vars = MagicMock()
+        env_vars.dump.return_value = {}
+        cmd = CleanCommand(silent=True, skip_tracking=True)
+
+        results = cmd._clean_concurrently(loaders, dependencies, env_vars, [], dry_run=False, verbose=False)
+
+        assert confirm_threads == [threading.main_thread()]
+        client.streams.delete.assert_called_once_with([ExternalId(external_id="my-stream")], ignore_unknown_ids=True)
+        client.tool.raw.databases.delete.assert_called_once_with([RawDatabaseId(name="my_db")])
+        assert [(result.name, result.deleted) for result in results if result] == [("streams", 1), ("raw databases", 1)]
+        output = capsys.readouterr().out
+        assert output.index("Cleaning 1 streams") < output.index("Cleaning 1 raw databases")
+
+    @pytest.mark.parametrize(
+        "counts, expected",
+        [
+            pytest.param([3, 4, 5], 12, id="Sum of chunks"),
+            pytest.param([3, -1, 5], -1, id="Count not supported"),
+        ],
+    )
+    def test_drop_data_in_chunks(self, counts: list[int], expected: int) -> None:
+        count_by_chunk = {f"id{no}": count for no, count in enumerate(counts)}
+        chunks: list[list[str]] = []
+
+        def count(ids: list[str]) -> int:
+            chunks.append(list(ids))
+            return sum(count_by_chunk[id_] for id_ in ids)
+
+        assert CleanCommand._run_in_chunks(count, list(count_by_chunk), chunk_size=1) == expected
+        assert sorted(chunks) == [["id0"], ["id1"], ["id2"]]
@@ -2,7 +2,7 @@ import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
@@ -27,6 +27,8 @@ from cognite_toolkit._cdf_tk.commands.deploy_v2.command import (
     ResourceToDeploy,
     Skipped,
 )
+from cognite_toolkit._cdf_tk.commands.deploy_v2.incremental import DeployedLineage
+from cognite_toolkit._cdf_tk.commands.deploy_v2.snapshot import RemoteStateSnapshot
 from cognite_toolkit._cdf_tk.exceptions import (
     AuthorizationError,
     ResourceCreationError,
@@ -39,6 +41,7 @@ from cognite_toolkit._cdf_tk.resource_ios import (
     CogniteFileCRUD,
     ContainerCRUD,
     DataSetsIO,
+    FunctionIO,
     FunctionScheduleIO,
     LabelIO,
     RawDatabaseCRUD,
@@ -611,6 +614,120 @@ class TestDeployResourcesValidationError:
         ]
 
 
+class TestRemoteStateSnapshot:
+    def test_snapshot_is_reused_until_deploy_changes_resources(self, tmp_path: Path) -> None:
+        existing = tmp_path / "data_modeling" / "existing.Space.yaml"
+        new = tmp_path / "data_modeling" / "new.Space.yaml"
+        existing.parent.mkdir(parents=True)
+        existing.write_text("space: existing_space\n")
+        new.write_text("space: new_space\n")
+        plan = [DeploymentStep(SpaceCRUD, [existing, new])]
+        snapshot_path = tmp_path / RemoteStateSnapshot.filename
+
+        with monkeypatch_toolkit_client() as client:
+            client.tool.token.verify_acls.return_value = []
+            client.tool.spaces.retrieve.return_value = [
+                SpaceResponse(space="existing_space", created_time=0, last_updated_time=0, is_global=False)
+            ]
+
+            for _ in range(2):
+                dry_run = DeployV2Command.apply_plan(
+                    client,
+                    plan,
+                    DeployOptions(dry_run=True),
+                    snapshot=RemoteStateSnapshot(snapshot_path, "my_project"),
+                )
+                assert (dry_run[0].created_count, dry_run[0].unchanged_count) == (1, 1)
+            assert client.tool.spaces.retrieve.call_count == 1
+
+            DeployV2Command.apply_plan(
+                client, plan, DeployOptions(dry_run=False), snapshot=RemoteStateSnapshot(snapshot_path, "my_project")
+            )
+            assert client.tool.spaces.retrieve.call_count == 1
+            client.tool.spaces.create.assert_called_once()
+
+            DeployV2Command.apply_plan(
+                client, plan, DeployOptions(dry_run=True), snapshot=RemoteStateSnapshot(snapshot_path, "my_project")
+            )
+            assert client.tool.spaces.retrieve.call_count == 2
+
+    def test_function_change_discards_schedule_snapshot(self, tmp_path: Path) -> None:
+        function_dir = tmp_path / "functions"
+        (function_dir / "my_function").mkdir(parents=True)
+        (function_dir / "my_function" / "handler.py").write_text("def handle():\n    return 1\n")
+        function_file = function_dir / "my.Function.yaml"
+        function_file.write_text("externalId: my_function\nname: my function\nfunctionPath: handler.py\n")
+        schedule_file = function_dir / "my.Schedule.yaml"
+        schedule_file.write_text(
+            "cronExpression: '* * * * *'\nname: my schedule\nfunctionExternalId: my_function\n"
+            "authentication:\n  clientId: test_id\n  clientSecret: test_secret\n"
+        )
+        plan = [DeploymentStep(FunctionIO, [function_file]), DeploymentStep(FunctionScheduleIO, [schedule_file])]
+        snapshot_path = tmp_path / RemoteStateSnapshot.filename
+
+        with monkeypatch_toolkit_client() as client, patch.object(DeployV2Command, "deploy_resources") as deploy:
+            client.tool.token.verify_acls.return_value = []
+            client.functions.status.return_value.status = "activated"
+            client.tool.functions.schedules.list.return_value = []
+
+            DeployV2Command.apply_plan(
+                client, plan, DeployOptions(dry_run=True), snapshot=RemoteStateSnapshot(snapshot_path, "my_project")
+            )
+            assert client.tool.functions.schedules.list.call_count == 1
+
+            # Functions cannot be updated, so the function is recreated, which deletes its schedules.
+            function_file.write_text("externalId: my_function\nname: my renamed function\nfunctionPath: handler.py\n")
+            DeployV2Command.apply_plan(
+                client, plan, DeployOptions(dry_run=False), snapshot=RemoteStateSnapshot(snapshot_path, "my_project")
+            )
+
+        assert deploy.call_count == 2
+        assert client.tool.functions.schedules.list.call_count == 2
+
+    def test_stale_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        crud = SpaceCRUD.create_loader(ToolkitClientMock())
+        ids = [SpaceId(space="my_space")]
+        response = SpaceResponse(space="my_space", created_time=0, last_updated_time=0, is_global=False)
+        RemoteStateSnapshot(tmp_path / "snapshot.json", "my_project").set(crud, ids, [response])
+
+        assert RemoteStateSnapshot(tmp_path / "snapshot.json", "my_project").get(crud, ids) == [response]
+        assert RemoteStateSnapshot(tmp_path / "snapshot.json", "other_project").get(crud, ids) is None
+        assert RemoteStateSnapshot(tmp_path / "snapshot.json", "my_project", max_age_seconds=-1).get(crud, ids) is None
+
+
+class TestIncrementalDeploy:
+    def test_only_changed_resources_are_compared(self, tmp_path: Path) -> None:
+        first = tmp_path / "data_modeling" / "first.Space.yaml"
+        second = tmp_path / "data_modeling" / "second.Space.yaml"
+        first.parent.mkdir(parents=True)
+        first.write_text("space: first_space\n")
+        second.write_text("space: second_space\n")
+        plan = [DeploymentStep(SpaceCRUD, [first, second])]
+        lineage_path = tmp_path / "deployed-lineage.json"
+
+        with monkeypatch_toolkit_client() as client:
+            client.tool.token.verify_acls.return_value = []
+            client.tool.spaces.retrieve.return_value = [
+                SpaceResponse(space=space, created_time=0, last_updated_time=0, is_global=False)
+                for space in ["first_space", "second_space"]
+            ]
+            deployed = DeployedLineage(lineage_path, "my_key")
+            assert deployed.is_full_reconcile
+            DeployV2Command.apply_plan(client, plan, DeployOptions(dry_run=False), deployed=deployed)
+            deployed.save()
+
+            second.write_text("space: second_space\nname: Second\n")
+            deployed = DeployedLineage(lineage_path, "my_key")
+            assert not deployed.is_full_reconcile
+            results = DeployV2Command.apply_plan(client, plan, DeployOptions(dry_run=True), deployed=deployed)
+
+            client.tool.spaces.retrieve.assert_called_with([SpaceId(space="second_space")])
+            assert (results[0].updated_count, results[0].unchanged_count) == (1, 1)
+
+        assert DeployedLineage(lineage_path, "my_key", full_reconcile_seconds=-1).is_full_reconcile
+        assert DeployedLineage(lineage_path, "other_key").is_full_reconcile
+
+
 class TestDetectKeyColumn:
     """Unit tests for DeployV2Command._detect_key_column."""
 
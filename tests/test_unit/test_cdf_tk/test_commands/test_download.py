@@ -1,41 +1,52 @@
+import gzip
 from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
 
 from cognite_toolkit._cdf_tk.client.cdf_client import PagedResponse
 from cognite_toolkit._cdf_tk.client.resource_classes.asset import AssetAggregateItem, AssetResponse
 from cognite_toolkit._cdf_tk.client.resource_classes.transformation import SQLQueryResponse
 from cognite_toolkit._cdf_tk.client.testing import monkeypatch_toolkit_client
 from cognite_toolkit._cdf_tk.commands import DownloadCommand
+from cognite_toolkit._cdf_tk.commands._download import DownloadStep
 from cognite_toolkit._cdf_tk.dataio import AssetDataIO
 from cognite_toolkit._cdf_tk.dataio.selectors import DataSetSelector
-from cognite_toolkit._cdf_tk.utils.fileio import CSVReader
+from cognite_toolkit._cdf_tk.exceptions import ToolkitValueError
+from cognite_toolkit._cdf_tk.utils.fileio import CSVReader, SchemaColumn
+from cognite_toolkit._cdf_tk.utils.fileio._writers import ParquetWriter
 
 
 class TestDownloadCommand:
+    @staticmethod
+    def _set_up_asset(client: MagicMock, dataset: str) -> None:
+        client.assets.aggregate_count.return_value = 1
+        client.tool.assets.paginate.return_value = PagedResponse(
+            items=[
+                AssetResponse(
+                    id=123,
+                    name="asset_123",
+                    metadata={"key": "value"},
+                    dataSetId=42,
+                    aggregates=AssetAggregateItem(childCount=1, depth=0, path=[]),
+                    createdTime=0,
+                    lastUpdatedTime=0,
+                    rootId=0,
+                )
+            ]
+        )
+
+        client.lookup.data_sets.id.return_value = 42
+        client.lookup.data_sets.external_id.return_value = dataset
+        client.tool.transformations.preview.return_value = SQLQueryResponse(
+            schema_=[], results=[{"key": "key", "key_count": 1}]
+        )
+
     def test_download_data_in_table_format(self, tmp_path: Path) -> None:
         cmd = DownloadCommand(silent=True, skip_tracking=True)
         with monkeypatch_toolkit_client() as client:
             dataset = "my/:_data_set"
-            client.assets.aggregate_count.return_value = 1
-            client.tool.assets.paginate.return_value = PagedResponse(
-                items=[
-                    AssetResponse(
-                        id=123,
-                        name="asset_123",
-                        metadata={"key": "value"},
-                        dataSetId=42,
-                        aggregates=AssetAggregateItem(childCount=1, depth=0, path=[]),
-                        createdTime=0,
-                        lastUpdatedTime=0,
-                        rootId=0,
-                    )
-                ]
-            )
-
-            client.lookup.data_sets.id.return_value = 42
-            client.lookup.data_sets.external_id.return_value = dataset
-            client.tool.transformations.preview.return_value = SQLQueryResponse(
-                schema_=[], results=[{"key": "key", "key_count": 1}]
-            )
+            self._set_up_asset(client, dataset)
 
             cmd.download(
                 selectors=[DataSetSelector(kind="Assets", data_set_external_id=dataset, download_dir_name="assets")],
@@ -66,3 +77,64 @@ class TestDownloadCommand:
                     "path": "",
                 }
             ]
+
+    def test_download_with_compression_level(self, tmp_path: Path) -> None:
+        cmd = DownloadCommand(silent=True, skip_tracking=True)
+        with monkeypatch_toolkit_client() as client:
+            self._set_up_asset(client, "my_data_set")
+
+            cmd.download(
+                selectors=[
+                    DataSetSelector(kind="Assets", data_set_external_id="my_data_set", download_dir_name="assets")
+                ],
+                io=AssetDataIO(client=client),
+                output_dir=tmp_path,
+                verbose=False,
+                file_format=".ndjson",
+                compression="gzip",
+                limit=-1,
+                compression_level=0,
+            )
+
+        gzip_files = list(tmp_path.rglob("*.ndjson.gz"))
+        assert len(gzip_files) == 1
+        # Level 0 stores the data without compressing it.
+        assert b"asset_123" in gzip_files[0].read_bytes()
+        assert b"asset_123" in gzip.decompress(gzip_files[0].read_bytes())
+
+    def test_invalid_compression_level_fails_before_download(self, tmp_path: Path) -> None:
+        cmd = DownloadCommand(silent=True, skip_tracking=True)
+        with monkeypatch_toolkit_client() as client:
+            self._set_up_asset(client, "my_data_set")
+
+            with pytest.raises(ToolkitValueError, match="Invalid compression level 10 for gzip"):
+                cmd.download(
+                    selectors=[
+                        DataSetSelector(kind="Assets", data_set_external_id="my_data_set", download_dir_name="assets")
+                    ],
+                    io=AssetDataIO(client=client),
+                    output_dir=tmp_path,
+                    verbose=False,
+                    file_format=".ndjson",
+                    compression="gzip",
+                    limit=-1,
+                    compression_level=10,
+                )
+
+            client.assets.aggregate_count.assert_not_called()
+
+    def test_parquet_writer_uses_row_group_size(self, tmp_path: Path) -> None:
+        step = DownloadStep(
+            selector=DataSetSelector(kind="Assets", data_set_external_id="my_data_set", download_dir_name="assets"),
+            count=1,
+            filestem="assets",
+            target_dir=tmp_path,
+            schema=[SchemaColumn(name="id", type="integer")],
+            format_type="table",
+            limit=None,
+        )
+
+        writer = DownloadCommand._create_data_file_writer(step, ".parquet", "none", row_group_size=10_000)
+
+        assert isinstance(writer, ParquetWriter)
+        assert writer.row_group_size == 10_000
@@ -523,6 +523,33 @@ class TestDumpExtractionPipeline:
             )
             assert items == expected
 
+    def test_dump_extraction_pipelines_prefetches_data_sets(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        original = FeatureFlag.is_enabled
+        monkeypatch.setattr(FeatureFlag, "is_enabled", lambda flag: flag is Flags.LOOKUP_CACHE or original(flag))
+        pipelines = [
+            ExtractionPipelineResponse(
+                id=2,
+                external_id="pipelineB",
+                name="Pipeline B",
+                data_set_id=123,
+                created_time=1,
+                last_updated_time=1,
+            ),
+        ]
+        with monkeypatch_toolkit_client() as toolkit_client:
+            approval_client = ApprovalToolkitClient(toolkit_client, allow_reverse_lookup=True)
+            approval_client.append(ExtractionPipelineResponse, pipelines)
+
+            client = approval_client.mock_client
+            DumpResourceCommand(silent=True).dump_to_yamls(
+                ExtractionPipelineFinder(client, ("pipelineB",)),
+                output_dir=tmp_path,
+                clean=False,
+                verbose=False,
+            )
+
+            client.lookup.prefetch.assert_called_once_with("data_sets")
+
 
 @pytest.fixture()
 def three_hosted_extractor_sources() -> list[MQTTSourceResponse]:
@@ -1,5 +1,6 @@
 import itertools
 import json
+import threading
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
@@ -32,9 +33,18 @@ from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling import (
 from cognite_toolkit._cdf_tk.client.resource_classes.filemetadata import FileMetadataResponse
 from cognite_toolkit._cdf_tk.client.resource_classes.timeseries import TimeSeriesResponse
 from cognite_toolkit._cdf_tk.commands import PurgeCommand
+from cognite_toolkit._cdf_tk.commands._purge import (
+    DataModelingToDelete,
+    EdgeToDelete,
+    NodesToDelete,
+    SyncCheckpoint,
+    ToDelete,
+)
 from cognite_toolkit._cdf_tk.commands._utils import validate_soft_delete_capacity
+from cognite_toolkit._cdf_tk.dataio.progress import CursorBookmark, ProgressYAML
 from cognite_toolkit._cdf_tk.dataio.selectors import InstanceViewSelector, SelectedView
 from cognite_toolkit._cdf_tk.exceptions import ToolkitValueError
+from cognite_toolkit._cdf_tk.resource_ios import DataModelIO, EdgeCRUD, NodeCRUD
 from tests.test_unit.utils import FakeCogniteResourceGenerator
 
 
@@ -412,6 +422,9 @@ class TestPurgeSpace:
                 )
             edge_items = [gen.create_instance(EdgeResponse) for _ in range(edge_count)]
             node_items = [gen.create_instance(NodeResponse) for _ in range(node_count)]
+            for instance in [*edge_items, *node_items]:
+                # Deleted instances are tombstones in the sync response, and are not purged.
+                instance.deleted_time = None
 
             def list_instances_query_callback(request: httpx.Request) -> httpx.Response:
                 body = json.loads(request.content.decode("utf-8"))
@@ -422,7 +435,7 @@ class TestPurgeSpace:
                     json={"items": {"root": [item.dump() for item in items]}, "nextCursor": {"root": None}},
                 )
 
-            respx_mock.post(config.create_api_url("/models/instances/query")).mock(
+            respx_mock.post(config.create_api_url("/models/instances/sync")).mock(
                 side_effect=list_instances_query_callback
             )
 
@@ -588,3 +601,119 @@ class TestSoftDeletePurgeHeadroom:
 
     def test_validate_ok_when_headroom_sufficient(self) -> None:
         validate_soft_delete_capacity(100, 10_000_000, 2000, action="test purge")
+
+
+class TestSyncCheckpoint:
+    def test_cursor_moves_past_pages_deleted_in_order(self, tmp_path: Path) -> None:
+        checkpoint = SyncCheckpoint(tmp_path, "purge-my_space-nodes", total=300)
+        for cursor in ["cursor1", "cursor2", "cursor3"]:
+            checkpoint.register(cursor)
+
+        checkpoint.mark_deleted("cursor2", 100, succeeded=True)
+        assert ProgressYAML.try_load(tmp_path, "purge-my_space-nodes") is None
+
+        checkpoint.mark_deleted("cursor1", 100, succeeded=True)
+        progress = ProgressYAML.try_load(tmp_path, "purge-my_space-nodes")
+        assert progress is not None
+        assert progress.get_first_bookmark() == CursorBookmark(cursor="cursor2", source="sync")
+        assert progress.completed_count == 200
+
+    def test_resumes_after_last_successful_page(self, tmp_path: Path) -> None:
+        checkpoint = SyncCheckpoint(tmp_path, "purge-my_space-edges", total=300)
+        for cursor in ["cursor1", "cursor2", "cursor3"]:
+            checkpoint.register(cursor)
+        checkpoint.mark_deleted("cursor1", 100, succeeded=True)
+        checkpoint.mark_deleted("cursor2", 100, succeeded=False)
+        checkpoint.mark_deleted("cursor3", 100, succeeded=True)
+        checkpoint.finish("completed")
+
+        resumed = SyncCheckpoint(tmp_path, "purge-my_space-edges", total=300)
+
+        assert resumed.init_cursor == "cursor1"
+        assert resumed.completed_count == 100
+
+    def test_completed_purge_starts_from_beginning(self, tmp_path: Path) -> None:
+        checkpoint = SyncCheckpoint(tmp_path, "purge-my_space-nodes", total=100)
+        checkpoint.register("cursor1")
+        checkpoint.mark_deleted("cursor1", 100, succeeded=True)
+        checkpoint.finish("completed")
+
+        assert SyncCheckpoint(tmp_path, "purge-my_space-nodes", total=100).init_cursor is None
+
+
+class TestPurgeSteps:
+    def test_independent_steps_run_concurrently(self) -> None:
+        def create_step(step_cls: type[ToDelete], crud_cls: type, name: str, **kwargs: Any) -> ToDelete:
+            crud = MagicMock(spec=crud_cls)
+            crud.display_name = name
+            return step_cls(crud, 1, "delete_url", **kwargs)
+
+        steps = [
+            create_step(EdgeToDelete, EdgeCRUD, "edges"),
+            create_step(NodesToDelete, NodeCRUD, "nodes", delete_datapoints=False, delete_file_content=False),
+            create_step(DataModelingToDelete, DataModelIO, "data models"),
+        ]
+        events: list[str] = []
+        data_model_started = threading.Event()
+
+        def create_executor(name: str) -> MagicMock:
+            def run(progress: object) -> None:
+                events.append(f"start {name}")
+                if name == "data models":
+                    data_model_started.set()
+                elif name == "edges":
+                    # The data models have no ordering constraint with the edges, so they start in the meantime.
+                    assert data_model_started.wait(timeout=5)
+                events.append(f"end {name}")
+
+            executor = MagicMock()
+            executor.run.side_effect = run
+            executor.result = "completed"
+            return executor
+
+        executor_by_step = {index: create_executor(step.display_name) for index, step in enumerate(steps)}
+
+        finished = PurgeCommand(silent=True)._run_purge_steps(steps, executor_by_step, MagicMock())
+
+        assert finished == {0, 1, 2}
+        assert events.index("start nodes") > events.index("end edges")
+        assert events.index("start data models") < events.index("end edges")
+
+    def test_pressing_q_stops_running_steps(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def create_step(step_cls: type[ToDelete], crud_cls: type, name: str, **kwargs: Any) -> ToDelete:
+            crud = MagicMock(spec=crud_cls)
+            crud.display_name = name
+            return step_cls(crud, 1, "delete_url", **kwargs)
+
+        steps = [
+            create_step(EdgeToDelete, EdgeCRUD, "edges"),
+            create_step(NodesToDelete, NodeCRUD, "nodes", delete_datapoints=False, delete_file_content=False),
+        ]
+        edges_started = threading.Event()
+        edges_stopped = threading.Event()
+
+        def run_edges(progress: object) -> None:
+            edges_started.set()
+            assert edges_stopped.wait(timeout=5)
+
+        def stop_edges() -> None:
+            edges.result = "stopped"
+            edges_stopped.set()
+
+        edges = MagicMock(result="completed")
+        edges.run.side_effect = run_edges
+        edges.stop.side_effect = stop_edges
+        nodes = MagicMock(result="completed")
+
+        def getch(timeout: float) -> str | None:
+            return "q" if edges_started.wait(timeout) else None
+
+        monkeypatch.setattr("cognite_toolkit._cdf_tk.commands._purge.getch", getch)
+        monkeypatch.setattr("sys.stdin", MagicMock(isatty=MagicMock(return_value=True)))
+
+        finished = PurgeCommand(silent=True)._run_purge_steps(steps, {0: edges, 1: nodes}, MagicMock())
+
+        assert finished == {0}
+        edges.stop.assert_called_once()
+        nodes.stop.assert_called_once()
+        nodes.run.assert_not_called()
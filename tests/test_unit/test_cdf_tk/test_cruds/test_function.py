@@ -1,6 +1,10 @@
+from collections import OrderedDict
 from collections.abc import Iterable
+from io import BytesIO
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
+from zipfile import ZipFile
 
 import pytest
 import respx
@@ -25,6 +29,7 @@ from cognite_toolkit._cdf_tk.client.resource_classes.function_schedule import (
 )
 from cognite_toolkit._cdf_tk.client.testing import monkeypatch_toolkit_client
 from cognite_toolkit._cdf_tk.exceptions import ResourceCreationError, ToolkitRequiredValueError
+from cognite_toolkit._cdf_tk.feature_flags import FeatureFlag, Flags
 from cognite_toolkit._cdf_tk.resource_ios import FunctionIO, FunctionScheduleIO, ResourceWorker
 from cognite_toolkit._cdf_tk.utils import calculate_directory_hash, calculate_secure_hash
 from cognite_toolkit._cdf_tk.utils.auth import EnvironmentVariables
@@ -261,6 +266,149 @@ secrets:
         ):
             function_io.create([item])
 
+    def test_create_functions_as_files_are_uploaded(self, tmp_path: Path) -> None:
+        with monkeypatch_toolkit_client() as client:
+            function_io = FunctionIO(client, None, None, file_upload_timeout_seconds=30.0)
+            for no, function_id in enumerate(["first", "second", "third"], 1):
+                filemetadata = tmp_path / f"{function_id}.FileMetadata.yaml"
+                filemetadata.write_text(f"externalId: {function_id}\nname: {function_id}\n")
+                function_io.filemetadata_path_by_external_id[function_id] = filemetadata
+            client.tool.filemetadata.create.return_value = [
+                FileMetadataResponse(id=no, created_time=0, last_updated_time=1, uploaded=False, name=name)
+                for no, name in enumerate(["first", "second", "third"], 1)
+            ]
+
+            def await_file_uploaded(items: list[InternalId], timeout_seconds: float, on_uploaded: Any) -> Any:
+                on_uploaded({InternalId(id=2)})
+                on_uploaded({InternalId(id=1)})
+                return {InternalId(id=3)}, timeout_seconds
+
+            client.tool.filemetadata.await_file_uploaded.side_effect = await_file_uploaded
+            client.tool.functions.create.side_effect = lambda items: [
+                FunctionResponse(
+                    id=1, name=item.name, external_id=item.external_id, file_id=1, created_time=0, status="Ready"
+                )
+                for item in items
+            ]
+            items = [FunctionRequest(name=name, external_id=name, file_id=-1) for name in ["first", "second", "third"]]
+
+            with (
+                patch.object(function_io, "_is_activated", return_value=True),
+                pytest.raises(ResourceCreationError, match="Failed to create function third"),
+            ):
+                function_io.create(items)
+
+            created_batches = [
+                [item.external_id for item in call.args[0]] for call in client.tool.functions.create.call_args_list
+            ]
+            assert created_batches == [["second"], ["first"]]
+
+    def test_package_function_is_deterministic_and_cached(self, tmp_path: Path) -> None:
+        function_dir = tmp_path / "my_function"
+        (function_dir / "common").mkdir(parents=True)
+        (function_dir / "handler.py").write_text("def handle():\n    return 1\n")
+        (function_dir / "common" / "tool.py").write_text("VALUE = 1\n")
+        (function_dir / "common" / "tool.pyc").write_bytes(b"compiled")
+
+        archive = FunctionIO._package_function(function_dir)
+        assert FunctionIO._package_function(function_dir) is archive
+        FunctionIO._archive_by_directory.clear()
+        repackaged = FunctionIO._package_function(function_dir)
+
+        assert repackaged.content == archive.content
+        assert archive.source_hash == calculate_directory_hash(function_dir)
+        with ZipFile(BytesIO(archive.content)) as zip_file:
+            assert zip_file.namelist() == ["common/", "common/tool.py", "common/tool.pyc", "handler.py"]
+            assert {info.date_time for info in zip_file.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        assert FunctionIO._create_hash_values(function_dir).startswith(f"/={archive.code_hash};handler.py=")
+
+        (function_dir / "handler.py").write_text("def handle():\n    return 20\n")
+        changed = FunctionIO._package_function(function_dir)
+        assert changed.content != archive.content
+        assert changed.file_hash_by_path["handler.py"] != archive.file_hash_by_path["handler.py"]
+        assert changed.file_hash_by_path["common/tool.py"] == archive.file_hash_by_path["common/tool.py"]
+
+
+    def test_package_function_keeps_file_modes(self, tmp_path: Path) -> None:
+        function_dir = tmp_path / "my_function"
+        function_dir.mkdir()
+        (function_dir / "handler.py").write_text("def handle():\n    return 1\n")
+        (function_dir / "run.sh").write_text("#!/bin/sh\n")
+        (function_dir / "run.sh").chmod(0o644)
+        before = FunctionIO._package_function(function_dir)
+
+        (function_dir / "run.sh").chmod(0o755)
+        archive = FunctionIO._package_function(function_dir)
+
+        assert archive.content != before.content
+        assert archive.source_hash == before.source_hash
+        with ZipFile(BytesIO(archive.content)) as zip_file:
+            mode_by_name = {info.filename: (info.external_attr >> 16) & 0o777 for info in zip_file.infolist()}
+        assert mode_by_name["run.sh"] == 0o755
+        assert mode_by_name["handler.py"] == (function_dir / "handler.py").stat().st_mode & 0o777
+
+    def test_package_function_cache_is_bounded(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(FunctionIO, "_archive_by_directory", OrderedDict())
+        monkeypatch.setattr(FunctionIO, "_MAX_CACHED_ARCHIVES", 2)
+        function_dirs = []
+        for name in ["first", "second", "third"]:
+            function_dir = tmp_path / name
+            function_dir.mkdir()
+            (function_dir / "handler.py").write_text(f"def handle():\n    return {name!r}\n")
+            function_dirs.append(function_dir)
+            FunctionIO._package_function(function_dir)
+
+        assert list(FunctionIO._archive_by_directory) == [function_dir.resolve() for function_dir in function_dirs[1:]]
+
+    def test_package_function_is_reused_between_runs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        original = FeatureFlag.is_enabled
+        monkeypatch.setattr(
+            FeatureFlag, "is_enabled", lambda flag: flag is Flags.FUNCTION_ARCHIVE_CACHE or original(flag)
+        )
+        monkeypatch.setattr(FunctionIO, "archive_cache_dir", classmethod(lambda cls: tmp_path / "cache"))
+        monkeypatch.setattr(FunctionIO, "_archive_by_directory", OrderedDict())
+        function_dir = tmp_path / "my_function"
+        function_dir.mkdir()
+        (function_dir / "handler.py").write_text("def handle():\n    return 1\n")
+        archive = FunctionIO._package_function(function_dir)
+
+        # A new run starts with an empty in-memory cache.
+        FunctionIO._archive_by_directory.clear()
+        with patch.object(ZipFile, "writestr", side_effect=AssertionError("The function code was zipped again")):
+            reused = FunctionIO._package_function(function_dir)
+
+        assert reused == archive
+        (function_dir / "handler.py").write_text("def handle():\n    return 2\n")
+        FunctionIO._archive_by_directory.clear()
+        assert FunctionIO._package_function(function_dir).code_hash != archive.code_hash
+
+    def test_prepare_dump_retrieves_code_files_in_one_request(self) -> None:
+        functions = [
+            FunctionResponse(id=no, name=name, external_id=name, file_id=no * 10, created_time=0, status="Ready")
+            for no, name in enumerate(["first", "second", "third"], 1)
+        ]
+        with monkeypatch_toolkit_client() as client:
+            client.tool.filemetadata.retrieve.return_value = [
+                FileMetadataResponse(
+                    id=function.file_id,
+                    created_time=0,
+                    last_updated_time=1,
+                    uploaded=True,
+                    name="code.zip",
+                    data_set_id=42,
+                )
+                for function in functions
+            ]
+            client.lookup.data_sets.external_id.return_value = "my_data_set"
+            function_io = FunctionIO(client, None, None)
+
+            function_io.prepare_dump(functions)
+            dumped = [function_io.dump_resource(function) for function in functions]
+
+            client.tool.filemetadata.retrieve.assert_called_once()
+            assert {item.id for item in client.tool.filemetadata.retrieve.call_args.args[0]} == {10, 20, 30}
+            assert {item.get("dataSetExternalId") for item in dumped} == {"my_data_set"}
+
 
 class TestFunctionScheduleLoader:
     def test_credentials_missing_raise(self) -> None:
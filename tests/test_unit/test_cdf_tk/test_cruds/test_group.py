@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
-from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, RawDatabaseId, RawTableId
+from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, NameId, RawDatabaseId, RawTableId
 from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling import SpaceId
 from cognite_toolkit._cdf_tk.client.resource_classes.group import (
     AllScope,
@@ -14,6 +14,8 @@ from cognite_toolkit._cdf_tk.client.resource_classes.group import (
     GroupRequest,
     GroupResponse,
 )
+from cognite_toolkit._cdf_tk.client.resource_classes.securitycategory import SecurityCategoryResponse
+from cognite_toolkit._cdf_tk.client.testing import ToolkitClientMock
 from cognite_toolkit._cdf_tk.exceptions import ToolkitWrongResourceError
 from cognite_toolkit._cdf_tk.resource_ios import (
     DataSetsIO,
@@ -25,6 +27,7 @@ from cognite_toolkit._cdf_tk.resource_ios import (
     RawTableCRUD,
     ResourceIO,
     ResourceWorker,
+    SecurityCategoryIO,
     SpaceCRUD,
 )
 from cognite_toolkit._cdf_tk.utils.auth import EnvironmentVariables
@@ -307,3 +310,62 @@ capabilities:
             "delete": len(resources.to_delete),
             "unchanged": len(resources.unchanged),
         } == {"create": 0, "change": 0, "delete": 0, "unchanged": 1}
+
+    def test_unchanged_group_with_reordered_capabilities(
+        self,
+        env_vars_with_client: EnvironmentVariables,
+        toolkit_client_approval: ApprovalToolkitClient,
+    ) -> None:
+        loader = GroupAllScopedCRUD.create_loader(env_vars_with_client.get_client())
+        local_group = """name: gp_reordered
+sourceId: '123'
+capabilities:
+- eventsAcl:
+    actions:
+    - WRITE
+    - READ
+    scope:
+      all: {}
+- assetsAcl:
+    actions:
+    - READ
+    scope:
+      all: {}
+"""
+        cdf_group = GroupResponse(
+            name="gp_reordered",
+            source_id="123",
+            capabilities=[
+                {"assetsAcl": {"actions": ["READ"], "scope": {"all": {}}}},
+                {"eventsAcl": {"actions": ["READ", "WRITE"], "scope": {"all": {}}}},
+            ],
+            metadata={},
+            id=3760258445038144,
+            is_deleted=False,
+        )
+        toolkit_client_approval.append(GroupResponse, [cdf_group])
+        filepath = MagicMock(spec=Path)
+        filepath.read_text.return_value = local_group
+
+        worker = ResourceWorker(loader, "deploy")
+        resources = worker.prepare_resources([filepath])
+        assert {
+            "create": len(resources.to_create),
+            "change": len(resources.to_update),
+            "delete": len(resources.to_delete),
+            "unchanged": len(resources.unchanged),
+        } == {"create": 0, "change": 0, "delete": 0, "unchanged": 1}
+
+
+class TestSecurityCategoryIO:
+    def test_delete_removes_categories_from_lookup(self) -> None:
+        client = ToolkitClientMock()
+        client.tool.security_categories.list.return_value = [
+            SecurityCategoryResponse(name="my_category", id=123),
+            SecurityCategoryResponse(name="other_category", id=456),
+        ]
+        crud = SecurityCategoryIO.create_loader(client)
+
+        assert crud.delete([NameId(name="my_category")]) == 1
+
+        client.lookup.security_categories.invalidate.assert_called_once_with(external_id=["my_category"], id=[123])
@@ -1,6 +1,6 @@
 import pytest
 
-from cognite_toolkit._cdf_tk.client.identifiers import ExternalId
+from cognite_toolkit._cdf_tk.client.identifiers import ExternalId, InternalId
 from cognite_toolkit._cdf_tk.client.resource_classes.data_modeling import DataModelId
 from cognite_toolkit._cdf_tk.client.resource_classes.location_filter import (
     AssetCentricFilter,
@@ -9,6 +9,7 @@ from cognite_toolkit._cdf_tk.client.resource_classes.location_filter import (
     LocationFilterResponse,
     LocationFilterScene,
 )
+from cognite_toolkit._cdf_tk.client.testing import ToolkitClientMock
 from cognite_toolkit._cdf_tk.exceptions import ToolkitCycleError
 from cognite_toolkit._cdf_tk.resource_ios._resource_ios.location import LocationFilterIO
 from cognite_toolkit._cdf_tk.utils.auth import EnvironmentVariables
@@ -164,3 +165,16 @@ class TestLocationFilterLoader:
             "name": "Springfield Location",
             "dataModelingType": "HYBRID",
         }
+
+    def test_delete_removes_location_filter_from_lookup(self) -> None:
+        client = ToolkitClientMock()
+        client.tool.location_filters.list.return_value = [
+            LocationFilterResponse(external_id="springfield", name="Springfield", created_time=1, last_updated_time=1, id=1)
+        ]
+        crud = LocationFilterIO.create_loader(client)
+
+        assert crud.delete([ExternalId(external_id="springfield")]) == 1
+
+        client.lookup.location_filters.invalidate_identifiers.assert_called_once_with(
+            [ExternalId(external_id="springfield"), InternalId(id=1)]
+        )
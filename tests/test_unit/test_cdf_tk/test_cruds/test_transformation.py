@@ -305,6 +305,53 @@ authentication:
 
             assert [t.external_id for t in created] == [t.external_id for t in transformations]
 
+    def test_update_nonce_reuses_client_per_credentials(self, monkeypatch: MonkeyPatch) -> None:
+        from cognite.client.data_classes import ClientCredentials, OidcCredentials
+        from cognite.client.data_classes.iam import CreatedSession
+
+        from cognite_toolkit._cdf_tk.resource_ios._resource_ios import transformation as transformation_module
+
+        other_project = OidcCredentials(
+            client_id="other-client",
+            client_secret="other-secret",
+            token_uri="https://login.example.com/token",
+            cdf_project_name="other-project",
+            scopes=["https://example.com/.default"],
+        )
+        transformations = [
+            TransformationRequest(
+                external_id=f"transformation_{i}", name=f"Transformation {i}", ignore_null_fields=True, query="SELECT 1"
+            )
+            for i in range(4)
+        ]
+        created_clients: list[MagicMock] = []
+
+        def create_client(config: object) -> MagicMock:
+            other_client = MagicMock()
+            other_client.iam.sessions.create.return_value = CreatedSession(id=2, status="READY", nonce="other")
+            created_clients.append(other_client)
+            return other_client
+
+        monkeypatch.setattr(transformation_module, "ToolkitClient", create_client)
+        monkeypatch.setattr(transformation_module, "deepcopy", lambda config: MagicMock())
+        with monkeypatch_toolkit_client() as client:
+            client.iam.sessions.create.return_value = CreatedSession(id=1, status="READY", nonce="same")
+            crud = TransformationIO(client, None, None)
+            for transformation in transformations:
+                crud._authentication_by_id_operation[(transformation.external_id, "read")] = other_project
+                crud._authentication_by_id_operation[(transformation.external_id, "write")] = ClientCredentials(
+                    "my-client", "my-secret"
+                )
+
+            crud._update_nonce(transformations)
+
+            assert client.iam.sessions.create.call_count == len(transformations)
+        assert len(created_clients) == 1
+        assert created_clients[0].iam.sessions.create.call_count == len(transformations)
+        assert all(t.source_nonce is not None and t.source_nonce.nonce == "other" for t in transformations)
+        assert all(t.source_nonce.cdf_project_name == "other-project" for t in transformations if t.source_nonce)
+        assert all(t.destination_nonce is not None and t.destination_nonce.nonce == "same" for t in transformations)
+
     def test_load_resource_with_auto_create(self) -> None:
         resource = {
             "externalId": "tr_nodes",
@@ -1,10 +1,18 @@
 from pathlib import Path
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
+from cognite.client._proto.data_point_list_response_pb2 import DataPointListItem, DataPointListResponse
+from cognite.client._proto.data_points_pb2 import (
+    NumericDatapoint,
+    NumericDatapoints,
+    StringDatapoint,
+    StringDatapoints,
+)
 
 from cognite_toolkit._cdf_tk.client.testing import monkeypatch_toolkit_client
-from cognite_toolkit._cdf_tk.dataio import DatapointsIO
+from cognite_toolkit._cdf_tk.dataio import DataItem, DatapointsIO, Page
 from cognite_toolkit._cdf_tk.dataio.selectors import DataPointsFileSelector, ExternalIdColumn
 from cognite_toolkit._cdf_tk.utils.fileio import MultiFileReader
 
@@ -44,3 +52,56 @@ class TestDataPointsIO:
             assert len(actual_chunks) == expected_iterations, (
                 f"Expected {expected_iterations} chunk, got {len(actual_chunks)}"
             )
+
+    def test_data_to_columns_matches_data_to_row(self) -> None:
+        response = DataPointListResponse(
+            items=[
+                DataPointListItem(
+                    externalId="numeric_ts",
+                    numericDatapoints=NumericDatapoints(
+                        datapoints=[NumericDatapoint(timestamp=i * 1000, value=i / 3) for i in range(100)]
+                    ),
+                ),
+                DataPointListItem(externalId="empty_ts"),
+                DataPointListItem(
+                    externalId="string_ts",
+                    stringDatapoints=StringDatapoints(
+                        datapoints=[StringDatapoint(timestamp=i * 1000, value=f"value_{i}") for i in range(10)]
+                    ),
+                ),
+            ]
+        )
+        page = Page("Main", [DataItem(tracking_id="datapoints", item=response)])
+        with monkeypatch_toolkit_client() as client:
+            io = DatapointsIO(client)
+
+            rows = io.data_to_row(page).as_raw_items()
+            batches = io.data_to_columns(page).as_raw_items()
+
+        assert len(batches) == 1
+        assert batches[0].to_rows() == rows
+
+    def test_data_to_columns_numeric_values_as_arrays(self) -> None:
+        response = DataPointListResponse(
+            items=[
+                DataPointListItem(
+                    externalId=f"ts_{no}",
+                    numericDatapoints=NumericDatapoints(
+                        datapoints=[NumericDatapoint(timestamp=no * 1000 + i, value=i / 3) for i in range(10)]
+                    ),
+                )
+                for no in range(3)
+            ]
+        )
+        page = Page("Main", [DataItem(tracking_id="datapoints", item=response)])
+        with monkeypatch_toolkit_client() as client:
+            io = DatapointsIO(client)
+
+            (batch,) = io.data_to_columns(page).as_raw_items()
+
+        timestamps, values = batch.columns["timestamp"], batch.columns["value"]
+        assert isinstance(timestamps, np.ndarray) and timestamps.dtype == np.int64
+        assert isinstance(values, np.ndarray) and values.dtype == np.float64
+        assert timestamps.tolist() == [no * 1000 + i for no in range(3) for i in range(10)]
+        assert values.tolist() == [i / 3 for _ in range(3) for i in range(10)]
+        assert batch.columns["externalId"] == [f"ts_{no}" for no in range(3) for _ in range(10)]
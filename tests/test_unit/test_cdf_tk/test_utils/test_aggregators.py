@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from _pytest.mark import ParameterSet
+from cognite.client.data_classes import Transformation, TransformationDestination
 
 from cognite_toolkit._cdf_tk.utils.aggregators import (
     AssetAggregator,
@@ -12,6 +13,7 @@ from cognite_toolkit._cdf_tk.utils.aggregators import (
     MetadataAggregator,
     SequenceAggregator,
     TimeSeriesAggregator,
+    TransformationUsageIndex,
 )
 from cognite_toolkit._cdf_tk.utils.cdf import label_count, metadata_key_counts
 from tests.test_unit.approval_client import ApprovalToolkitClient
@@ -140,3 +142,65 @@ class TestAggregators:
         label_count_mock.assert_called_once_with(
             toolkit_client_approval.mock_client, "assets", hierarchies=hierarchy_ids, data_sets=data_set_ids
         )
+
+
+class TestTransformationUsageIndex:
+    @staticmethod
+    def _transformation(id: int, external_id: str, destination: str, query: str = "SELECT 1") -> Transformation:
+        return Transformation(
+            id=id,
+            external_id=external_id,
+            name=external_id,
+            query=query,
+            destination=TransformationDestination(destination),
+            conflict_mode="upsert",
+            is_public=False,
+            ignore_null_fields=False,
+            created_time=0,
+            last_updated_time=0,
+            owner="pytest",
+            owner_is_current_user=True,
+        )
+
+    def test_transformations_are_listed_once_for_all_aggregators(self) -> None:
+        client = MagicMock()
+        transformations = [
+            self._transformation(
+                1, "asset_tr", "assets", "SELECT * FROM `db`.`assets` WHERE dataset_id('my_data_set') = dataSetId"
+            ),
+            self._transformation(2, "hierarchy_tr", "asset_hierarchy", "SELECT 123 as dataSetId FROM `db`.`hierarchy`"),
+            self._transformation(
+                3, "event_tr", "events", 'SELECT dataset_id("my_data_set") as dataSetId FROM `db`.`assets`'
+            ),
+        ]
+        client.transformations.return_value = [transformations]
+        client.lookup.data_sets.id.return_value = [123]
+
+        asset_aggregator = AssetAggregator(client)
+        event_aggregator = EventAggregator(client)
+
+        assert asset_aggregator.transformation_count() == 2
+        assert event_aggregator.transformation_count() == 1
+        assert [tr.external_id for tr in asset_aggregator.used_transformations(["my_data_set"])] == [
+            "asset_tr",
+            "hierarchy_tr",
+        ]
+        assert [tr.external_id for tr in event_aggregator.used_transformations(["my_data_set"])] == ["event_tr"]
+        client.transformations.assert_called_once()
+
+    def test_transformations_are_listed_again_when_expired(self) -> None:
+        client = MagicMock()
+        first = self._transformation(1, "first", "events")
+        second = self._transformation(2, "second", "events")
+        client.transformations.side_effect = [[[first]], [[first, second]]]
+        index = TransformationUsageIndex.get(client)
+
+        with patch("cognite_toolkit._cdf_tk.utils.aggregators.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            assert [tr.external_id for tr in index.transformations(["events"])] == ["first"]
+            mock_time.monotonic.return_value = 1000.0 + index.ttl_seconds - 1
+            assert [tr.external_id for tr in index.transformations(["events"])] == ["first"]
+            mock_time.monotonic.return_value = 1000.0 + index.ttl_seconds
+            assert [tr.external_id for tr in index.transformations(["events"])] == ["first", "second"]
+
+        assert client.transformations.call_count == 2
@@ -0,0 +1,68 @@
+import json
+import math
+from datetime import date, datetime, timezone
+
+import pytest
+
+from cognite_toolkit._cdf_tk.utils import fast_json
+
+
+class TestFastJson:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            pytest.param({"b": 1, "a": [1.5, "text", None, True]}, id="Key order and primitives"),
+            pytest.param({"nested": {"list": [{"x": 1}], "empty": {}}}, id="Nested"),
+            pytest.param({"unicode": "æøå 🚀"}, id="Unicode"),
+            pytest.param({"big": 2**70 + 1}, id="Integer larger than 64 bits"),
+            pytest.param({"negative": -(2**63) - 1}, id="Negative integer larger than 64 bits"),
+        ],
+    )
+    def test_dumps_loads_matches_stdlib(self, obj: dict) -> None:
+        dumped = fast_json.dumps(obj)
+
+        assert json.loads(dumped) == obj
+        assert fast_json.loads(dumped) == obj
+        assert list(fast_json.loads(dumped).keys()) == list(obj.keys())
+
+    def test_dumps_dates_in_iso_format(self) -> None:
+        obj = {
+            "date": date(2024, 1, 31),
+            "naive": datetime(2024, 1, 31, 12, 30, 15),
+            "utc": datetime(2024, 1, 31, 12, 30, 15, 123000, tzinfo=timezone.utc),
+        }
+
+        assert fast_json.loads(fast_json.dumps(obj)) == {key: value.isoformat() for key, value in obj.items()}
+
+    def test_loads_nan_falls_back_to_stdlib(self) -> None:
+        loaded = fast_json.loads('{"value": NaN}')
+
+        assert loaded["value"] != loaded["value"]
+
+    def test_loads_integer_larger_than_64_bits_is_exact(self) -> None:
+        loaded = fast_json.loads(f'{{"value": {2**70 + 1}}}')
+
+        assert loaded["value"] == 2**70 + 1
+        assert isinstance(loaded["value"], int)
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_dumps_non_finite_float_matches_stdlib(self, value: float) -> None:
+        obj = {"values": [1.0, value, None]}
+
+        dumped = fast_json.dumps(obj)
+
+        assert dumped == json.dumps(obj, separators=(",", ":"))
+        _, loaded, none = fast_json.loads(dumped)["values"]
+        assert (math.isnan(loaded) and math.isnan(value)) or loaded == value
+        assert none is None
+
+    def test_dumps_same_as_stdlib(self) -> None:
+        obj = {"text": "æøå", "values": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+        assert fast_json.dumps(obj) == fast_json._stdlib_dumps(obj)
+
+    def test_stdlib_fallback(self) -> None:
+        obj = {"timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc), "values": [1, 2]}
+
+        assert fast_json._stdlib_dumps(obj) == '{"timestamp":"2024-01-01T00:00:00+00:00","values":[1,2]}'
+        assert fast_json._stdlib_loads(fast_json._stdlib_dumps(obj)) == fast_json.loads(fast_json.dumps(obj))
@@ -3,13 +3,19 @@ from pathlib import Path
 from zipfile import ZipFile
 
 import pytest
+import yaml
 
 from cognite_toolkit._cdf_tk.utils.file import (
+    FileContent,
     create_logfile_stem,
     create_temporary_zip,
     read_yaml_content,
+    safe_read,
     sanitize_filename,
+    yaml_safe_dump,
 )
+from cognite_toolkit._cdf_tk.utils.hashing import calculate_hash
+from tests.data import COMPLETE_ORG
 
 
 class TestCreateTemporaryZip:
@@ -109,3 +115,55 @@ normal_value: regular-string"""
         assert result["secret1"] == "!keyvault secret-name-1"
         assert result["secret2"] == "!keyvault secret-name-2"
         assert result["normal_value"] == "regular-string"
+
+
+class TestYAMLSafeDump:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({"name": "my_name", "list": [1, 2.5, None, True], "nested": {"a": "b"}}, id="Simple"),
+            pytest.param({"query": "select\n  *\nfrom\n  `db`.`table`\n"}, id="Multiline string"),
+            pytest.param({"query": "select \n  externalId as externalId,\n" * 10}, id="Double-quoted string"),
+            pytest.param({"description": "Tab\tseparated " * 10}, id="Special characters"),
+            pytest.param({"emoji": "Rocket 🚀", "unicode": "æøå ÆØÅ " * 20}, id="Unicode"),
+            pytest.param({"": "empty key", "k" * 130: "long key", "æ" * 40: "long unicode key"}, id="Complex keys"),
+            pytest.param({"long": "word " * 100, "quoted": "'yes' " * 50, "reserved": "yes"}, id="Long strings"),
+            pytest.param({"a": "\x85", "b": "x\x85y", "c": "line\x85next line\n"}, id="Next line character"),
+            pytest.param({"a": "\u2028", "b": "x\u2029y", "c": "word \u2028 " * 30}, id="Unicode line separators"),
+            pytest.param({"a": "\r\n", "b": "bell\x07", "c": "\x00", "d": "zero\u200bwidth"}, id="Unprintable"),
+            pytest.param({"\x85": 1, "key\u2028": 2, "tab\tkey": 3}, id="Unprintable keys"),
+            pytest.param("scalar", id="Scalar document"),
+        ],
+    )
+    def test_same_output_as_pure_python_emitter(self, data: object) -> None:
+        for indent in [None, 4]:
+            for sort_keys in [False, True]:
+                expected = yaml.safe_dump(data, sort_keys=sort_keys, allow_unicode=True, indent=indent)
+                assert yaml_safe_dump(data, sort_keys=sort_keys, indent=indent) == expected
+
+    def test_same_output_as_pure_python_emitter_for_module_files(self) -> None:
+        for filepath in COMPLETE_ORG.rglob("*.yaml"):
+            data = yaml.safe_load(filepath.read_text(encoding="utf-8"))
+            expected = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+            assert yaml_safe_dump(data) == expected, f"Different output for {filepath}"
+
+
+class TestFileContent:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param(b"space: my_space\nname: My space\n", id="Unix line endings"),
+            pytest.param(b"space: my_space\r\nname: My space\r\n", id="Windows line endings"),
+            pytest.param("name: Blåbærsyltetøy\n".encode(), id="Unicode"),
+            pytest.param(b"", id="Empty"),
+        ],
+    )
+    def test_same_hash_and_text_as_reading_the_file(self, data: bytes, tmp_path: Path) -> None:
+        filepath = tmp_path / "my.Space.yaml"
+        filepath.write_bytes(data)
+
+        content = FileContent.read(filepath)
+
+        assert content.hash() == calculate_hash(filepath)
+        assert content.hash(shorten=True) == calculate_hash(filepath, shorten=True)
+        assert content.text("utf-8") == safe_read(filepath, encoding="utf-8")
@@ -10,6 +10,7 @@ from itertools import product
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 
 from cognite_toolkit._cdf_tk.exceptions import ToolkitError, ToolkitValueError
@@ -19,19 +20,24 @@ from cognite_toolkit._cdf_tk.utils.fileio import (
     COMPRESSION_BY_SUFFIX,
     FILE_READ_CLS_BY_FORMAT,
     FILE_WRITE_CLS_BY_FORMAT,
+    TABLE_WRITE_CLS_BY_FORMAT,
     Chunk,
+    ColumnBatch,
     Compression,
     CSVReader,
     CSVWriter,
     FailedParsing,
     FileReader,
     FileWriter,
+    GzipCompression,
+    LZ4Compression,
     MultiFileReader,
     SchemaColumn,
     Uncompressed,
+    ZstdCompression,
 )
 from cognite_toolkit._cdf_tk.utils.fileio._readers import YAMLBaseReader
-from cognite_toolkit._cdf_tk.utils.fileio._writers import NDJsonWriter, YAMLBaseWriter
+from cognite_toolkit._cdf_tk.utils.fileio._writers import NDJsonWriter, ParquetWriter, YAMLBaseWriter
 from cognite_toolkit._cdf_tk.utils.useful_types import JsonVal
 
 
@@ -133,6 +139,44 @@ class TestCompression:
 
         assert content == "Test content"
 
+    @pytest.mark.parametrize(
+        "compression_cls, level", [(GzipCompression, 1), (ZstdCompression, 19), (LZ4Compression, 9)]
+    )
+    def test_read_write_with_compression_level(
+        self, compression_cls: type[Compression], level: int, tmp_path: Path
+    ) -> None:
+        filepath = tmp_path / f"test_file.txt{compression_cls.file_suffix}"
+        content = "\n".join(f"line {no}" for no in range(10_000))
+        with compression_cls(filepath, level=level).open(mode="w") as file:
+            file.write(content)
+
+        with Compression.from_filepath(filepath).open("r") as file:
+            assert file.read() == content
+
+    @pytest.mark.parametrize(
+        "compression_cls, level",
+        [(GzipCompression, 10), (ZstdCompression, 0), (LZ4Compression, 17), (Uncompressed, 1)],
+    )
+    def test_invalid_compression_level(self, compression_cls: type[Compression], level: int, tmp_path: Path) -> None:
+        with pytest.raises(ToolkitValueError):
+            NDJsonWriter(tmp_path, kind="Test", compression=compression_cls, compression_level=level)
+
+    @pytest.mark.parametrize("compression_name", ["zstd", "lz4"])
+    def test_multi_file_reader_reads_compressed_parts(self, compression_name: str, tmp_path: Path) -> None:
+        compression_cls = Compression.from_name(compression_name)
+        chunks = [{"id": no, "name": f"item_{no}"} for no in range(10)]
+        writer = NDJsonWriter(tmp_path, kind="Test", compression=compression_cls)
+        writer.max_file_size_bytes = 1  # Force one part per write
+        with writer:
+            writer.write_chunks(chunks[:5], filestem="items")
+            writer.write_chunks(chunks[5:], filestem="items")
+
+        files = sorted(tmp_path.glob(f"items-part-*.Test.ndjson{compression_cls.file_suffix}"))
+        assert len(files) == 2
+        reader = MultiFileReader(files)
+        assert list(reader.read_chunks()) == chunks
+        assert reader.count() == len(chunks)
+
     def test_all_compression_classes_registered(self) -> None:
         expected_compressions = get_concrete_subclasses(Compression)
 
@@ -598,6 +642,149 @@ class TestFileIO:
         ]
         assert read_chunks == chunks[mid:]
 
+    @pytest.mark.parametrize("format", list(TABLE_WRITE_CLS_BY_FORMAT.keys()))
+    def test_write_columns_matches_write_chunks(self, format: str, tmp_path: Path) -> None:
+        columns = [
+            SchemaColumn(name="externalId", type="string"),
+            SchemaColumn(name="timestamp", type="epoch"),
+            SchemaColumn(name="value", type="float"),
+        ]
+        batch = ColumnBatch(
+            columns={
+                "externalId": ["ts_1", "ts_1", "ts_2"],
+                "timestamp": np.array([0, 1_000, 2_000], dtype=np.int64),
+                "value": np.array([1.5, -2.0, 3.25], dtype=np.float64),
+            }
+        )
+        with FileWriter.create_from_format(format, tmp_path / "rows", "Test", columns=columns) as writer:
+            writer.write_chunks(batch.to_rows())
+        with FileWriter.create_from_format(format, tmp_path / "columns", "Test", columns=columns) as writer:
+            writer.write_columns(batch)
+
+        row_file = next((tmp_path / "rows").rglob(f"*{format}"))
+        column_file = next((tmp_path / "columns").rglob(f"*{format}"))
+        reader_cls = FileReader.from_filepath(row_file)
+        expected = list(reader_cls(row_file).read_chunks())
+        assert list(reader_cls(column_file).read_chunks()) == expected
+        assert expected == batch.to_rows()
+
+
+class TestParquetWriter:
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            pytest.param([0, 1_000, None], id="Epoch milliseconds"),
+            pytest.param(np.array([0, 1_000, None], dtype=object), id="Object array"),
+            pytest.param(
+                [
+                    datetime(1970, 1, 1, tzinfo=timezone.utc),
+                    "1970-01-01T00:00:01.000+00:00",
+                    None,
+                ],
+                id="Mixed datetime and string",
+            ),
+        ],
+    )
+    def test_write_special_columns(self, timestamps: list[Any], tmp_path: Path) -> None:
+        import pyarrow.parquet as pq
+
+        columns = [
+            SchemaColumn(name="timestamp", type="timestamp"),
+            SchemaColumn(name="date", type="date"),
+            SchemaColumn(name="data", type="json"),
+            SchemaColumn(name="timestamps", type="timestamp", is_array=True),
+        ]
+        chunks: list[Chunk] = [
+            {"timestamp": timestamps[0], "date": 0, "data": {"a": [1, 2]}, "timestamps": [0, 1_000]},
+            {"timestamp": timestamps[1], "date": date(2024, 1, 2), "data": "text", "timestamps": []},
+            {"timestamp": timestamps[2], "date": None, "data": None, "timestamps": None},
+        ]
+        with ParquetWriter(tmp_path, "Test", Uncompressed, columns) as writer:
+            writer.write_chunks(chunks)
+
+        rows = pq.read_table(next(tmp_path.rglob("*.parquet"))).to_pylist()
+        for row in rows:
+            row["data"] = row["data"] if row["data"] is None else json.loads(row["data"])
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        one_second = datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+        assert rows == [
+            {"timestamp": epoch, "date": date(1970, 1, 1), "data": {"a": [1, 2]}, "timestamps": [epoch, one_second]},
+            {"timestamp": one_second, "date": date(2024, 1, 2), "data": "text", "timestamps": []},
+            {"timestamp": None, "date": None, "data": None, "timestamps": None},
+        ]
+
+    @pytest.mark.parametrize(
+        "batch_sizes, row_group_size, expected_row_groups",
+        [
+            pytest.param([25], None, [25], id="One row group per batch"),
+            pytest.param([25], 10, [10, 10, 5], id="Batch split into row groups"),
+            pytest.param([4, 4, 4, 4, 4], 10, [10, 10], id="Batches combined into row groups"),
+        ],
+    )
+    def test_row_group_size(
+        self, batch_sizes: list[int], row_group_size: int | None, expected_row_groups: list[int], tmp_path: Path
+    ) -> None:
+        import pyarrow.parquet as pq
+
+        columns = [SchemaColumn(name="id", type="integer"), SchemaColumn(name="timestamp", type="timestamp")]
+        writer = FileWriter.create_from_format(
+            ".parquet", tmp_path, "Test", Uncompressed, columns=columns, row_group_size=row_group_size
+        )
+        with writer:
+            start = 0
+            for batch_size in batch_sizes:
+                ids = np.arange(start, start + batch_size)
+                writer.write_columns(ColumnBatch(columns={"id": ids, "timestamp": ids * 1_000}))
+                start += batch_size
+
+        filepath = next(tmp_path.rglob("*.parquet"))
+        metadata = pq.read_metadata(filepath)
+        assert [metadata.row_group(no).num_rows for no in range(metadata.num_row_groups)] == expected_row_groups
+        assert pq.read_table(filepath).column("id").to_pylist() == list(range(sum(batch_sizes)))
+
+    def test_invalid_row_group_size(self, tmp_path: Path) -> None:
+        with pytest.raises(ToolkitValueError):
+            ParquetWriter(tmp_path, "Test", Uncompressed, [SchemaColumn(name="id", type="integer")], row_group_size=0)
+
+    def test_missing_json_value_is_written_as_null(self, tmp_path: Path) -> None:
+        import pyarrow.parquet as pq
+
+        columns = [SchemaColumn(name="data", type="json")]
+        with ParquetWriter(tmp_path, "Test", Uncompressed, columns) as writer:
+            writer.write_chunks([{"data": None}, {"data": {"a": None}}, {}])
+
+        assert pq.read_table(next(tmp_path.rglob("*.parquet"))).column("data").to_pylist() == [
+            None,
+            '{"a":null}',
+            None,
+        ]
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="Changing the local timezone requires time.tzset")
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            pytest.param([0, 86_400_000], id="Epoch milliseconds"),
+            pytest.param([0.0, 86_400_000.0], id="Epoch milliseconds as floats"),
+        ],
+    )
+    def test_epoch_is_read_as_utc(self, timestamps: list[int | float], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import pyarrow.parquet as pq
+
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            columns = [SchemaColumn(name="timestamp", type="timestamp"), SchemaColumn(name="date", type="date")]
+            with ParquetWriter(tmp_path, "Test", Uncompressed, columns) as writer:
+                writer.write_chunks([{"timestamp": value, "date": value} for value in timestamps])
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert pq.read_table(next(tmp_path.rglob("*.parquet"))).to_pylist() == [
+            {"timestamp": datetime(1970, 1, 1, tzinfo=timezone.utc), "date": date(1970, 1, 1)},
+            {"timestamp": datetime(1970, 1, 2, tzinfo=timezone.utc), "date": date(1970, 1, 2)},
+        ]
+
 
 class TestCSVReader:
     CSV_CONTENT = """text,integer,nested,boolean,float
@@ -709,6 +896,56 @@ value3,789,"{""key"": ""value3""}",true,1.41
         assert isinstance(with_schema[0]["subtype"], str)
         assert with_schema[1]["subtype"] is None
 
+    @pytest.mark.parametrize("format", [".ndjson", ".csv"])
+    def test_multi_file_reader_read_ahead_preserves_order(self, format: str, tmp_path: Path) -> None:
+        columns = [SchemaColumn(name="id", type="integer"), SchemaColumn(name="name", type="string")]
+        chunks: list[Chunk] = [{"id": no, "name": f"item_{no}"} for no in range(50)]
+        writer = FileWriter.create_from_format(format, tmp_path, "Test", columns=columns)
+        writer.max_file_size_bytes = 1  # Force one part per write
+        with writer:
+            for start in range(0, len(chunks), 10):
+                writer.write_chunks(chunks[start : start + 10], filestem="items")
+        files = sorted(tmp_path.glob(f"items-part-*.Test{format}"))
+        assert len(files) == 5
+
+        sequential = MultiFileReader(files, schema=columns)
+        concurrent = MultiFileReader(files, schema=columns, read_ahead=2)
+        # Batches smaller than the files, such that each file is handed over in several batches.
+        concurrent.READ_AHEAD_BATCH_SIZE = 3
+        expected = list(sequential.read_chunks_with_line_numbers())
+        actual: list[tuple[int, dict[str, JsonVal]]] = []
+        current_files: list[Path] = []
+        for line_no, chunk in concurrent.read_chunks_with_line_numbers():
+            actual.append((line_no, chunk))
+            current_files.append(concurrent.current_file)
+
+        assert actual == expected
+        assert [chunk for _, chunk in actual] == chunks
+        assert current_files == [file for file in files for _ in range(10)]
+
+    def test_multi_file_reader_read_ahead_stops_when_consumer_stops(self, tmp_path: Path) -> None:
+        files = []
+        for part in range(3):
+            filepath = tmp_path / f"items-part-{part:04d}.Test.ndjson"
+            filepath.write_text("\n".join(f'{{"id": {no}}}' for no in range(100)) + "\n")
+            files.append(filepath)
+        reader = MultiFileReader(files, read_ahead=1)
+        reader.READ_AHEAD_BATCH_SIZE = 10
+
+        chunks = reader.read_chunks()
+        assert next(chunks) == {"id": 0}
+        chunks.close()
+
+        assert not [thread for thread in threading.enumerate() if thread.name == "file-read-ahead"]
+
+    def test_multi_file_reader_read_ahead_raises_read_error(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "items-part-0000.Test.ndjson"
+        filepath.write_text('{"id": 1}\nnot json\n')
+        reader = MultiFileReader([filepath], read_ahead=1)
+
+        with pytest.raises(ValueError):
+            list(reader.read_chunks())
+
     def test_read_unprocessed_csv(self, tmp_path: Path) -> None:
         csv_content = "id,space,externalId,number\n1,space1,id1,1.30\n2,space2,id2,42.0\n"
         csv_file = tmp_path / "test.csv"
@@ -374,6 +374,23 @@ class TestInteractiveSelect:
             result = selector.select_hierarchies()
         assert result == ["root2"]
 
+    def test_counts_are_reused_between_selectors(self, monkeypatch) -> None:
+        answers = [lambda choices: [choices[0].value], lambda choices: [choices[0].value]]
+        with (
+            monkeypatch_toolkit_client() as client,
+            MockQuestionary(AssetInteractiveSelect.__module__, monkeypatch, answers),
+        ):
+            client.assets.list.return_value = [
+                Asset(id=no, created_time=0, last_updated_time=0, root_id=no, name=f"root{no}", external_id=f"root{no}")
+                for no in range(1, 21)
+            ]
+            client.assets.aggregate_count.return_value = 10
+            first = AssetInteractiveSelect(client, "test").select_hierarchies()
+            second = AssetInteractiveSelect(client, "test").select_hierarchies()
+
+        assert first == second
+        assert client.assets.aggregate_count.call_count == 20
+
 
 class TestRawTableSelect:
     def test_interactive_select_raw_table(self, monkeypatch) -> None:
@@ -4,7 +4,10 @@ from typing import Any, Literal, NoReturn
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.progress import Progress
 
+from cognite_toolkit._cdf_tk.dataio import DataItem, Page
+from cognite_toolkit._cdf_tk.utils.fileio import ColumnBatch
 from cognite_toolkit._cdf_tk.utils.producer_worker import ProducerWorkerExecutor
 
 
@@ -37,6 +40,53 @@ def test_run_success(setup_executor: tuple[ProducerWorkerExecutor, MagicMock, Ma
     assert write_to_file.call_count == iteration_count
 
 
+def test_run_with_multiple_process_workers() -> None:
+    download_iterable = [[no, no + 1] for no in range(0, 40, 2)]
+    written: list[list[int]] = []
+
+    def slow_double(batch: list[int]) -> list[int]:
+        time.sleep(0.01)
+        return [i * 2 for i in batch]
+
+    executor = ProducerWorkerExecutor(
+        download_iterable=download_iterable,
+        process=slow_double,
+        write=written.append,
+        total_item_count=40,
+        max_queue_size=2,
+        process_workers=4,
+        show_throughput=True,
+    )
+    executor.run()
+
+    assert executor.result == "completed"
+    assert sorted(item for batch in written for item in batch) == [i * 2 for i in range(40)]
+
+
+def test_progress_counts_rows_of_column_batches() -> None:
+    responses = [Page(worker_id="main", items=[DataItem(tracking_id=f"response-{no}", item=no)]) for no in range(3)]
+
+    def to_columns(page: Page[int]) -> Page[ColumnBatch]:
+        batches = [
+            DataItem(tracking_id=item.tracking_id, item=ColumnBatch(columns={"value": list(range(10))}))
+            for item in page.items
+        ]
+        return page.create_from(batches)
+
+    executor = ProducerWorkerExecutor[Page[int], Page[ColumnBatch]](
+        download_iterable=responses,
+        process=to_columns,
+        write=lambda page: None,
+        total_item_count=30,
+        max_queue_size=2,
+    )
+    with Progress(disable=True) as progress:
+        executor.run(progress=progress)
+
+    assert executor.result == "completed"
+    assert [task.completed for task in progress.tasks] == [3, 30, 30]
+
+
 def test_download_worker_handles_full_queue(monkeypatch: Any) -> None:
     max_queue_size = 1
 
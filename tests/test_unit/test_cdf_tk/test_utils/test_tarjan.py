@@ -1,8 +1,53 @@
+import random
 from collections.abc import Iterable
 
 import pytest
 
-from cognite_toolkit._cdf_tk.utils.tarjan import tarjan
+from cognite_toolkit._cdf_tk.utils.tarjan import pack_into_batches, tarjan
+
+
+def recursive_tarjan(dependencies_by_id: dict[int, set[int]]) -> list[set[int]]:
+    """The original recursive implementation, used as a reference."""
+    stack: list[int] = []
+    stack_set: set[int] = set()
+    index: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    result: list[set[int]] = []
+
+    def visit(v: int) -> None:
+        index[v] = len(index)
+        lowlink[v] = index[v]
+        stack.append(v)
+        stack_set.add(v)
+        for w in dependencies_by_id.get(v, []):
+            if w not in index:
+                visit(w)
+                lowlink[v] = min(lowlink[w], lowlink[v])
+            elif w in stack_set:
+                lowlink[v] = min(lowlink[v], index[w])
+        if lowlink[v] == index[v]:
+            scc = set()
+            dependency: int | None = None
+            while v != dependency:
+                dependency = stack.pop()
+                scc.add(dependency)
+                stack_set.remove(dependency)
+            result.append(scc)
+
+    for node in dependencies_by_id.keys():
+        if node not in index:
+            visit(node)
+    return result
+
+
+def random_graph(rng: random.Random) -> dict[int, set[int]]:
+    node_count = rng.randint(1, 60)
+    edge_probability = rng.choice([0.01, 0.05, 0.1, 0.3])
+    # Some dependencies point to nodes that are not keys in the graph.
+    return {
+        node: {other for other in range(node_count + 5) if rng.random() < edge_probability}
+        for node in rng.sample(range(node_count), node_count)
+    }
 
 
 def tarjan_test_cases() -> Iterable:
@@ -38,3 +83,38 @@ class TestTarjan:
     def test_tarjan(self, graph: dict[str, set[str]], expected: list[set[str]]):
         result = tarjan(graph)
         assert result == expected
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_same_output_as_recursive_implementation(self, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(25):
+            graph = random_graph(rng)
+            expected = recursive_tarjan(graph)
+
+            result = tarjan(graph)
+
+            assert result == expected
+            # The same insertion order gives the same iteration order, which the batches depend on.
+            assert [list(scc) for scc in result] == [list(scc) for scc in expected]
+
+    def test_deep_graph(self) -> None:
+        node_count = 100_000
+        chain = {node: {node + 1} for node in range(node_count - 1)}
+        chain[node_count - 1] = {0}
+
+        result = tarjan(chain)
+
+        assert len(result) == 1
+        assert len(result[0]) == node_count
+
+
+class TestPackIntoBatches:
+    def test_deep_graph(self) -> None:
+        node_count = 100_000
+        chain = {node: {node + 1} if node + 1 < node_count else set() for node in range(node_count)}
+
+        batches, oversized = pack_into_batches(chain, {node: node for node in chain}, batch_limit=1000)
+
+        assert oversized == []
+        assert len(batches) == 100
+        assert [node for batch in batches for node in batch] == list(reversed(range(node_count)))
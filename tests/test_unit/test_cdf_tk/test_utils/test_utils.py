@@ -5,6 +5,7 @@ import tempfile
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 import pytest
 import yaml
@@ -26,6 +27,7 @@ from cognite_toolkit._cdf_tk.utils import (
     stringify_value_by_key_in_yaml,
 )
 from cognite_toolkit._cdf_tk.utils.file import yaml_safe_dump
+from cognite_toolkit._cdf_tk.utils.hashing import calculate_content_hash, calculate_zipfile_hash
 from cognite_toolkit._cdf_tk.utils.modules import module_directory_from_path
 from cognite_toolkit._cdf_tk.validation import validate_modules_variables
 from tests.data import CALC_HASH_DATA, PROJECT_FOR_TEST
@@ -99,6 +101,49 @@ def test_calculate_hash_on_folder() -> None:
     assert hash1 == hash3
 
 
+def test_calculate_zipfile_hash_ignores_zip_metadata(tmp_path: Path) -> None:
+    files = {"handler.py": b"def handle():\n    return 1\n", "sub/data.txt": b"data"}
+    first = tmp_path / "first.zip"
+    with ZipFile(first, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(ZipInfo(name, date_time=(2020, 1, 1, 0, 0, 0)), content)
+    second = tmp_path / "second.zip"
+    with ZipFile(second, "w", compression=ZIP_DEFLATED) as zip_file:
+        for name, content in reversed(files.items()):
+            zip_file.writestr(ZipInfo(name, date_time=(2024, 6, 1, 12, 0, 0)), content.replace(b"\n", b"\r\n"))
+    changed = tmp_path / "changed.zip"
+    with ZipFile(changed, "w") as zip_file:
+        zip_file.writestr("handler.py", b"def handle():\n    return 2\n")
+        zip_file.writestr("sub/data.txt", b"data")
+
+    assert calculate_zipfile_hash(first) == calculate_zipfile_hash(second)
+    assert calculate_zipfile_hash(first) != calculate_zipfile_hash(changed)
+    assert calculate_zipfile_hash(first, shorten=True) == calculate_zipfile_hash(first)[:8]
+
+
+def test_calculate_content_hash_ignores_order_of_unordered_lists() -> None:
+    group = {
+        "name": "my_group",
+        "capabilities": [
+            {"assetsAcl": {"actions": ["READ", "WRITE"], "scope": {"all": {}}}},
+            {"eventsAcl": {"actions": ["READ"], "scope": {"datasetScope": {"ids": [1, 2]}}}},
+        ],
+    }
+    reordered = {
+        "capabilities": [
+            {"eventsAcl": {"scope": {"datasetScope": {"ids": [1, 2]}}, "actions": ["READ"]}},
+            {"assetsAcl": {"actions": ["WRITE", "READ"], "scope": {"all": {}}}},
+        ],
+        "name": "my_group",
+    }
+    unordered_paths = {("capabilities",), ("capabilities", "*", "actions")}
+
+    assert calculate_content_hash(group, unordered_paths) == calculate_content_hash(reordered, unordered_paths)
+    assert calculate_content_hash(group) != calculate_content_hash(reordered)
+    other_scope = {**group, "capabilities": [group["capabilities"][0], {"eventsAcl": {"actions": ["READ"]}}]}
+    assert calculate_content_hash(group, unordered_paths) != calculate_content_hash(other_scope, unordered_paths)
+
+
 def auth_variables_validate_test_cases():
     yield pytest.param(
         {